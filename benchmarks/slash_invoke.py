@@ -0,0 +1,148 @@
+"""
+Measures the overhead of invoking slash commands, i.e. dispatching to subcommands
+and converting options, without making any requests.
+
+The "per-call" path collects the parameters of the callback on every invocation
+(``call_param_func``), as slash commands did before the parameters were precomputed.
+The "precomputed" path uses the ``ParamFunction`` built when the command was created.
+
+Usage: python benchmarks/slash_invoke.py [iterations]
+"""
+
+import asyncio
+import sys
+import time
+
+import disnake
+from disnake.ext import commands
+from disnake.ext.commands.params import call_param_func
+
+
+def user_payload(user_id: int, name: str):
+    return {"id": str(user_id), "username": name, "discriminator": "0001", "avatar": None}
+
+
+class Scale:
+    def __init__(self, factor: int) -> None:
+        self.factor = factor
+
+
+@commands.register_injection
+async def make_scale(inter: disnake.CommandInteraction, factor: int = 2) -> Scale:
+    return Scale(factor)
+
+
+async def double(inter, value: str) -> str:
+    return value * 2
+
+
+bot = commands.InteractionBot(sync_commands=False)
+state = bot._connection
+state.user = disnake.ClientUser(state=state, data=user_payload(1, "bot"))
+
+
+@bot.slash_command()
+async def flat(
+    inter,
+    text: str,
+    count: int = 3,
+    doubled: str = commands.Param(converter=double, default="d"),
+    big: commands.LargeInt = 0,
+    target: disnake.User = None,
+    scale: Scale = None,
+):
+    pass
+
+
+@bot.slash_command()
+async def root(inter):
+    pass
+
+
+@root.sub_command_group()
+async def group(inter):
+    pass
+
+
+@group.sub_command()
+async def leaf(inter, word: str, amount: float = 1.5):
+    pass
+
+
+FLAT_OPTIONS = [
+    {"name": "text", "type": 3, "value": "hi"},
+    {"name": "count", "type": 4, "value": 7},
+    {"name": "doubled", "type": 3, "value": "ab"},
+    {"name": "big", "type": 3, "value": "123"},
+    {"name": "target", "type": 6, "value": "42"},
+    {"name": "factor", "type": 4, "value": 5},
+]
+NESTED_OPTIONS = [
+    {
+        "name": "group",
+        "type": 2,
+        "options": [
+            {
+                "name": "leaf",
+                "type": 1,
+                "options": [{"name": "word", "type": 3, "value": "zz"}],
+            }
+        ],
+    }
+]
+
+
+def make_interaction(name: str, options) -> disnake.ApplicationCommandInteraction:
+    data = {
+        "id": "1",
+        "application_id": "2",
+        "type": 2,
+        "token": "token",
+        "version": 1,
+        "channel_id": "3",
+        "locale": "en-US",
+        "user": user_payload(5, "user"),
+        "data": {
+            "id": "4",
+            "name": name,
+            "type": 1,
+            "options": options,
+            "resolved": {"users": {"42": user_payload(42, "target")}},
+        },
+    }
+    return disnake.ApplicationCommandInteraction(data=data, state=state)
+
+
+async def measure(label: str, iterations: int, name: str, options, invoke) -> None:
+    # interactions are created up front, only the invocation is measured
+    interactions = [make_interaction(name, options) for _ in range(iterations)]
+    start = time.perf_counter()
+    for inter in interactions:
+        await invoke(inter)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36} {elapsed / iterations * 1e6:8.1f} us/invoke")
+
+
+async def main(iterations: int) -> None:
+    flat_cmd = bot.all_slash_commands["flat"]
+    root_cmd = bot.all_slash_commands["root"]
+
+    async def per_call(inter):
+        _, kwargs = inter.data._get_chain_and_kwargs()
+        await call_param_func(flat_cmd.callback, inter, None, **kwargs)
+
+    async def precomputed(inter):
+        _, kwargs = inter.data._get_chain_and_kwargs()
+        await flat_cmd._param_func(inter, None, **kwargs)
+
+    print(f"{iterations} iterations\n")
+    await measure("flat options, per-call params", iterations, "flat", FLAT_OPTIONS, per_call)
+    await measure("flat options, precomputed params", iterations, "flat", FLAT_OPTIONS, precomputed)
+    await measure("flat command, full invoke", iterations, "flat", FLAT_OPTIONS, flat_cmd.invoke)
+    await measure(
+        "nested subcommand, full invoke", iterations, "root", NESTED_OPTIONS, root_cmd.invoke
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -26,7 +26,9 @@ from .app_commands import *
 from .appinfo import *
 from .asset import *
 from .audit_logs import *
+from .cache_usage import *
 from .channel import *
+from .chunking import *
 from .client import *
 from .colour import *
 from .components import *
@@ -40,6 +42,7 @@ from .flags import *
 from .guild import *
 from .guild_scheduled_event import *
 from .integrations import *
+from .interaction_server import *
 from .interactions import *
 from .invite import *
 from .member import *
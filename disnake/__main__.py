@@ -24,6 +24,8 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import argparse
+import importlib
+import os
 import platform
 import sys
 from pathlib import Path
@@ -285,6 +287,107 @@ def newcog(parser, args):
         print("successfully made cog at", directory)
 
 
+def load_bot(parser, target):
+    from disnake.ext.commands.interaction_bot_base import InteractionBotBase
+
+    module_name, _, attr = target.partition(":")
+    if module_name.endswith(".py") or os.sep in module_name:
+        path = Path(module_name).resolve()
+        sys.path.insert(0, str(path.parent))
+        module_name = path.stem
+    else:
+        sys.path.insert(0, os.getcwd())
+
+    try:
+        module = importlib.import_module(module_name)
+    except Exception as exc:
+        parser.error(f"could not import {module_name!r} ({exc})")
+
+    if attr:
+        bot = getattr(module, attr, None)
+    else:
+        bots = [obj for obj in vars(module).values() if isinstance(obj, InteractionBotBase)]
+        if len(bots) != 1:
+            parser.error(
+                f"could not find a single bot in {module_name!r}, use <module>:<attribute>"
+            )
+        bot = bots[0]
+
+    if not isinstance(bot, InteractionBotBase):
+        parser.error(f"{target!r} is not a bot with application commands")
+    return bot
+
+
+def plan_sync(bot, state):
+    from disnake.ext.commands.interaction_bot_base import _app_commands_diff, _format_diff
+    from disnake.ext.commands.sync_state import hash_commands
+
+    global_cmds, guild_cmds = bot._ordered_unsynced_commands(bot._test_guilds)
+    sections = []
+    requests = 0
+    for scope, cmds in [(None, global_cmds), *guild_cmds.items()]:
+        lines = ["GLOBAL COMMANDS" if scope is None else f"COMMANDS IN {scope}"]
+        lines.append("=" * len(lines[0]))
+
+        snapshot = state.get_commands(scope) if state is not None else None
+        if snapshot is not None and state.get_hash(scope) == hash_commands(cmds):
+            lines.append("| No changes since the last synchronization")
+            sections.append("\n".join(lines))
+            continue
+
+        # the current commands are fetched once, and overwritten if they differ
+        requests += 1
+        if snapshot is None:
+            lines.append("| No snapshot, all commands are compared with an empty list")
+        diff = _app_commands_diff(cmds, snapshot or [])
+        update_required = bool(diff["upsert"]) or bool(diff["edit"]) or bool(diff["delete"])
+        if update_required:
+            requests += 1
+        lines.append(f"| Update is required: {update_required}\n{_format_diff(diff)}")
+        sections.append("\n".join(lines))
+
+    return "\n\n".join(sections), requests
+
+
+async def apply_sync(bot, token):
+    await bot.login(token)
+    try:
+        if bot._connection.application_id is None:
+            bot._connection.application_id = (await bot.application_info()).id
+
+        # the bot itself may not sync its commands, since this is done here instead
+        bot._sync_commands = True
+        await bot._cache_application_commands()
+        await bot._sync_application_commands()
+    finally:
+        await bot.http.close()
+
+
+def sync(parser, args):
+    from disnake.ext.commands.sync_state import CommandSyncState
+
+    bot = load_bot(parser, args.target)
+    cache = args.cache or bot._sync_commands_cache
+
+    if not args.apply:
+        state = CommandSyncState.load(cache, None) if cache else None
+        plan, requests = plan_sync(bot, state)
+        print(plan)
+        print(f"\nestimated number of requests: {requests}")
+        return
+
+    token = os.environ.get(args.token_env)
+    if not token:
+        parser.error(f"the {args.token_env} environment variable must contain the bot token")
+
+    bot._sync_commands_cache = cache
+    bot._sync_commands_debug = True
+    try:
+        bot.loop.run_until_complete(apply_sync(bot, token))
+    except disnake.LoginFailure as exc:
+        parser.error(f"could not log in ({exc})")
+
+
 def add_newbot_args(subparser):
     parser = subparser.add_parser("newbot", help="creates a command bot project quickly")
     parser.set_defaults(func=newbot)
@@ -323,6 +426,38 @@ def add_newcog_args(subparser):
     parser.add_argument("--full", help="add all special methods as well", action="store_true")
 
 
+def add_sync_args(subparser):
+    parser = subparser.add_parser(
+        "sync",
+        help="plans or applies the synchronization of application commands",
+        description=(
+            "Compares the application commands of a bot with the snapshot in its sync cache and "
+            "prints the changes, without connecting to Discord. With --apply, the commands are "
+            "synced using HTTP requests only and the snapshot is updated, so that bot processes "
+            "using the same sync_commands_cache don't need to sync them again on startup."
+        ),
+    )
+    parser.set_defaults(func=sync)
+
+    parser.add_argument(
+        "target",
+        help="the module or file defining the bot, optionally followed by :<attribute>",
+    )
+    parser.add_argument(
+        "--cache",
+        help="the sync cache file (default: the bot's sync_commands_cache)",
+        metavar="<path>",
+    )
+    parser.add_argument("--apply", help="sync the commands using the API", action="store_true")
+    parser.add_argument(
+        "--token-env",
+        help="the environment variable containing the bot token (default: BOT_TOKEN)",
+        default="BOT_TOKEN",
+        metavar="<name>",
+        dest="token_env",
+    )
+
+
 def parse_args():
     parser = argparse.ArgumentParser(prog="disnake", description="Tools for helping with disnake")
     parser.add_argument("-v", "--version", action="store_true", help="shows the library version")
@@ -331,6 +466,7 @@ def parse_args():
     subparser = parser.add_subparsers(dest="subcommand", title="subcommands")
     add_newbot_args(subparser)
     add_newcog_args(subparser)
+    add_sync_args(subparser)
     return parser, parser.parse_args()
 
 
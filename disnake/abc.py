@@ -100,6 +100,8 @@ if TYPE_CHECKING:
 
 MISSING = utils.MISSING
 
+_ADMINISTRATOR_FLAG: int = Permissions.administrator.flag
+
 
 class _Undefined:
     def __repr__(self) -> str:
@@ -205,6 +207,12 @@ class _Overwrites:
         self.deny: int = int(data.get("deny", 0))
         self.type: OverwriteType = data["type"]
 
+    @classmethod
+    def _from_data_shared(cls, data: PermissionOverwritePayload) -> _Overwrites:
+        # overwrites are immutable, identical ones are shared between channels
+        key = (data["id"], data.get("allow", 0), data.get("deny", 0), data["type"])
+        return _overwrites_pool.get(key, lambda: cls(data))
+
     def _asdict(self) -> PermissionOverwritePayload:
         return {
             "id": self.id,
@@ -220,6 +228,8 @@ class _Overwrites:
         return self.type == 1
 
 
+_overwrites_pool: utils._InternPool[_Overwrites] = utils._InternPool(max_size=65536)
+
 GCH = TypeVar("GCH", bound="GuildChannel")
 
 
@@ -407,7 +417,7 @@ class GuildChannel(ABC):
         everyone_id = self.guild.id
 
         for index, overridden in enumerate(data.get("permission_overwrites", [])):
-            overwrite = _Overwrites(overridden)
+            overwrite = _Overwrites._from_data_shared(overridden)
             self._overwrites.append(overwrite)
 
             if overwrite.type == _Overwrites.MEMBER:
@@ -618,11 +628,10 @@ class GuildChannel(ABC):
         if self.guild.owner_id == obj.id:
             return Permissions.all()
 
-        default = self.guild.default_role
-        base = Permissions(default.permissions.value)
-
         # Handle the role case first
         if isinstance(obj, Role):
+            default = self.guild.default_role
+            base = Permissions(default.permissions.value)
             base.value |= obj._permissions
 
             if base.administrator:
@@ -645,20 +654,43 @@ class GuildChannel(ABC):
 
             return base
 
-        roles = obj._roles
-        get_role = self.guild.get_role
-
-        # Apply guild roles that the member has.
-        for role_id in roles:
-            role = get_role(role_id)
-            if role is not None:
-                base.value |= role._permissions
+        base_value = self.guild._get_base_permissions_value(obj)
 
         # Guild-wide Administrator -> True for everything
         # Bypass all channel-specific overrides
-        if base.administrator:
+        if base_value & _ADMINISTRATOR_FLAG:
             return Permissions.all()
 
+        base = Permissions(self._get_member_permissions_value(obj, base_value))
+
+        # if you have a timeout then you can't have any permissions
+        # except read messages and read message history
+        if not ignore_timeout and obj.current_timeout:
+            denied = Permissions(read_messages=True, read_message_history=True)
+            base.value &= denied.value
+
+        return base
+
+    def _get_member_permissions_value(self, member: Member, base_value: int, /) -> int:
+        # The results are cached per guild. Since neither the member's role list nor the
+        # channel's overwrites are ever modified in-place, the cached value is valid as long
+        # as both are still the same objects; role and owner changes clear the whole cache.
+        guild = self.guild
+        key = (self.id, member.id)
+        roles = member._roles
+        overwrites = self._overwrites
+        entry = guild._permission_cache.get(key)
+        if entry is not None and entry[0] is roles and entry[1] is overwrites:
+            return entry[2]
+
+        value = self._compute_member_permissions_value(member, base_value)
+        guild._cache_permissions_value(key, roles, overwrites, value)
+        return value
+
+    def _compute_member_permissions_value(self, obj: Member, base_value: int, /) -> int:
+        base = Permissions(base_value)
+        roles = obj._roles
+
         # Apply @everyone allow/deny first since it's special
         try:
             maybe_everyone = self._overwrites[0]
@@ -700,13 +732,7 @@ class GuildChannel(ABC):
             denied = Permissions.all_channel()
             base.value &= ~denied.value
 
-        # if you have a timeout then you can't have any permissions
-        # except read messages and read message history
-        if not ignore_timeout and obj.current_timeout:
-            denied = Permissions(read_messages=True, read_message_history=True)
-            base.value &= denied.value
-
-        return base
+        return base.value
 
     async def delete(self, *, reason: Optional[str] = None) -> None:
         """|coro|
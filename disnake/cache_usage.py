@@ -0,0 +1,352 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import sys
+import types
+from collections import deque
+from enum import Enum
+from typing import Any, Collection, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+from .abc import GuildChannel
+from .app_commands import ApplicationCommand
+from .channel import DMChannel, GroupChannel
+from .emoji import Emoji
+from .gateway import DiscordWebSocket
+from .guild import Guild
+from .http import HTTPClient
+from .member import Member
+from .message import Message
+from .role import Role
+from .state import ConnectionState
+from .sticker import GuildSticker
+from .threads import Thread
+from .ui.modal import Modal
+from .ui.view import View
+from .user import BaseUser
+from .utils import MISSING
+
+__all__ = (
+    "CacheUsage",
+    "CacheUsageReport",
+)
+
+
+class CacheUsage(NamedTuple):
+    """Represents the number of objects in a cache category and their approximate size.
+
+    .. versionadded:: 2.4
+
+    Attributes
+    ----------
+    count: :class:`int`
+        The number of objects in the category.
+    size: Optional[:class:`int`]
+        The approximate deep size of the objects in bytes.
+        This is ``None`` if the size wasn't computed.
+    """
+
+    count: int
+    size: Optional[int]
+
+
+# objects that are never accounted for, either because they're shared
+# across the whole library (e.g. enum members) or because they're code.
+_IGNORED_TYPES = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.MethodType,
+    types.BuiltinFunctionType,
+    types.CoroutineType,
+    Enum,
+    asyncio.AbstractEventLoop,
+    ConnectionState,
+    HTTPClient,
+    DiscordWebSocket,
+)
+
+# objects that are accounted for in their own cache category, these are only
+# measured when they're the root of a measurement and never followed otherwise.
+_BOUNDARY_TYPES = (
+    Guild,
+    BaseUser,
+    Member,
+    GuildChannel,
+    DMChannel,
+    GroupChannel,
+    Thread,
+    Role,
+    Emoji,
+    GuildSticker,
+    Message,
+    View,
+    Modal,
+    ApplicationCommand,
+)
+
+_CONTAINER_TYPES = (list, tuple, set, frozenset, deque)
+
+_slots_cache: Dict[type, Tuple[str, ...]] = {}
+
+
+def _get_slots(cls: type) -> Tuple[str, ...]:
+    try:
+        return _slots_cache[cls]
+    except KeyError:
+        pass
+
+    slots = []
+    for base in cls.__mro__:
+        value = base.__dict__.get("__slots__", ())
+        if isinstance(value, str):
+            value = (value,)
+        for name in value:
+            if name == "__dict__" or name == "__weakref__":
+                continue
+            # private names are mangled when used as slots
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{base.__name__.lstrip('_')}{name}"
+            slots.append(name)
+
+    _slots_cache[cls] = result = tuple(slots)
+    return result
+
+
+def _deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    # the root object is always measured, even if it's a boundary type
+    size = 0
+    stack = [(obj, True)]
+    while stack:
+        current, is_root = stack.pop()
+        if current is None or current is MISSING or current is True or current is False:
+            continue
+
+        # boundary objects are only marked as seen once they're measured as a root,
+        # otherwise reaching one as a child first would exclude it from its own category
+        if not is_root and isinstance(current, _BOUNDARY_TYPES):
+            continue
+
+        obj_id = id(current)
+        if obj_id in seen:
+            continue
+        seen.add(obj_id)
+
+        if isinstance(current, _IGNORED_TYPES) or callable(current):
+            continue
+
+        size += sys.getsizeof(current)
+
+        if isinstance(current, (str, bytes, int, float)):
+            continue
+
+        if isinstance(current, dict):
+            stack.extend((k, False) for k in current.keys())
+            stack.extend((v, False) for v in current.values())
+            continue
+
+        if isinstance(current, _CONTAINER_TYPES):
+            stack.extend((v, False) for v in current)
+            continue
+
+        for name in _get_slots(type(current)):
+            try:
+                # bypass `__getattr__`, which could e.g. materialize a lazily created guild
+                value = object.__getattribute__(current, name)
+            except AttributeError:
+                continue
+            stack.append((value, False))
+
+        attrs = getattr(current, "__dict__", None)
+        if attrs is not None:
+            size += sys.getsizeof(attrs)
+            stack.extend((v, False) for v in attrs.values())
+
+    return size
+
+
+def _measure(
+    objects: Collection[Any], *, deep: bool, sample: Optional[int], seen: Set[int]
+) -> CacheUsage:
+    count = len(objects)
+    if not deep:
+        return CacheUsage(count, None)
+
+    if sample is None or count <= sample:
+        return CacheUsage(count, sum(_deep_sizeof(obj, seen) for obj in objects))
+
+    if sample <= 0:
+        return CacheUsage(count, 0)
+
+    # extrapolate the size from the first few objects
+    measured = sum(_deep_sizeof(obj, seen) for obj in itertools.islice(objects, sample))
+    return CacheUsage(count, measured * count // sample)
+
+
+def _total(usages: Iterable[CacheUsage]) -> CacheUsage:
+    count = 0
+    size: Optional[int] = 0
+    for usage in usages:
+        count += usage.count
+        if usage.size is None:
+            size = None
+        elif size is not None:
+            size += usage.size
+    return CacheUsage(count, size)
+
+
+class CacheUsageReport:
+    """Represents a snapshot of the client's internal cache usage.
+
+    This is returned by :meth:`Client.get_cache_usage`.
+
+    All sizes are approximate. Each object is only accounted for in the category it belongs to,
+    e.g. the size of a :class:`Message` does not include the size of its author or channel.
+
+    .. versionadded:: 2.4
+
+    Attributes
+    ----------
+    guilds: :class:`CacheUsage`
+        The cached guilds, excluding their members, channels, threads, roles, emojis and stickers.
+    users: :class:`CacheUsage`
+        The cached users.
+    members: :class:`CacheUsage`
+        The cached members across all guilds.
+    members_by_guild: Dict[:class:`int`, :class:`CacheUsage`]
+        The cached members, keyed by guild ID.
+    messages: :class:`CacheUsage`
+        The cached messages. See :attr:`Client.cached_messages`.
+    channels: :class:`CacheUsage`
+        The cached guild and private channels.
+    threads: :class:`CacheUsage`
+        The cached threads.
+    roles: :class:`CacheUsage`
+        The cached roles.
+    emojis: :class:`CacheUsage`
+        The cached emojis.
+    stickers: :class:`CacheUsage`
+        The cached stickers.
+    views: :class:`CacheUsage`
+        The views and modals that are currently listening for interactions.
+    application_commands: :class:`CacheUsage`
+        The cached global and guild application commands.
+    """
+
+    __slots__ = (
+        "guilds",
+        "users",
+        "members",
+        "members_by_guild",
+        "messages",
+        "channels",
+        "threads",
+        "roles",
+        "emojis",
+        "stickers",
+        "views",
+        "application_commands",
+    )
+
+    def __init__(self, state: ConnectionState, *, deep: bool, sample: Optional[int]) -> None:
+        guilds = list(state._guilds.values())
+        # the collections of lazily created guilds are accounted for in their raw form
+        materialized_guilds = [g for g in guilds if g._lazy_data is None]
+
+        def measure(objects: Collection[Any]) -> CacheUsage:
+            return _measure(objects, deep=deep, sample=sample, seen=set())
+
+        self.guilds: CacheUsage = measure(guilds)
+        self.users: CacheUsage = measure(list(state._users.values()))
+        self.members_by_guild: Dict[int, CacheUsage] = {
+            guild.id: measure(list(guild._members.values())) for guild in guilds
+        }
+        self.members: CacheUsage = _total(self.members_by_guild.values())
+        self.messages: CacheUsage = measure(state._messages or ())
+        self.channels: CacheUsage = _total(
+            [
+                measure([c for g in materialized_guilds for c in g._channels.values()]),
+                measure(list(state._private_channels.values())),
+            ]
+        )
+        self.threads: CacheUsage = measure(
+            [t for g in materialized_guilds for t in g._threads.values()]
+        )
+        self.roles: CacheUsage = measure([r for g in guilds for r in g._roles.values()])
+        self.emojis: CacheUsage = measure(list(state._emojis.values()))
+        self.stickers: CacheUsage = measure(list(state._stickers.values()))
+
+        views = {id(view): view for (view, _) in state._view_store._views.values()}
+        for view in state._view_store._synced_message_views.values():
+            views[id(view)] = view
+        for modal in state._modal_store._modals.values():
+            views[id(modal)] = modal
+        self.views: CacheUsage = measure(list(views.values()))
+
+        commands = list(state._global_application_commands.values())
+        for granula in state._guild_application_commands.values():
+            commands.extend(granula.values())
+        self.application_commands: CacheUsage = measure(commands)
+
+    def __repr__(self) -> str:
+        return f"<CacheUsageReport total={self.total!r}>"
+
+    @property
+    def total(self) -> CacheUsage:
+        """:class:`CacheUsage`: The sum of all cache categories."""
+        return _total(
+            [
+                self.guilds,
+                self.users,
+                self.members,
+                self.messages,
+                self.channels,
+                self.threads,
+                self.roles,
+                self.emojis,
+                self.stickers,
+                self.views,
+                self.application_commands,
+            ]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts this report into a dictionary that can be exported as metrics.
+
+        The dictionary maps category names to ``{"count": int, "size": Optional[int]}``,
+        with ``members_by_guild`` mapping guild IDs to the same structure.
+
+        :return type: Dict[:class:`str`, Any]
+        """
+        result: Dict[str, Any] = {}
+        for attr in self.__slots__:
+            value = getattr(self, attr)
+            if attr == "members_by_guild":
+                result[attr] = {k: v._asdict() for k, v in value.items()}
+            else:
+                result[attr] = value._asdict()
+        return result
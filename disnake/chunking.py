@@ -0,0 +1,220 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .guild import Guild
+    from .state import ConnectionState
+
+__all__ = ("ChunkingProgress",)
+
+_log = logging.getLogger(__name__)
+
+
+class ChunkingProgress(NamedTuple):
+    """Represents the progress of the guild chunking done by the library,
+    as returned by :attr:`Client.chunking_progress`.
+
+    .. versionadded:: 2.4
+
+    Attributes
+    ----------
+    pending: :class:`int`
+        The number of guilds waiting to be chunked.
+    in_flight: :class:`int`
+        The number of guilds whose members are currently being received.
+    completed: :class:`int`
+        The number of guilds that have been chunked.
+    timed_out: :class:`int`
+        The number of guilds that timed out while waiting for their members.
+    deferred: :class:`int`
+        The number of guilds whose chunking has been deferred until they're first used.
+    """
+
+    pending: int
+    in_flight: int
+    completed: int
+    timed_out: int
+    deferred: int
+
+
+class _ShardQueue:
+    __slots__ = ("heap", "slots", "task")
+
+    def __init__(self, max_in_flight: int) -> None:
+        # (-priority, insertion order, guild ID)
+        self.heap: List[Tuple[float, int, int]] = []
+        self.slots: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+        self.task: Optional[asyncio.Task[None]] = None
+
+
+class ChunkScheduler:
+    """Schedules guild chunk requests.
+
+    Guilds are chunked in order of their priority, with up to ``max_in_flight``
+    requests being processed per shard at the same time. Sending the requests is
+    paced by the gateway ratelimiter of each shard.
+
+    Guilds can also be deferred, in which case they're only chunked once
+    :meth:`on_guild_activity` is called for them.
+    """
+
+    # per-guild timeout for receiving all chunks once the request was sent
+    TIMEOUT: float = 60.0
+
+    def __init__(self, state: ConnectionState, *, max_in_flight: int = 8) -> None:
+        self._state: ConnectionState = state
+        self.max_in_flight: int = max_in_flight
+        self._queues: Dict[int, _ShardQueue] = {}
+        self._futures: Dict[int, asyncio.Future[None]] = {}
+        self._started: Set[int] = set()
+        self._deferred: Set[int] = set()
+        # strong references to the chunk requests in flight
+        self._tasks: Set[asyncio.Task[None]] = set()
+        self._counter = itertools.count()
+        self.completed: int = 0
+        self.timed_out: int = 0
+
+    @property
+    def progress(self) -> ChunkingProgress:
+        in_flight = len(self._started)
+        return ChunkingProgress(
+            pending=len(self._futures) - in_flight,
+            in_flight=in_flight,
+            completed=self.completed,
+            timed_out=self.timed_out,
+            deferred=len(self._deferred),
+        )
+
+    def schedule(self, guild: Guild, priority: float = 0.0) -> asyncio.Future[None]:
+        """Schedules the guild to be chunked, returning a future that is resolved once
+        the guild was chunked or timed out.
+
+        Scheduling a guild that's already pending updates its priority if it is higher.
+        """
+        guild_id = guild.id
+        self._deferred.discard(guild_id)
+
+        future = self._futures.get(guild_id)
+        if future is None:
+            self._futures[guild_id] = future = self._state.loop.create_future()
+        elif guild_id in self._started:
+            return future
+
+        # stale heap entries with a lower priority are skipped once they're popped
+        queue = self._get_queue(guild.shard_id)
+        heapq.heappush(queue.heap, (-priority, next(self._counter), guild_id))
+        if queue.task is None or queue.task.done():
+            queue.task = asyncio.create_task(self._run(queue))
+        return future
+
+    def defer(self, guild: Guild) -> None:
+        if guild.id not in self._futures:
+            self._deferred.add(guild.id)
+
+    def discard_deferred(self, guild_id: int) -> None:
+        self._deferred.discard(guild_id)
+
+    def on_guild_activity(self, guild_id: int) -> None:
+        # this is called for every event, so keep the common case cheap
+        if guild_id not in self._deferred:
+            return
+
+        guild = self._state._get_guild(guild_id)
+        if guild is None:
+            self._deferred.discard(guild_id)
+            return
+
+        _log.debug("Deferred guild ID %s is being used, scheduling it for chunking.", guild_id)
+        self.schedule(guild)
+
+    def clear(self) -> None:
+        # called when a new session starts, everything gets rescheduled
+        self._deferred.clear()
+        for queue in self._queues.values():
+            queue.heap.clear()
+        for guild_id, future in list(self._futures.items()):
+            if guild_id not in self._started:
+                del self._futures[guild_id]
+                if not future.done():
+                    future.set_result(None)
+
+    def _get_queue(self, shard_id: int) -> _ShardQueue:
+        try:
+            return self._queues[shard_id]
+        except KeyError:
+            self._queues[shard_id] = queue = _ShardQueue(self.max_in_flight)
+            return queue
+
+    async def _run(self, queue: _ShardQueue) -> None:
+        while queue.heap:
+            await queue.slots.acquire()
+
+            guild_id = None
+            while queue.heap:
+                _, _, candidate = heapq.heappop(queue.heap)
+                if candidate in self._futures and candidate not in self._started:
+                    guild_id = candidate
+                    break
+
+            if guild_id is None:
+                queue.slots.release()
+                break
+
+            self._started.add(guild_id)
+            task = asyncio.create_task(self._chunk(queue, guild_id))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _chunk(self, queue: _ShardQueue, guild_id: int) -> None:
+        state = self._state
+        try:
+            guild = state._get_guild(guild_id)
+            if guild is not None and state._guild_needs_chunking(guild):
+                await asyncio.wait_for(state.chunk_guild(guild), timeout=self.TIMEOUT)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            _log.warning(
+                "Timed out waiting for chunks for guild_id %s (timeout=%.2f).",
+                guild_id,
+                self.TIMEOUT,
+            )
+        except Exception:
+            self.timed_out += 1
+            _log.exception("Failed to chunk guild_id %s.", guild_id)
+        else:
+            self.completed += 1
+        finally:
+            queue.slots.release()
+            self._started.discard(guild_id)
+            future = self._futures.pop(guild_id, None)
+            if future is not None and not future.done():
+                future.set_result(None)
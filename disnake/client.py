@@ -62,7 +62,9 @@ from .app_commands import (
 )
 from .appinfo import AppInfo
 from .backoff import ExponentialBackoff
+from .cache_usage import CacheUsageReport
 from .channel import PartialMessageable, _threaded_channel_factory
+from .chunking import ChunkingProgress
 from .emoji import Emoji
 from .enums import ApplicationCommandType, ChannelType, Status, VoiceRegion
 from .errors import *
@@ -90,6 +92,7 @@ if TYPE_CHECKING:
     from .abc import GuildChannel, PrivateChannel, Snowflake, SnowflakeTime, User as ABCUser
     from .app_commands import APIApplicationCommand
     from .channel import DMChannel
+    from .interactions import InteractionAckStats
     from .member import Member
     from .message import Message
     from .role import Role
@@ -188,6 +191,36 @@ class Client:
         is ``True``.
 
         .. versionadded:: 1.5
+    guild_chunk_priority: Optional[Callable[[:class:`.Guild`], Optional[:class:`float`]]]
+        A function that is called for every guild that needs to be chunked at start-up,
+        returning the guild's priority. Guilds with a higher priority are chunked first.
+        If the function returns ``None``, the guild is not chunked before :func:`.on_ready`;
+        instead, it is chunked in the background once a message or interaction is received
+        in it, or when :meth:`Guild.chunk` is called.
+        This can be used to only chunk an allowlist of guilds at start-up, for example.
+        See :attr:`chunking_progress` for the progress of the chunking.
+
+        .. versionadded:: 2.4
+    lazy_guilds: :class:`bool`
+        Whether to defer creating the channels, threads, voice states, stage instances and
+        scheduled events of guilds received from the gateway until they're first accessed,
+        e.g. when a message is received in a guild. This reduces the start-up time and memory
+        usage of bots in many guilds that are mostly idle. Defaults to ``False``.
+
+        .. versionadded:: 2.4
+    member_name_index: :class:`bool`
+        Whether to maintain an index of the usernames and nicknames of cached members in each
+        guild. This makes :meth:`Guild.get_member_named`, :meth:`Guild.get_members_by_prefix`
+        and :meth:`Guild.match_members` (and therefore the member converters and autocompletion)
+        fast for large guilds, at the cost of some memory, roughly one set entry per character
+        of each name. Defaults to ``False``.
+
+        .. versionadded:: 2.4
+    max_concurrent_member_streams: :class:`int`
+        The maximum number of guilds whose members are streamed through
+        :meth:`Guild.stream_members` at the same time. Defaults to ``2``.
+
+        .. versionadded:: 2.4
     status: Optional[:class:`.Status`]
         A status to start your presence with upon logging on to Discord.
     activity: Optional[:class:`.BaseActivity`]
@@ -333,6 +366,15 @@ class Client:
         ws = self.ws
         return float("nan") if not ws else ws.latency
 
+    @property
+    def interaction_ack_stats(self) -> InteractionAckStats:
+        """:class:`.InteractionAckStats`: The acknowledgement latency of the interactions
+        that were handled by application commands and views.
+
+        .. versionadded:: 2.4
+        """
+        return self._connection._interaction_ack_stats.snapshot()
+
     def is_ws_ratelimited(self) -> bool:
         """Whether the websocket is currently rate limited.
 
@@ -347,6 +389,15 @@ class Client:
             return self.ws.is_ratelimited()
         return False
 
+    @property
+    def chunking_progress(self) -> ChunkingProgress:
+        """:class:`.ChunkingProgress`: The progress of the guild chunking done by the library,
+        e.g. at start-up or for deferred guilds.
+
+        .. versionadded:: 2.4
+        """
+        return self._connection._chunk_scheduler.progress
+
     @property
     def user(self) -> ClientUser:
         """Optional[:class:`.ClientUser`]: Represents the connected client. ``None`` if not logged in."""
@@ -926,6 +977,36 @@ class Client:
         """List[:class:`~disnake.User`]: Returns a list of all the users the bot can see."""
         return list(self._connection._users.values())
 
+    def get_cache_usage(
+        self, *, deep: bool = True, sample: Optional[int] = None
+    ) -> CacheUsageReport:
+        """Returns a report of the objects held in the internal cache.
+
+        The report contains the number of cached objects and their approximate
+        size in bytes for each cache category, e.g. users, members (per guild),
+        messages or channels. This can be used to tune ``max_messages``
+        and :class:`MemberCacheFlags`, or exported periodically as metrics.
+
+        .. versionadded:: 2.4
+
+        Parameters
+        -----------
+        deep: :class:`bool`
+            Whether to compute the approximate deep size of the cached objects.
+            If this is ``False``, only object counts are reported, which is
+            considerably cheaper. Defaults to ``True``.
+        sample: Optional[:class:`int`]
+            The maximum number of objects to measure per category. If a category contains
+            more objects, its size is extrapolated from the measured ones.
+            Defaults to ``None``, which measures every object.
+
+        Returns
+        --------
+        :class:`.CacheUsageReport`
+            The cache usage report.
+        """
+        return CacheUsageReport(self._connection, deep=deep, sample=sample)
+
     def get_channel(self, id: int, /) -> Optional[Union[GuildChannel, Thread, PrivateChannel]]:
         """Returns a channel or thread with the given ID.
 
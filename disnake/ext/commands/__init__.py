@@ -8,11 +8,13 @@ An extension module to facilitate creation of bot commands.
 :license: MIT, see LICENSE for more details.
 """
 
+from .autocomplete_cache import *
 from .base_core import *
 from .bot import *
 from .cog import *
 from .context import *
 from .converter import *
+from .cooldown_backends import *
 from .cooldowns import *
 from .core import *
 from .ctx_menus_core import *
@@ -20,4 +22,5 @@ from .errors import *
 from .flags import *
 from .help import *
 from .params import *
+from .prefixes import *
 from .slash_core import *
@@ -0,0 +1,236 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
+
+from .cooldowns import BucketType, InteractionBucket
+
+if TYPE_CHECKING:
+    from disnake.interactions import ApplicationCommandInteraction
+
+__all__ = (
+    "CachedAutocompleter",
+    "cache_autocomplete",
+)
+
+_log = logging.getLogger(__name__)
+
+# autocomplete interactions have to be responded to within this many seconds
+_AUTOCOMPLETE_TIMEOUT = 3.0
+
+
+class CachedAutocompleter:
+    """An autocompleter that caches the choices returned by the wrapped function.
+
+    These are not created manually, instead they are created via the
+    :func:`.cache_autocomplete` decorator.
+
+    .. versionadded:: 2.4
+
+    Attributes
+    ----------
+    func: Callable
+        The wrapped autocompleter.
+    ttl: :class:`float`
+        The number of seconds the choices are cached for.
+    scope: Union[:class:`.BucketType`, :class:`.InteractionBucket`]
+        Determines which interactions share cached choices.
+    max_size: Optional[:class:`int`]
+        The maximum number of cached inputs.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        *,
+        ttl: float,
+        scope: Union[BucketType, InteractionBucket],
+        max_size: Optional[int],
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+
+        self.func: Callable[..., Any] = func
+        self.ttl: float = ttl
+        self.scope: Union[BucketType, InteractionBucket] = scope
+        self.max_size: Optional[int] = max_size
+        # whether the function accepts the filled options, which is only known after the first call
+        self._uses_options: Optional[bool] = None
+        self._cache: OrderedDict[Tuple[Any, ...], Tuple[float, Any]] = OrderedDict()
+        self._pending: Dict[Tuple[Any, ...], asyncio.Task[Any]] = {}
+        functools.update_wrapper(self, func)
+
+    def __repr__(self) -> str:
+        return f"<CachedAutocompleter func={self.func!r} ttl={self.ttl} cached={len(self._cache)}>"
+
+    async def __call__(self, *args: Any, **options: Any) -> Any:
+        # called the same way as a regular autocompleter, with an optional cog first
+        inter: ApplicationCommandInteraction = args[-2]
+        user_input: str = args[-1]
+
+        # there's no point in computing choices that can't be sent anymore
+        age = time.monotonic() - inter._received_at
+        if age > _AUTOCOMPLETE_TIMEOUT:
+            _log.debug(
+                "Dropping autocomplete interaction %s since it was received %.2f seconds ago",
+                inter.id,
+                age,
+            )
+            return None
+
+        key = self._get_key(inter, user_input, options)
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, choices = entry
+            if expires_at > time.monotonic():
+                self._cache.move_to_end(key)
+                return choices
+            del self._cache[key]
+
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run(key, args, options))
+            self._pending[key] = task
+        # don't cancel the call for other waiters if this one is cancelled
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Removes all cached choices. Calls that are in progress are not affected."""
+        self._cache.clear()
+
+    def _get_key(
+        self, inter: ApplicationCommandInteraction, user_input: str, options: Dict[str, Any]
+    ) -> Tuple[Any, ...]:
+        chain, _ = inter.data._get_chain_and_kwargs()
+        if self._uses_options is False:
+            filled = ()
+        else:
+            # objects like members and channels aren't hashable in a stable way
+            filled = tuple(
+                sorted((name, getattr(value, "id", value)) for name, value in options.items())
+            )
+        return (
+            inter.data.id,
+            chain,
+            inter.data.focused_option.name,
+            user_input,
+            self.scope.get_key(inter),
+            filled,
+        )
+
+    async def _run(
+        self, key: Tuple[Any, ...], args: Tuple[Any, ...], options: Dict[str, Any]
+    ) -> Any:
+        task = asyncio.current_task()
+        try:
+            # same fallback as for regular autocompleters
+            try:
+                choices = self.func(*args, **options)
+                if options:
+                    self._uses_options = True
+            except TypeError:
+                choices = self.func(*args)
+                self._uses_options = False
+
+            if inspect.isawaitable(choices):
+                choices = await choices
+
+            if self._pending.get(key) is task:
+                self._store(key, choices)
+            return choices
+        finally:
+            if self._pending.get(key) is task:
+                del self._pending[key]
+
+    def _store(self, key: Tuple[Any, ...], choices: Any) -> None:
+        cache = self._cache
+        cache[key] = (time.monotonic() + self.ttl, choices)
+        cache.move_to_end(key)
+        if self.max_size is not None:
+            while len(cache) > self.max_size:
+                cache.popitem(last=False)
+
+
+def cache_autocomplete(
+    ttl: float = 10.0,
+    *,
+    scope: Union[BucketType, InteractionBucket] = BucketType.default,
+    max_size: Optional[int] = 1000,
+) -> Callable[[Callable[..., Any]], CachedAutocompleter]:
+    """A decorator that caches the choices returned by an autocompleter.
+
+    Choices are cached per command, focused option, user input and values of the other
+    filled options (if the autocompleter accepts them). Concurrent calls with the same
+    inputs wait for a single call of the autocompleter, and exceptions aren't cached.
+
+    Inputs are dropped without calling the autocompleter if the interaction is too old
+    to be responded to, which happens if the bot can't keep up with the typing of users.
+
+    This must be applied below the ``autocomplete`` decorator of the command,
+    or the result can be passed as the ``autocomplete`` of :func:`.Param`.
+
+    .. versionadded:: 2.4
+
+    Example
+    -------
+
+    .. code-block:: python3
+
+        @bot.slash_command()
+        async def item(inter, name: str):
+            ...
+
+        @item.autocomplete("name")
+        @commands.cache_autocomplete(ttl=60, scope=commands.BucketType.guild)
+        async def item_autocomplete(inter, string: str):
+            return await db.search_items(inter.guild_id, string)
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        The number of seconds the choices are cached for. Defaults to ``10``.
+    scope: Union[:class:`.BucketType`, :class:`.InteractionBucket`]
+        Determines which interactions share cached choices. For example, with
+        :attr:`.BucketType.guild` the choices are only reused within the same guild.
+        Defaults to :attr:`.BucketType.default`, which shares them between all interactions.
+    max_size: Optional[:class:`int`]
+        The maximum number of cached inputs. If this is exceeded, the inputs that
+        were used least recently are removed from the cache. Defaults to ``1000``,
+        ``None`` disables the limit.
+    """
+
+    def decorator(func: Callable[..., Any]) -> CachedAutocompleter:
+        return CachedAutocompleter(func, ttl=ttl, scope=scope, max_size=max_size)
+
+    return decorator
@@ -30,9 +30,10 @@ from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional,
 
 from disnake.app_commands import ApplicationCommand, UnresolvedGuildApplicationCommandPermissions
 from disnake.enums import ApplicationCommandType
+from disnake.interactions import AutoDefer
 from disnake.utils import async_all, maybe_coroutine, warn_deprecated
 
-from .cooldowns import BucketType, CooldownMapping, MaxConcurrency
+from .cooldowns import BucketType, CooldownMapping, MaxConcurrency, _get_namespace, _resolve_backend
 from .errors import *
 
 if TYPE_CHECKING:
@@ -44,7 +45,7 @@ if TYPE_CHECKING:
     from .cog import Cog
 
 
-__all__ = ("InvokableApplicationCommand", "guild_permissions")
+__all__ = ("InvokableApplicationCommand", "guild_permissions", "auto_defer")
 
 
 T = TypeVar("T")
@@ -133,6 +134,18 @@ class InvokableApplicationCommand(ABC):
             max_concurrency = kwargs.get("max_concurrency")
         self._max_concurrency: Optional[MaxConcurrency] = max_concurrency
 
+        try:
+            auto_defer = func.__auto_defer__
+        except AttributeError:
+            auto_defer = kwargs.get("auto_defer")
+        self.auto_defer: Optional[AutoDefer] = auto_defer
+
+        namespace = _get_namespace(func)
+        if buckets.namespace is None:
+            buckets.namespace = namespace
+        if max_concurrency is not None and max_concurrency.namespace is None:
+            max_concurrency.namespace = namespace
+
         self.cog: Optional[Cog] = None
         self.guild_ids: Optional[List[int]] = None
         self.auto_sync: bool = True
@@ -202,6 +215,19 @@ class InvokableApplicationCommand(ABC):
                 if retry_after:
                     raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
+    async def _prepare_cooldowns_async(self, inter: ApplicationCommandInteraction) -> None:
+        backend = _resolve_backend(self._buckets.backend, inter) if self._buckets.valid else None
+        if backend is None:
+            self._prepare_cooldowns(inter)
+            return
+
+        current = inter.created_at.replace(tzinfo=datetime.timezone.utc).timestamp()
+        bucket, retry_after = await self._buckets._backend_update_rate_limit(
+            backend, inter, current  # type: ignore
+        )
+        if retry_after:
+            raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
+
     async def prepare(self, inter: ApplicationCommandInteraction) -> None:
         inter.application_command = self
 
@@ -212,7 +238,7 @@ class InvokableApplicationCommand(ABC):
             await self._max_concurrency.acquire(inter)  # type: ignore
 
         try:
-            self._prepare_cooldowns(inter)
+            await self._prepare_cooldowns_async(inter)
             await self.call_before_hooks(inter)  # type: ignore
         except:
             if self._max_concurrency is not None:
@@ -243,12 +269,20 @@ class InvokableApplicationCommand(ABC):
     def reset_cooldown(self, inter: ApplicationCommandInteraction) -> None:
         """Resets the cooldown on this application command.
 
+        If the cooldown is kept in a :class:`.CooldownBackend`, it's reset in the background
+        and failures are logged.
+
         Parameters
         -----------
         inter: :class:`.ApplicationCommandInteraction`
             The interaction with this application command
         """
         if self._buckets.valid:
+            backend = _resolve_backend(self._buckets.backend, inter)
+            if backend is not None:
+                self._buckets._backend_reset(backend, inter)  # type: ignore
+                return
+
             bucket = self._buckets.get_bucket(inter)  # type: ignore
             bucket.reset()
 
@@ -274,6 +308,10 @@ class InvokableApplicationCommand(ABC):
 
         return 0.0
 
+    def _get_auto_defer(self, inter: ApplicationCommandInteraction) -> Optional[AutoDefer]:
+        # the auto defer policy that applies to the given interaction of this command
+        return self.auto_defer
+
     async def invoke(self, inter: ApplicationCommandInteraction, *args, **kwargs) -> None:
         """
         This method isn't really usable in this class, but it's usable in subclasses.
@@ -576,3 +614,56 @@ def guild_permissions(
         return func
 
     return decorator
+
+
+def auto_defer(
+    deadline: float = 2.0, *, ephemeral: bool = False, with_message: bool = False
+) -> Callable[[T], T]:
+    """A decorator that defers the interactions of an application command automatically
+    if they haven't been responded to shortly before the response deadline,
+    e.g. because checks, converters, hooks or the command itself are slow.
+
+    This can also be applied to subcommands and subcommand groups, in which case
+    their policy takes precedence over the policy of the parent command
+    when they are invoked.
+
+    Once an interaction was deferred, it can't be responded to using
+    :attr:`~disnake.Interaction.response` anymore. Use :meth:`~disnake.Interaction.send` or
+    :meth:`~disnake.Interaction.edit_original_message` in the command instead,
+    which work either way.
+
+    See :class:`disnake.AutoDefer` for more information.
+
+    .. versionadded:: 2.4
+
+    Example
+    -------
+
+    .. code-block:: python3
+
+        @bot.slash_command()
+        @commands.auto_defer(ephemeral=True)
+        async def report(inter):
+            data = await build_report()  # may take a while
+            await inter.send(data, ephemeral=True)
+
+    Parameters
+    ----------
+    deadline: :class:`float`
+        The number of seconds after the creation of the interaction to defer at. Defaults to ``2``.
+    ephemeral: :class:`bool`
+        Whether the deferred message will eventually be ephemeral. Defaults to ``False``.
+    with_message: :class:`bool`
+        Whether the response will be a message with thinking state (bot is thinking...).
+        See :meth:`disnake.InteractionResponse.defer` for more information. Defaults to ``False``.
+    """
+    policy = AutoDefer(deadline, ephemeral=ephemeral, with_message=with_message)
+
+    def decorator(func: T) -> T:
+        if isinstance(func, InvokableApplicationCommand):
+            func.auto_defer = policy
+        else:
+            func.__auto_defer__ = policy  # type: ignore
+        return func
+
+    return decorator
@@ -107,6 +107,13 @@ class Bot(BotBase, InteractionBotBase, disnake.Client):
             matches messages starting with ``!?``. This is especially important
             when passing an empty string, it should always be last as no prefix
             after it will be matched.
+
+        For per-guild prefixes, a :class:`.GuildPrefixManager` can be passed as well,
+        which loads and caches the prefixes of each guild and matches messages
+        against all of them at once.
+
+        .. versionchanged:: 2.4
+            Added support for :class:`.GuildPrefixManager`.
     case_insensitive: :class:`bool`
         Whether the commands should be case insensitive. Defaults to ``False``. This
         attribute does not carry over to groups. You must set it to every group if
@@ -135,6 +142,22 @@ class Bot(BotBase, InteractionBotBase, disnake.Client):
         the ``command_prefix`` is set to ``!``. Defaults to ``False``.
 
         .. versionadded:: 1.7
+    message_prefilter: Union[:class:`bool`, :class:`re.Pattern`]
+        A cheap check that :meth:`.process_commands` runs on each message before creating
+        a :class:`.Context`. Messages that don't pass it are ignored without any further
+        processing. Defaults to ``False``, which disables the pre-filter.
+
+        If this is ``True``, the pre-filter is derived from :attr:`command_prefix`. This works
+        for strings, iterables of strings, :func:`.when_mentioned`, :func:`.when_mentioned_or`
+        and :class:`.GuildPrefixManager`. For other callables, or if :meth:`.get_prefix`
+        is overridden, all messages are processed, since their prefixes can't be known
+        in advance. In that case, a compiled regular expression can be passed instead,
+        which a message's content must match at its start to be processed.
+
+        The pre-filter is rebuilt whenever this or :attr:`command_prefix` is changed.
+        See also :attr:`message_filter_stats`.
+
+        .. versionadded:: 2.4
     test_guilds: List[:class:`int`]
         The list of IDs of the guilds where you're going to test your app commands.
         Defaults to ``None``, which means global registration of commands across
@@ -165,12 +188,31 @@ class Bot(BotBase, InteractionBotBase, disnake.Client):
     sync_permissions: :class:`bool`
         Whether to enable automatic synchronization of app command permissions in your code.
         Defaults to ``False``.
+    sync_commands_cache: Optional[:class:`str`]
+        The path of a file to store the state of synced application commands in between runs.
+        If the commands of a scope (global or a guild) haven't changed since they were last synced,
+        they're loaded from this file instead of being fetched and compared again, which
+        speeds up the startup of bots with commands in many guilds. Defaults to ``None``.
+
+        .. note::
+
+            Changes made to the commands outside of this bot, e.g. by another bot process
+            using the same application, aren't detected. Delete the file to force a full sync.
+
+        .. versionadded:: 2.4
     reload: :class:`bool`
         Whether to enable automatic extension reloading on file modification for debugging.
         Whenever you save an extension with reloading enabled the file will be automatically
         reloaded for you so you do not have to reload the extension manually. Defaults to ``False``
 
         .. versionadded:: 2.1
+    cooldown_backend: Optional[:class:`.CooldownBackend`]
+        The backend to keep the state of command cooldowns and maximum concurrencies in,
+        unless a command specifies its own. This allows sharing them between multiple processes,
+        e.g. using a :class:`.CooldownServer`. Defaults to ``None``, which keeps the state
+        in the commands themselves.
+
+        .. versionadded:: 2.4
     """
 
     pass
@@ -238,12 +280,31 @@ class InteractionBot(InteractionBotBase, disnake.Client):
         Defaults to ``False``.
 
         .. versionadded:: 2.1
+    sync_commands_cache: Optional[:class:`str`]
+        The path of a file to store the state of synced application commands in between runs.
+        If the commands of a scope (global or a guild) haven't changed since they were last synced,
+        they're loaded from this file instead of being fetched and compared again, which
+        speeds up the startup of bots with commands in many guilds. Defaults to ``None``.
+
+        .. note::
+
+            Changes made to the commands outside of this bot, e.g. by another bot process
+            using the same application, aren't detected. Delete the file to force a full sync.
+
+        .. versionadded:: 2.4
     reload: :class:`bool`
         Whether to enable automatic extension reloading on file modification for debugging.
         Whenever you save an extension with reloading enabled the file will be automatically
         reloaded for you so you do not have to reload the extension manually. Defaults to ``False``
 
         .. versionadded:: 2.1
+    cooldown_backend: Optional[:class:`.CooldownBackend`]
+        The backend to keep the state of command cooldowns and maximum concurrencies in,
+        unless a command specifies its own. This allows sharing them between multiple processes,
+        e.g. using a :class:`.CooldownServer`. Defaults to ``None``, which keeps the state
+        in the commands themselves.
+
+        .. versionadded:: 2.4
     """
 
     pass
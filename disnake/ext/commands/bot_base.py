@@ -29,9 +29,22 @@ import asyncio
 import collections
 import collections.abc
 import inspect
+import re
 import sys
 import traceback
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import disnake
 
@@ -40,6 +53,7 @@ from .common_bot_base import CommonBotBase
 from .context import Context
 from .core import GroupMixin
 from .help import DefaultHelpCommand, HelpCommand
+from .prefixes import GuildPrefixManager
 from .view import StringView
 
 if TYPE_CHECKING:
@@ -62,6 +76,7 @@ if TYPE_CHECKING:
 __all__ = (
     "when_mentioned",
     "when_mentioned_or",
+    "MessageFilterStats",
     "BotBase",
 )
 
@@ -81,6 +96,10 @@ def when_mentioned(bot: BotBase, msg: Message) -> List[str]:
     return [f"<@{bot.user.id}> ", f"<@!{bot.user.id}> "]  # type: ignore
 
 
+# the prefixes used to build the message pre-filter, see `BotBase._compile_message_prefilter`
+when_mentioned._prefilter_prefixes = ("<@",)  # type: ignore
+
+
 def when_mentioned_or(*prefixes: str) -> Callable[[BotBase, Message], List[str]]:
     """A callable that implements when mentioned or other prefixes provided.
 
@@ -116,6 +135,7 @@ def when_mentioned_or(*prefixes: str) -> Callable[[BotBase, Message], List[str]]
         r = when_mentioned(bot, msg) + r
         return r
 
+    inner._prefilter_prefixes = ("<@", *prefixes)  # type: ignore
     return inner
 
 
@@ -131,6 +151,47 @@ class _DefaultRepr:
 _default: Any = _DefaultRepr()
 
 
+class MessageFilterStats(NamedTuple):
+    """Represents the number of messages handled by :meth:`.Bot.process_commands`,
+    as returned by :attr:`.Bot.message_filter_stats`.
+
+    Messages sent by bots are not counted.
+
+    .. versionadded:: 2.4
+
+    Attributes
+    ----------
+    filtered: :class:`int`
+        The number of messages that were rejected without creating a :class:`.Context`,
+        because they can't start with a prefix.
+    processed: :class:`int`
+        The number of messages that were passed on to :meth:`.Bot.get_context`.
+    """
+
+    filtered: int
+    processed: int
+
+
+def _get_prefilter_prefixes(prefix: Any) -> Optional[Tuple[str, ...]]:
+    # returns the prefixes a message has to start with for the given `command_prefix`,
+    # or `None` if they can't be known in advance
+    if isinstance(prefix, str):
+        return (prefix,)
+    if callable(prefix):
+        return getattr(prefix, "_prefilter_prefixes", None)
+    if prefix is None:
+        return None
+
+    try:
+        prefixes = tuple(prefix)
+    except TypeError:
+        return None
+    # invalid prefixes are reported by `get_prefix`
+    if not prefixes or not all(isinstance(p, str) for p in prefixes):
+        return None
+    return prefixes
+
+
 class BotBase(CommonBotBase, GroupMixin):
     def __init__(
         self,
@@ -140,6 +201,10 @@ class BotBase(CommonBotBase, GroupMixin):
         **options: Any,
     ):
         super().__init__(**options)
+        self._message_prefilter: Union[bool, Pattern[str]] = options.get("message_prefilter", False)
+        self._compiled_prefilter: Optional[Callable[[Message], bool]] = MISSING
+        self._messages_filtered: int = 0
+        self._messages_processed: int = 0
         self.command_prefix = command_prefix
 
         self._checks: List[Check] = []
@@ -157,6 +222,33 @@ class BotBase(CommonBotBase, GroupMixin):
         else:
             self.help_command = help_command
 
+    @property
+    def command_prefix(self) -> Any:
+        return self._command_prefix
+
+    @command_prefix.setter
+    def command_prefix(self, value: Any) -> None:
+        self._command_prefix = value
+        self._compiled_prefilter = MISSING
+
+    @property
+    def message_prefilter(self) -> Union[bool, Pattern[str]]:
+        return self._message_prefilter
+
+    @message_prefilter.setter
+    def message_prefilter(self, value: Union[bool, Pattern[str]]) -> None:
+        self._message_prefilter = value
+        self._compiled_prefilter = MISSING
+
+    @property
+    def message_filter_stats(self) -> MessageFilterStats:
+        """:class:`.MessageFilterStats`: The number of messages that were filtered
+        and processed by :meth:`.process_commands`.
+
+        .. versionadded:: 2.4
+        """
+        return MessageFilterStats(self._messages_filtered, self._messages_processed)
+
     # internal helpers
 
     async def on_command_error(self, context: Context, exception: errors.CommandError) -> None:
@@ -496,6 +588,16 @@ class BotBase(CommonBotBase, GroupMixin):
         if message.author.id == self.user.id:  # type: ignore
             return ctx
 
+        manager = self._get_prefix_manager()
+        if manager is not None:
+            # match the message against the manager's prefixes directly, which avoids
+            # building a list of all prefixes and checking each of them separately
+            invoked_prefix = await manager.match(self, message)
+            if invoked_prefix is None:
+                return ctx
+            view.skip_string(invoked_prefix)
+            return self._finish_context(ctx, view, invoked_prefix)
+
         prefix = await self.get_prefix(message)
         invoked_prefix = prefix
 
@@ -531,16 +633,51 @@ class BotBase(CommonBotBase, GroupMixin):
                 # Getting here shouldn't happen
                 raise
 
+        # type-checker fails to narrow invoked_prefix type.
+        return self._finish_context(ctx, view, invoked_prefix)  # type: ignore
+
+    def _finish_context(self, ctx: CXT, view: StringView, invoked_prefix: str) -> CXT:
         if self.strip_after_prefix:
             view.skip_ws()
 
         invoker = view.get_word()
         ctx.invoked_with = invoker
-        # type-checker fails to narrow invoked_prefix type.
-        ctx.prefix = invoked_prefix  # type: ignore
+        ctx.prefix = invoked_prefix
         ctx.command = self.all_commands.get(invoker)
         return ctx
 
+    def _compile_message_prefilter(self) -> Optional[Callable[[Message], bool]]:
+        option = self._message_prefilter
+        if option is False:
+            return None
+
+        if isinstance(option, re.Pattern):
+            match = option.match
+            return lambda message: match(message.content) is not None
+
+        manager = self._get_prefix_manager()
+        if manager is not None:
+            return manager._may_match
+
+        prefixes = _get_prefilter_prefixes(self.command_prefix)
+        if prefixes is None or "" in prefixes or type(self).get_prefix is not BotBase.get_prefix:
+            # every message could start with a prefix
+            return None
+
+        if len(prefixes) <= 8:
+            return lambda message: message.content.startswith(prefixes)  # type: ignore
+
+        # with many prefixes, only checking the first character is faster
+        first_chars = frozenset(prefix[0] for prefix in prefixes)
+        return lambda message: message.content[:1] in first_chars
+
+    def _get_prefix_manager(self) -> Optional[GuildPrefixManager]:
+        # the manager can only be used directly if `get_prefix` wasn't overridden
+        prefix = self.command_prefix
+        if isinstance(prefix, GuildPrefixManager) and type(self).get_prefix is BotBase.get_prefix:
+            return prefix
+        return None
+
     async def invoke(self, ctx: Context) -> None:
         """|coro|
 
@@ -584,6 +721,14 @@ class BotBase(CommonBotBase, GroupMixin):
         This also checks if the message's author is a bot and doesn't
         call :meth:`~.Bot.get_context` or :meth:`~.Bot.invoke` if so.
 
+        .. versionchanged:: 2.4
+            If :attr:`~.Bot.command_prefix` is a :class:`.GuildPrefixManager`, messages
+            that don't start with any prefix are ignored without calling
+            :meth:`~.Bot.get_context` or :meth:`~.Bot.invoke`.
+
+            Messages can also be rejected early using :attr:`~.Bot.message_prefilter`.
+            The number of rejected messages is available via :attr:`~.Bot.message_filter_stats`.
+
         Parameters
         -----------
         message: :class:`disnake.Message`
@@ -592,6 +737,19 @@ class BotBase(CommonBotBase, GroupMixin):
         if message.author.bot:
             return
 
+        prefilter = self._compiled_prefilter
+        if prefilter is MISSING:
+            prefilter = self._compiled_prefilter = self._compile_message_prefilter()
+        if prefilter is not None and not prefilter(message):
+            self._messages_filtered += 1
+            return
+
+        manager = self._get_prefix_manager()
+        if manager is not None and await manager.match(self, message) is None:
+            self._messages_filtered += 1
+            return
+
+        self._messages_processed += 1
         ctx = await self.get_context(message)
         await self.invoke(ctx)
 
@@ -58,6 +58,7 @@ if TYPE_CHECKING:
 
     from ._types import CoroFunc
     from .bot import AutoShardedBot, AutoShardedInteractionBot, Bot, InteractionBot
+    from .cooldown_backends import CooldownBackend
 
     AnyBot = Union[Bot, AutoShardedBot, InteractionBot, AutoShardedInteractionBot]
 
@@ -93,6 +94,7 @@ class CommonBotBase(Generic[CogT]):
             raise TypeError(f"owner_ids must be a collection not {self.owner_ids.__class__!r}")
 
         self.reload: bool = kwargs.get("reload", False)
+        self.cooldown_backend: Optional[CooldownBackend] = kwargs.get("cooldown_backend")
 
         loop = asyncio.get_event_loop()
         loop.create_task(self._fill_owners())
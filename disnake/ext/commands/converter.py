@@ -31,6 +31,7 @@ import re
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Dict,
     Generic,
@@ -1091,6 +1092,8 @@ def get_converter(param: inspect.Parameter) -> Any:
 
 _GenericAlias = type(List[T])
 
+ConverterFunc = Callable[["Context", str, inspect.Parameter], Awaitable[Any]]
+
 
 def is_generic_type(tp: Any, *, _GenericAlias: Type = _GenericAlias) -> bool:
     return isinstance(tp, type) and issubclass(tp, Generic) or isinstance(tp, _GenericAlias)  # type: ignore
@@ -1121,9 +1124,15 @@ CONVERTER_MAPPING: Dict[Type[Any], Any] = {
 }
 
 
-async def _actual_conversion(ctx: Context, converter, argument: str, param: inspect.Parameter):
+def _compile_conversion(converter: Any) -> ConverterFunc:
+    # resolves everything that only depends on the converter itself ahead of time,
+    # the returned function behaves exactly like converting with the converter directly
     if converter is bool:
-        return _convert_to_bool(argument)
+
+        async def convert_bool(ctx: Context, argument: str, param: inspect.Parameter) -> Any:
+            return _convert_to_bool(argument)
+
+        return convert_bool
 
     try:
         module = converter.__module__
@@ -1135,78 +1144,71 @@ async def _actual_conversion(ctx: Context, converter, argument: str, param: insp
         ):
             converter = CONVERTER_MAPPING.get(converter, converter)
 
-    try:
-        if inspect.isclass(converter) and issubclass(converter, Converter):
-            if inspect.ismethod(converter.convert):
-                return await converter.convert(ctx, argument)
-            else:
+    if inspect.isclass(converter) and issubclass(converter, Converter):
+        if inspect.ismethod(converter.convert):
+            method = converter.convert
+        else:
+            method = None
+
+        async def convert_class(ctx: Context, argument: str, param: inspect.Parameter) -> Any:
+            try:
+                if method is not None:
+                    return await method(ctx, argument)
                 return await converter().convert(ctx, argument)  # type: ignore
-        elif isinstance(converter, Converter):
-            return await converter.convert(ctx, argument)  # type: ignore
-    except CommandError:
-        raise
-    except Exception as exc:
-        raise ConversionError(converter, exc) from exc
+            except CommandError:
+                raise
+            except Exception as exc:
+                raise ConversionError(converter, exc) from exc
 
-    try:
-        return converter(argument)  # type: ignore
-    except CommandError:
-        raise
-    except Exception as exc:
-        try:
-            name = converter.__name__
-        except AttributeError:
-            name = converter.__class__.__name__
+        return convert_class
 
-        raise BadArgument(f'Converting to "{name}" failed for parameter "{param.name}".') from exc
+    if isinstance(converter, Converter):
 
+        async def convert_instance(ctx: Context, argument: str, param: inspect.Parameter) -> Any:
+            try:
+                return await converter.convert(ctx, argument)  # type: ignore
+            except CommandError:
+                raise
+            except Exception as exc:
+                raise ConversionError(converter, exc) from exc
 
-async def run_converters(ctx: Context, converter, argument: str, param: inspect.Parameter):
-    """|coro|
+        return convert_instance
 
-    Runs converters for a given converter, argument, and parameter.
+    try:
+        name = converter.__name__
+    except AttributeError:
+        name = converter.__class__.__name__
 
-    This function does the same work that the library does under the hood.
+    async def convert_callable(ctx: Context, argument: str, param: inspect.Parameter) -> Any:
+        try:
+            return converter(argument)  # type: ignore
+        except CommandError:
+            raise
+        except Exception as exc:
+            raise BadArgument(
+                f'Converting to "{name}" failed for parameter "{param.name}".'
+            ) from exc
 
-    .. versionadded:: 2.0
+    return convert_callable
 
-    Parameters
-    ------------
-    ctx: :class:`Context`
-        The invocation context to run the converters under.
-    converter: Any
-        The converter to run, this corresponds to the annotation in the function.
-    argument: :class:`str`
-        The argument to convert to.
-    param: :class:`inspect.Parameter`
-        The parameter being converted. This is mainly for error reporting.
 
-    Raises
-    -------
-    CommandError
-        The converter failed to convert.
-
-    Returns
-    --------
-    Any
-        The resulting conversion.
-    """
-    origin = getattr(converter, "__origin__", None)
+def _compile_union(converter: Any) -> ConverterFunc:
+    _NoneType = type(None)
+    union_args = converter.__args__
+    compiled = [(conv is _NoneType, _compile_converter(conv)) for conv in union_args]
 
-    if origin is Union:
+    async def convert_union(ctx: Context, argument: str, param: inspect.Parameter) -> Any:
         errors = []
-        _NoneType = type(None)
-        union_args = converter.__args__
-        for conv in union_args:
+        for is_none, conv in compiled:
             # if we got to this part in the code, then the previous conversions have failed
             # so we should just undo the view, return the default, and allow parsing to continue
             # with the other parameters
-            if conv is _NoneType and param.kind != param.VAR_POSITIONAL:
+            if is_none and param.kind != param.VAR_POSITIONAL:
                 ctx.view.undo()
                 return None if param.default is param.empty else param.default
 
             try:
-                value = await run_converters(ctx, conv, argument, param)
+                value = await conv(ctx, argument, param)
             except CommandError as exc:
                 errors.append(exc)
             else:
@@ -1215,17 +1217,24 @@ async def run_converters(ctx: Context, converter, argument: str, param: inspect.
         # if we're here, then we failed all the converters
         raise BadUnionArgument(param, union_args, errors)
 
-    if origin is Literal:
+    return convert_union
+
+
+def _compile_literal(converter: Any) -> ConverterFunc:
+    literal_args = converter.__args__
+    literal_types = dict.fromkeys(type(literal) for literal in literal_args)
+    compiled = {literal_type: _compile_conversion(literal_type) for literal_type in literal_types}
+
+    async def convert_literal(ctx: Context, argument: str, param: inspect.Parameter) -> Any:
         errors = []
         conversions = {}
-        literal_args = converter.__args__
         for literal in literal_args:
             literal_type = type(literal)
             try:
                 value = conversions[literal_type]
             except KeyError:
                 try:
-                    value = await _actual_conversion(ctx, literal_type, argument, param)
+                    value = await compiled[literal_type](ctx, argument, param)
                 except CommandError as exc:
                     errors.append(exc)
                     conversions[literal_type] = object()
@@ -1239,6 +1248,20 @@ async def run_converters(ctx: Context, converter, argument: str, param: inspect.
         # if we're here, then we failed to match all the literals
         raise BadLiteralArgument(param, literal_args, errors)
 
+    return convert_literal
+
+
+def _compile_converter(converter: Any) -> ConverterFunc:
+    # returns a function that behaves like `run_converters` with the given converter,
+    # Union and Literal annotations are resolved and converters are looked up only once
+    origin = getattr(converter, "__origin__", None)
+
+    if origin is Union:
+        return _compile_union(converter)
+
+    if origin is Literal:
+        return _compile_literal(converter)
+
     # This must be the last if-clause in the chain of origin checking
     # Nearly every type is a generic type within the typing library
     # So care must be taken to make sure a more specialised origin handle
@@ -1246,4 +1269,37 @@ async def run_converters(ctx: Context, converter, argument: str, param: inspect.
     if origin is not None and is_generic_type(converter):
         converter = origin
 
-    return await _actual_conversion(ctx, converter, argument, param)
+    return _compile_conversion(converter)
+
+
+async def run_converters(ctx: Context, converter, argument: str, param: inspect.Parameter):
+    """|coro|
+
+    Runs converters for a given converter, argument, and parameter.
+
+    This function does the same work that the library does under the hood.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    ------------
+    ctx: :class:`Context`
+        The invocation context to run the converters under.
+    converter: Any
+        The converter to run, this corresponds to the annotation in the function.
+    argument: :class:`str`
+        The argument to convert to.
+    param: :class:`inspect.Parameter`
+        The parameter being converted. This is mainly for error reporting.
+
+    Raises
+    -------
+    CommandError
+        The converter failed to convert.
+
+    Returns
+    --------
+    Any
+        The resulting conversion.
+    """
+    return await _compile_converter(converter)(ctx, argument, param)
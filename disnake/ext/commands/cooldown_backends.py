@@ -0,0 +1,473 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from typing import Any, Dict, List, Optional
+
+from disnake.utils import _from_json, _to_json
+
+from .cooldowns import Cooldown, CooldownStore
+
+__all__ = (
+    "CooldownBackend",
+    "MemoryCooldownBackend",
+    "SocketCooldownBackend",
+    "CooldownServer",
+)
+
+_log = logging.getLogger(__name__)
+
+
+class CooldownBackend:
+    """An interface for storing the state of cooldowns and maximum concurrencies
+    outside of the commands they belong to, e.g. to share them between multiple processes.
+
+    A backend can be set for all commands using the ``cooldown_backend`` parameter of
+    :class:`.Bot` and :class:`.InteractionBot`, or for a single command using the ``backend``
+    parameter of :func:`.cooldown`, :func:`.dynamic_cooldown` and :func:`.max_concurrency`.
+
+    Each operation must be atomic, i.e. concurrent calls for the same key
+    must behave as if they were made one after another.
+
+    Keys are strings that identify the command as well as the bucket,
+    e.g. the user ID for :attr:`.BucketType.user`.
+
+    .. note::
+
+        The state kept in a backend isn't reflected by :meth:`.Command.is_on_cooldown`
+        and :meth:`.Command.get_cooldown_retry_after`, which only know about the state
+        kept in the command itself.
+
+    .. versionadded:: 2.4
+    """
+
+    async def update_rate_limit(self, key: str, rate: int, per: float, current: float) -> float:
+        """|coro|
+
+        Takes a token from the cooldown with the given key, creating it if it doesn't exist.
+        This behaves like :meth:`.Cooldown.update_rate_limit`.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the cooldown.
+        rate: :class:`int`
+            The total number of tokens available per ``per`` seconds.
+        per: :class:`float`
+            The length of the cooldown period in seconds.
+        current: :class:`float`
+            The time in seconds since Unix epoch to update the cooldown at.
+
+        Returns
+        -------
+        :class:`float`
+            The retry-after time in seconds if the cooldown is exhausted, ``0.0`` otherwise.
+        """
+        raise NotImplementedError
+
+    async def get_retry_after(self, key: str, current: float) -> float:
+        """|coro|
+
+        Returns the time in seconds until the cooldown with the given key will be reset,
+        without taking a token. This behaves like :meth:`.Cooldown.get_retry_after`.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the cooldown.
+        current: :class:`float`
+            The current time in seconds since Unix epoch.
+
+        Returns
+        -------
+        :class:`float`
+            The retry-after time in seconds, or ``0.0`` if the cooldown isn't exhausted.
+        """
+        raise NotImplementedError
+
+    async def reset(self, key: str) -> None:
+        """|coro|
+
+        Resets the cooldown with the given key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the cooldown.
+        """
+        raise NotImplementedError
+
+    async def acquire(self, key: str, number: int) -> bool:
+        """|coro|
+
+        Takes one of the ``number`` slots of the concurrency limit with the given key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the concurrency limit.
+        number: :class:`int`
+            The maximum number of slots that can be taken at the same time.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether a slot was taken, ``False`` if all slots are currently taken.
+        """
+        raise NotImplementedError
+
+    async def release(self, key: str) -> None:
+        """|coro|
+
+        Releases a slot of the concurrency limit with the given key.
+
+        Parameters
+        ----------
+        key: :class:`str`
+            The key of the concurrency limit.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the backend and releases its resources. This does nothing by default.
+        """
+        pass
+
+
+class MemoryCooldownBackend(CooldownBackend):
+    """A :class:`CooldownBackend` that keeps its state in memory.
+
+    This only shares state between the commands of a single process, and is mainly
+    useful as the backend of a :class:`CooldownServer`.
+
+    .. versionadded:: 2.4
+
+    Parameters
+    ----------
+    max_size: Optional[:class:`int`]
+        The maximum number of cooldowns to store, see :class:`.CooldownStore`.
+        Defaults to ``None`` (unlimited).
+    """
+
+    def __init__(self, *, max_size: Optional[int] = None) -> None:
+        self._store: CooldownStore = CooldownStore(max_size)
+        self._slots: Dict[str, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<MemoryCooldownBackend cooldowns={len(self._store)} limits={len(self._slots)}>"
+
+    # none of these methods yield to the event loop, which makes them atomic
+
+    async def update_rate_limit(self, key: str, rate: int, per: float, current: float) -> float:
+        store = self._store
+        store.expire(current)
+        bucket = store.get(key)
+        if bucket is None or bucket.rate != int(rate) or bucket.per != float(per):
+            bucket = Cooldown(rate, per)
+            store.set(key, bucket, current)
+        return bucket.update_rate_limit(current) or 0.0
+
+    async def get_retry_after(self, key: str, current: float) -> float:
+        bucket = self._store.get(key)
+        return 0.0 if bucket is None else bucket.get_retry_after(current)
+
+    async def reset(self, key: str) -> None:
+        self._store.remove(key)
+
+    async def acquire(self, key: str, number: int) -> bool:
+        taken = self._slots.get(key, 0)
+        if taken >= number:
+            return False
+        self._slots[key] = taken + 1
+        return True
+
+    async def release(self, key: str) -> None:
+        taken = self._slots.get(key)
+        if not taken:
+            return
+        if taken == 1:
+            del self._slots[key]
+        else:
+            self._slots[key] = taken - 1
+
+
+class CooldownServer:
+    """A reference server that shares the state of a :class:`CooldownBackend`
+    between multiple processes, which connect to it using :class:`SocketCooldownBackend`.
+
+    The server speaks newline-delimited JSON over TCP or a Unix domain socket. Requests
+    are applied to the backend one at a time, and concurrency slots taken by a client are
+    released automatically if its connection is lost.
+
+    .. warning::
+
+        Connections are not authenticated, the server should only be reachable
+        by the bot's own processes, e.g. by binding it to ``127.0.0.1`` or a Unix socket.
+
+    .. versionadded:: 2.4
+
+    Parameters
+    ----------
+    backend: Optional[:class:`CooldownBackend`]
+        The backend to share. Defaults to a new :class:`MemoryCooldownBackend`.
+    """
+
+    def __init__(self, backend: Optional[CooldownBackend] = None) -> None:
+        self.backend: CooldownBackend = backend or MemoryCooldownBackend()
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(
+        self, host: str = "127.0.0.1", port: Optional[int] = None, *, path: Optional[str] = None
+    ) -> None:
+        """|coro|
+
+        Starts listening for connections, either on the given host and port or on a Unix socket.
+
+        Parameters
+        ----------
+        host: :class:`str`
+            The host to listen on. Defaults to ``127.0.0.1``.
+        port: Optional[:class:`int`]
+            The port to listen on.
+        path: Optional[:class:`str`]
+            The path of the Unix socket to listen on, instead of ``host`` and ``port``.
+        """
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+        elif port is not None:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        else:
+            raise TypeError("either port or path must be provided")
+
+    async def serve_forever(self) -> None:
+        """|coro|
+
+        Serves connections until the server is closed. :meth:`start` must be called first.
+        """
+        if self._server is None:
+            raise RuntimeError("the server was not started")
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops the server and closes the backend.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.backend.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        backend = self.backend
+        # concurrency slots taken through this connection
+        held: Dict[str, int] = {}
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                request = _from_json(line)
+                try:
+                    result = await self._dispatch(request["op"], request["args"], held)
+                except Exception as e:
+                    response = {"id": request["id"], "error": f"{e.__class__.__name__}: {e}"}
+                else:
+                    response = {"id": request["id"], "result": result}
+                writer.write(_to_json(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            _log.exception("Error while handling a cooldown backend connection.")
+        finally:
+            for key, count in held.items():
+                for _ in range(count):
+                    await backend.release(key)
+            writer.close()
+
+    async def _dispatch(self, op: str, args: List[Any], held: Dict[str, int]) -> Any:
+        backend = self.backend
+        if op == "update_rate_limit":
+            return await backend.update_rate_limit(*args)
+        if op == "get_retry_after":
+            return await backend.get_retry_after(*args)
+        if op == "reset":
+            return await backend.reset(*args)
+        if op == "acquire":
+            acquired = await backend.acquire(*args)
+            if acquired:
+                held[args[0]] = held.get(args[0], 0) + 1
+            return acquired
+        if op == "release":
+            key = args[0]
+            count = held.get(key)
+            # only release slots that were taken through this connection
+            if count:
+                if count == 1:
+                    del held[key]
+                else:
+                    held[key] = count - 1
+                await backend.release(key)
+            return None
+        raise ValueError(f"unknown operation {op!r}")
+
+
+class SocketCooldownBackend(CooldownBackend):
+    """A :class:`CooldownBackend` that connects to a :class:`CooldownServer`.
+
+    Requests are pipelined over a single connection, which is opened on first use
+    and reopened after it's lost.
+
+    .. versionadded:: 2.4
+
+    Parameters
+    ----------
+    host: :class:`str`
+        The host of the server. Defaults to ``127.0.0.1``.
+    port: Optional[:class:`int`]
+        The port of the server.
+    path: Optional[:class:`str`]
+        The path of the server's Unix socket, instead of ``host`` and ``port``.
+    timeout: :class:`float`
+        The number of seconds to wait for a response before raising :exc:`asyncio.TimeoutError`.
+        Defaults to ``5``.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        *,
+        path: Optional[str] = None,
+        timeout: float = 5.0,
+    ) -> None:
+        if port is None and path is None:
+            raise TypeError("either port or path must be provided")
+
+        self.host: str = host
+        self.port: Optional[int] = port
+        self.path: Optional[str] = path
+        self.timeout: float = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._connect_lock: asyncio.Lock = asyncio.Lock()
+        self._write_lock: asyncio.Lock = asyncio.Lock()
+        self._pending: Dict[int, asyncio.Future[Any]] = {}
+        self._counter = itertools.count()
+
+    def __repr__(self) -> str:
+        address = self.path if self.path is not None else f"{self.host}:{self.port}"
+        return f"<SocketCooldownBackend address={address!r} connected={self._writer is not None}>"
+
+    async def update_rate_limit(self, key: str, rate: int, per: float, current: float) -> float:
+        return await self._request("update_rate_limit", key, rate, per, current)
+
+    async def get_retry_after(self, key: str, current: float) -> float:
+        return await self._request("get_retry_after", key, current)
+
+    async def reset(self, key: str) -> None:
+        await self._request("reset", key)
+
+    async def acquire(self, key: str, number: int) -> bool:
+        return await self._request("acquire", key, number)
+
+    async def release(self, key: str) -> None:
+        await self._request("release", key)
+
+    async def close(self) -> None:
+        writer = self._writer
+        if writer is not None:
+            writer.close()
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        self._disconnect(ConnectionError("the backend was closed"))
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        async with self._connect_lock:
+            if self._writer is not None:
+                return self._writer
+
+            if self.path is not None:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            else:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+
+            self._reader, self._writer = reader, writer
+            self._reader_task = asyncio.create_task(self._read_responses(reader))
+            return writer
+
+    def _disconnect(self, exc: Exception) -> None:
+        self._reader = self._writer = self._reader_task = None
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        exc: Exception = ConnectionError("the connection to the cooldown server was lost")
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                response = _from_json(line)
+                future = self._pending.pop(response["id"], None)
+                if future is None or future.done():
+                    continue
+                if "error" in response:
+                    future.set_exception(RuntimeError(response["error"]))
+                else:
+                    future.set_result(response["result"])
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            exc = e
+        if self._reader is reader:
+            self._disconnect(exc)
+
+    async def _request(self, op: str, *args: Any) -> Any:
+        writer = self._writer or await self._connect()
+        request_id = next(self._counter)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        data = _to_json({"id": request_id, "op": op, "args": args}).encode("utf-8") + b"\n"
+        try:
+            async with self._write_lock:
+                writer.write(data)
+                await writer.drain()
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
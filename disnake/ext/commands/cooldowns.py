@@ -26,21 +26,44 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import logging
 import time
 from collections import deque
-from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from disnake.enums import Enum
+from disnake.interactions import Interaction
+from disnake.utils import MISSING
 
 from ...abc import PrivateChannel
 from .errors import MaxConcurrencyReached
 
 if TYPE_CHECKING:
+    from ...interactions import ApplicationCommandInteraction
     from ...message import Message
+    from .cooldown_backends import CooldownBackend
 
 __all__ = (
     "BucketType",
+    "InteractionBucket",
     "Cooldown",
+    "CooldownStore",
     "CooldownMapping",
     "DynamicCooldownMapping",
     "MaxConcurrency",
@@ -49,6 +72,12 @@ __all__ = (
 C = TypeVar("C", bound="CooldownMapping")
 MC = TypeVar("MC", bound="MaxConcurrency")
 
+_log = logging.getLogger(__name__)
+
+# strong references to the resets of cooldowns kept in backends that are still pending,
+# since the event loop only keeps weak references to tasks
+_pending_resets: Set[asyncio.Task[None]] = set()
+
 
 class BucketType(Enum):
     default = 0
@@ -59,7 +88,12 @@ class BucketType(Enum):
     category = 5
     role = 6
 
-    def get_key(self, msg: Message) -> Any:
+    def get_key(self, msg: Union[Message, Interaction]) -> Any:
+        if isinstance(msg, Interaction):
+            key = self._get_interaction_key(msg)
+            if key is not MISSING:
+                return key
+
         if self is BucketType.user:
             return msg.author.id
         elif self is BucketType.guild:
@@ -77,10 +111,133 @@ class BucketType(Enum):
             # recieving a DMChannel or GroupChannel which inherit from PrivateChannel and do
             return (msg.channel if isinstance(msg.channel, PrivateChannel) else msg.author.top_role).id  # type: ignore
 
-    def __call__(self, msg: Message) -> Any:
+    def _get_interaction_key(self, inter: Interaction) -> Any:
+        # uses the IDs in the interaction payload where possible, which avoids cache lookups
+        if self is BucketType.default:
+            return None
+        elif self is BucketType.user:
+            return inter.author.id
+        elif self is BucketType.guild:
+            return inter.guild_id or inter.author.id
+        elif self is BucketType.channel:
+            return inter.channel_id
+        elif self is BucketType.member:
+            return (inter.guild_id, inter.author.id)
+        return MISSING
+
+    def __call__(self, msg: Union[Message, Interaction]) -> Any:
         return self.get_key(msg)
 
 
+class InteractionBucket:
+    """Builds cooldown and concurrency keys from the fields of an application command interaction.
+
+    This can be passed as the ``type`` of :func:`.cooldown` and :func:`.dynamic_cooldown`,
+    or as the ``per`` of :func:`.max_concurrency`, for application commands.
+    Keys are built from the interaction's payload without any cache lookups or
+    API requests, so cooldowns are checked before the command's callback
+    runs and has a chance to respond to or defer the interaction.
+
+    If no fields are enabled, the cooldown or concurrency limit is global.
+
+    .. versionadded:: 2.4
+
+    Parameters
+    ----------
+    user: :class:`bool`
+        Whether the key contains the ID of the user that invoked the command.
+    guild: :class:`bool`
+        Whether the key contains the ID of the guild the command was invoked in,
+        or ``None`` in direct messages.
+    channel: :class:`bool`
+        Whether the key contains the ID of the channel the command was invoked in.
+    command: :class:`bool`
+        Whether the key contains the ID of the invoked command and the names of the
+        invoked subcommands. This differentiates e.g. guild-specific registrations of a command.
+    options: Sequence[:class:`str`]
+        The names of the options whose values the key contains. Users, channels, roles
+        and other objects are represented by their IDs, and options that weren't
+        provided by the user are represented by ``None``.
+
+    Example
+    -------
+
+    .. code-block:: python3
+
+        # every user can buy a specific item once per minute
+        @bot.slash_command()
+        @commands.cooldown(1, 60, commands.InteractionBucket(user=True, options=["item"]))
+        async def buy(inter, item: str):
+            ...
+    """
+
+    __slots__ = ("user", "guild", "channel", "command", "options")
+
+    def __init__(
+        self,
+        *,
+        user: bool = False,
+        guild: bool = False,
+        channel: bool = False,
+        command: bool = False,
+        options: Sequence[str] = (),
+    ) -> None:
+        if isinstance(options, str):
+            options = (options,)
+        self.user: bool = user
+        self.guild: bool = guild
+        self.channel: bool = channel
+        self.command: bool = command
+        self.options: Tuple[str, ...] = tuple(options)
+
+    def __repr__(self) -> str:
+        return f"<InteractionBucket {self.name}>"
+
+    @property
+    def name(self) -> str:
+        """:class:`str`: A description of the fields used in keys,
+        or ``default`` if no fields are used."""
+        parts = [f for f in ("user", "guild", "channel", "command") if getattr(self, f)]
+        parts.extend(f"option {name!r}" for name in self.options)
+        return ", ".join(parts) or "default"
+
+    def get_key(self, inter: ApplicationCommandInteraction) -> Tuple[Any, ...]:
+        """Returns the key for the given interaction.
+
+        Parameters
+        ----------
+        inter: :class:`.ApplicationCommandInteraction`
+            The interaction to build the key of.
+
+        Returns
+        -------
+        Tuple[Any, ...]
+            The key, containing the values of the enabled fields.
+        """
+        key: List[Any] = []
+        if self.user:
+            key.append(inter.author.id)
+        if self.guild:
+            key.append(inter.guild_id)
+        if self.channel:
+            key.append(inter.channel_id)
+
+        if self.command or self.options:
+            chain, kwargs = inter.data._get_chain_and_kwargs()
+            if self.command:
+                key.append(inter.data.id)
+                key.append(chain)
+            for name in self.options:
+                value = kwargs.get(name)
+                # objects like members and channels aren't hashable in a stable way
+                key.append(getattr(value, "id", value))
+
+        return tuple(key)
+
+    def __call__(self, inter: ApplicationCommandInteraction) -> Tuple[Any, ...]:
+        return self.get_key(inter)
+
+
 class Cooldown:
     """Represents a cooldown for a command.
 
@@ -195,24 +352,183 @@ class Cooldown:
         return f"<Cooldown rate: {self.rate} per: {self.per} window: {self._window} tokens: {self._tokens}>"
 
 
+class CooldownStore:
+    """Stores the per-key cooldowns of a command.
+
+    Cooldowns that haven't been used for a whole cooldown period are removed
+    automatically. Their expiry times are kept in a heap, so removing them only
+    looks at cooldowns that are due instead of going through all stored cooldowns.
+
+    This can be subclassed to store cooldowns elsewhere, by overriding
+    :meth:`get`, :meth:`set`, :meth:`remove` and :meth:`expire`.
+
+    .. versionadded:: 2.4
+
+    Parameters
+    ----------
+    max_size: Optional[:class:`int`]
+        The maximum number of cooldowns to store. If this is exceeded, the cooldowns
+        that expire the soonest are removed, even if they're still active.
+        Defaults to ``None`` (unlimited).
+
+    Attributes
+    ----------
+    max_size: Optional[:class:`int`]
+        The maximum number of cooldowns to store.
+    """
+
+    __slots__ = ("max_size", "_buckets", "_expiry", "_counter")
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+
+        self.max_size: Optional[int] = max_size
+        self._buckets: Dict[Any, Cooldown] = {}
+        # (expiry time, insertion order, key), with at least one entry per stored key.
+        # entries aren't updated when a cooldown is used, they're rescheduled when popped instead
+        self._expiry: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+
+    def __repr__(self) -> str:
+        return f"<CooldownStore size={len(self._buckets)} max_size={self.max_size}>"
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._buckets
+
+    def get(self, key: Any) -> Optional[Cooldown]:
+        """Returns the cooldown stored for the given key, or ``None`` if there is none."""
+        return self._buckets.get(key)
+
+    def set(self, key: Any, bucket: Cooldown, current: Optional[float] = None) -> None:
+        """Stores a cooldown for the given key.
+
+        Parameters
+        ----------
+        key: Any
+            The key of the cooldown.
+        bucket: :class:`.Cooldown`
+            The cooldown to store.
+        current: Optional[:class:`float`]
+            The time in seconds since Unix epoch the cooldown is first used at.
+            If not supplied, then :func:`time.time()` is used.
+        """
+        current = current or time.time()
+        self._buckets[key] = bucket
+        heapq.heappush(self._expiry, (current + bucket.per, next(self._counter), key))
+
+        if self.max_size is not None:
+            while len(self._buckets) > self.max_size:
+                self._pop_next(current, evict=True)
+
+    def remove(self, key: Any) -> None:
+        """Removes the cooldown stored for the given key, if any."""
+        self._buckets.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all stored cooldowns."""
+        self._buckets.clear()
+        self._expiry.clear()
+
+    def expire(self, current: Optional[float] = None) -> None:
+        """Removes all cooldowns that haven't been used in their cooldown period.
+
+        Parameters
+        ----------
+        current: Optional[:class:`float`]
+            The current time in seconds since Unix epoch.
+            If not supplied, then :func:`time.time()` is used.
+        """
+        current = current or time.time()
+        expiry = self._expiry
+        while expiry and expiry[0][0] < current:
+            self._pop_next(current, evict=False)
+
+    def copy(self) -> CooldownStore:
+        """Creates a shallow copy of this store.
+
+        Returns
+        --------
+        :class:`CooldownStore`
+            A new store containing the same cooldowns.
+        """
+        ret = self.__class__(self.max_size)
+        ret._buckets = self._buckets.copy()
+        ret._expiry = self._expiry.copy()
+        return ret
+
+    def _pop_next(self, current: float, *, evict: bool) -> None:
+        expiry = self._expiry
+        scheduled, _, key = heapq.heappop(expiry)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            # the key was removed in the meantime
+            return
+
+        expires = bucket._last + bucket.per
+        # when evicting, the entry is only up to date if the cooldown wasn't used since it
+        # was scheduled, in which case it's the cooldown that expires the soonest
+        if current > expires or (evict and expires <= scheduled):
+            del self._buckets[key]
+        else:
+            heapq.heappush(expiry, (expires, next(self._counter), key))
+
+
+def _get_namespace(func: Callable[..., Any]) -> str:
+    # identifies a command's cooldown and concurrency state in a backend. this uses the
+    # callback, since it's the same in every process running the same code
+    func = getattr(func, "__func__", func)
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def _resolve_backend(backend: Optional[CooldownBackend], obj: Any) -> Optional[CooldownBackend]:
+    if backend is not None:
+        return backend
+    # `obj` is a context or an interaction here, fall back to the bot's default backend
+    return getattr(getattr(obj, "bot", None), "cooldown_backend", None)
+
+
+def _on_backend_reset_done(task: asyncio.Task[None]) -> None:
+    _pending_resets.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        _log.error("Failed to reset a cooldown in its backend", exc_info=exc)
+
+
 class CooldownMapping:
     def __init__(
         self,
         original: Optional[Cooldown],
         type: Callable[[Message], Any],
+        *,
+        store: Optional[CooldownStore] = None,
+        backend: Optional[CooldownBackend] = None,
     ) -> None:
         if not callable(type):
             raise TypeError("Cooldown type must be a BucketType or callable")
 
-        self._cache: Dict[Any, Cooldown] = {}
+        self._cache: CooldownStore = store if store is not None else CooldownStore()
         self._cooldown: Optional[Cooldown] = original
         self._type: Callable[[Message], Any] = type
+        self.backend: Optional[CooldownBackend] = backend
+        self.namespace: Optional[str] = None
 
     def copy(self) -> CooldownMapping:
-        ret = CooldownMapping(self._cooldown, self._type)
-        ret._cache = self._cache.copy()
+        ret = CooldownMapping(
+            self._cooldown, self._type, store=self._cache.copy(), backend=self.backend
+        )
+        ret.namespace = self.namespace
         return ret
 
+    @property
+    def store(self) -> CooldownStore:
+        return self._cache
+
     @property
     def valid(self) -> bool:
         return self._cooldown is not None
@@ -232,10 +548,7 @@ class CooldownMapping:
         # we want to delete all cache objects that haven't been used
         # in a cooldown window. e.g. if we have a  command that has a
         # cooldown of 60s and it has not been used in 60s then that key should be deleted
-        current = current or time.time()
-        dead_keys = [k for k, v in self._cache.items() if current > v._last + v.per]
-        for k in dead_keys:
-            del self._cache[k]
+        self._cache.expire(current)
 
     def _is_default(self) -> bool:
         # This method can be overridden in subclasses
@@ -250,12 +563,11 @@ class CooldownMapping:
 
         self._verify_cache_integrity(current)
         key = self._bucket_key(message)
-        if key not in self._cache:
+        bucket = self._cache.get(key)
+        if bucket is None:
             bucket = self.create_bucket(message)
             if bucket is not None:
-                self._cache[key] = bucket
-        else:
-            bucket = self._cache[key]
+                self._cache.set(key, bucket, current)
 
         return bucket
 
@@ -265,17 +577,44 @@ class CooldownMapping:
         bucket = self.get_bucket(message, current)
         return bucket.update_rate_limit(current)
 
+    def _backend_key(self, message: Message) -> str:
+        return f"cooldown:{self.namespace}:{self._bucket_key(message)!r}"
+
+    def _backend_reset(self, backend: CooldownBackend, message: Message) -> asyncio.Task[None]:
+        # `reset_cooldown` is synchronous, so the reset is done in the background
+        task = asyncio.create_task(backend.reset(self._backend_key(message)))
+        _pending_resets.add(task)
+        task.add_done_callback(_on_backend_reset_done)
+        return task
+
+    async def _backend_update_rate_limit(
+        self, backend: CooldownBackend, message: Message, current: float
+    ) -> Tuple[Optional[Cooldown], float]:
+        # the bucket is only used as a template here, its state is kept by the backend
+        bucket = self.create_bucket(message)
+        if bucket is None:
+            return None, 0.0
+        key = self._backend_key(message)
+        return bucket, await backend.update_rate_limit(key, bucket.rate, bucket.per, current)
+
 
 class DynamicCooldownMapping(CooldownMapping):
     def __init__(
-        self, factory: Callable[[Message], Cooldown], type: Callable[[Message], Any]
+        self,
+        factory: Callable[[Message], Cooldown],
+        type: Callable[[Message], Any],
+        *,
+        store: Optional[CooldownStore] = None,
+        backend: Optional[CooldownBackend] = None,
     ) -> None:
-        super().__init__(None, type)
+        super().__init__(None, type, store=store, backend=backend)
         self._factory: Callable[[Message], Cooldown] = factory
 
     def copy(self) -> DynamicCooldownMapping:
-        ret = DynamicCooldownMapping(self._factory, self._type)
-        ret._cache = self._cache.copy()
+        ret = DynamicCooldownMapping(
+            self._factory, self._type, store=self._cache.copy(), backend=self.backend
+        )
+        ret.namespace = self.namespace
         return ret
 
     @property
@@ -351,30 +690,51 @@ class _Semaphore:
 
 
 class MaxConcurrency:
-    __slots__ = ("number", "per", "wait", "_mapping")
+    __slots__ = ("number", "per", "wait", "backend", "namespace", "_mapping")
 
-    def __init__(self, number: int, *, per: BucketType, wait: bool) -> None:
+    def __init__(
+        self,
+        number: int,
+        *,
+        per: Union[BucketType, InteractionBucket],
+        wait: bool,
+        backend: Optional[CooldownBackend] = None,
+    ) -> None:
         self._mapping: Dict[Any, _Semaphore] = {}
-        self.per: BucketType = per
+        self.per: Union[BucketType, InteractionBucket] = per
         self.number: int = number
         self.wait: bool = wait
+        self.backend: Optional[CooldownBackend] = backend
+        self.namespace: Optional[str] = None
 
         if number <= 0:
             raise ValueError("max_concurrency 'number' cannot be less than 1")
 
-        if not isinstance(per, BucketType):
-            raise TypeError(f"max_concurrency 'per' must be of type BucketType not {type(per)!r}")
+        if not isinstance(per, (BucketType, InteractionBucket)):
+            raise TypeError(
+                f"max_concurrency 'per' must be of type BucketType or InteractionBucket not {type(per)!r}"
+            )
 
     def copy(self: MC) -> MC:
-        return self.__class__(self.number, per=self.per, wait=self.wait)
+        ret = self.__class__(self.number, per=self.per, wait=self.wait, backend=self.backend)
+        ret.namespace = self.namespace
+        return ret
 
     def __repr__(self) -> str:
         return f"<MaxConcurrency per={self.per!r} number={self.number} wait={self.wait}>"
 
-    def get_key(self, message: Message) -> Any:
-        return self.per.get_key(message)
+    def get_key(self, message: Union[Message, ApplicationCommandInteraction]) -> Any:
+        return self.per.get_key(message)  # type: ignore
+
+    def _backend_key(self, message: Message) -> str:
+        return f"concurrency:{self.namespace}:{self.get_key(message)!r}"
 
     async def acquire(self, message: Message) -> None:
+        backend = _resolve_backend(self.backend, message)
+        if backend is not None:
+            await self._backend_acquire(backend, message)
+            return
+
         key = self.get_key(message)
 
         try:
@@ -389,6 +749,11 @@ class MaxConcurrency:
     async def release(self, message: Message) -> None:
         # Technically there's no reason for this function to be async
         # But it might be more useful in the future
+        backend = _resolve_backend(self.backend, message)
+        if backend is not None:
+            await backend.release(self._backend_key(message))
+            return
+
         key = self.get_key(message)
 
         try:
@@ -401,3 +766,13 @@ class MaxConcurrency:
 
         if sem.value >= self.number and not sem.is_active():
             del self._mapping[key]
+
+    async def _backend_acquire(self, backend: CooldownBackend, message: Message) -> None:
+        key = self._backend_key(message)
+        delay = 0.05
+        while not await backend.acquire(key, self.number):
+            if not self.wait:
+                raise MaxConcurrencyReached(self.number, self.per)
+            # backends can't notify waiters, so poll with an increasing delay instead
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
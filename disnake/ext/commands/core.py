@@ -53,8 +53,18 @@ from disnake.interactions import ApplicationCommandInteraction
 from ._types import _BaseCommand
 from .cog import Cog
 from .context import Context
-from .converter import Greedy, get_converter, run_converters
-from .cooldowns import BucketType, Cooldown, CooldownMapping, DynamicCooldownMapping, MaxConcurrency
+from .converter import Greedy, _compile_converter, get_converter
+from .cooldowns import (
+    BucketType,
+    Cooldown,
+    CooldownMapping,
+    CooldownStore,
+    DynamicCooldownMapping,
+    InteractionBucket,
+    MaxConcurrency,
+    _get_namespace,
+    _resolve_backend,
+)
 from .errors import *
 
 if TYPE_CHECKING:
@@ -63,6 +73,8 @@ if TYPE_CHECKING:
     from disnake.message import Message
 
     from ._types import Check, Coro, CoroFunc, Error, Hook
+    from .converter import ConverterFunc
+    from .cooldown_backends import CooldownBackend
 
 
 __all__ = (
@@ -146,6 +158,33 @@ def get_signature_parameters(
     return params
 
 
+class _CompiledParameter:
+    # a command parameter with everything that doesn't change between invocations
+    # resolved ahead of time, see `Command._get_compiled_params`
+    __slots__ = ("param", "kind", "required", "greedy", "optional", "flag", "converter", "convert")
+
+    def __init__(self, param: inspect.Parameter, *, optional: bool) -> None:
+        self.param: inspect.Parameter = param
+        self.kind = param.kind
+        self.required: bool = param.default is param.empty
+        self.optional: bool = optional
+
+        converter = get_converter(param)
+        # Greedy[X] is only special for positional parameters,
+        # keyword-only parameters are simply parsed as X
+        self.greedy: bool = isinstance(converter, Greedy) and self.kind != param.KEYWORD_ONLY
+        if isinstance(converter, Greedy):
+            converter = converter.converter
+
+        self.flag: bool = (
+            self.required
+            and hasattr(converter, "__commands_is_flag__")
+            and converter._can_be_constructible()
+        )
+        self.converter: Any = converter
+        self.convert: ConverterFunc = _compile_converter(converter)
+
+
 def wrap_callback(coro):
     @functools.wraps(coro)
     async def wrapped(*args, **kwargs):
@@ -368,6 +407,12 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
 
         self._max_concurrency: Optional[MaxConcurrency] = max_concurrency
 
+        namespace = _get_namespace(func)
+        if buckets.namespace is None:
+            buckets.namespace = namespace
+        if max_concurrency is not None and max_concurrency.namespace is None:
+            max_concurrency.namespace = namespace
+
         self.require_var_positional: bool = kwargs.get("require_var_positional", False)
         self.ignore_extra: bool = kwargs.get("ignore_extra", True)
         self.cooldown_after_parsing: bool = kwargs.get("cooldown_after_parsing", False)
@@ -422,6 +467,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             globalns = {}
 
         self.params = get_signature_parameters(function, globalns)
+        self._compiled_params: Optional[
+            Tuple[Dict[str, inspect.Parameter], bool, List[_CompiledParameter]]
+        ] = None
 
     def add_check(self, func: Check) -> None:
         """Adds a check to the command.
@@ -551,44 +599,39 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             ctx.bot.dispatch("command_error", ctx, error)
 
     async def transform(self, ctx: Context, param: inspect.Parameter) -> Any:
-        required = param.default is param.empty
-        converter = get_converter(param)
-        consume_rest_is_special = param.kind == param.KEYWORD_ONLY and not self.rest_is_raw
+        return await self._transform(ctx, self._compile_parameter(param))
+
+    async def _transform(self, ctx: Context, compiled: _CompiledParameter) -> Any:
+        param = compiled.param
         view = ctx.view
         view.skip_ws()
 
         # The greedy converter is simple -- it keeps going until it fails in which case,
         # it undos the view ready for the next parameter to use instead
-        if isinstance(converter, Greedy):
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                return await self._transform_greedy_pos(ctx, param, required, converter.converter)
-            elif param.kind == param.VAR_POSITIONAL:
-                return await self._transform_greedy_var_pos(ctx, param, converter.converter)
-            else:
-                # if we're here, then it's a KEYWORD_ONLY param type
-                # since this is mostly useless, we'll helpfully transform Greedy[X]
-                # into just X and do the parsing that way.
-                converter = converter.converter
+        if compiled.greedy:
+            if compiled.kind == param.VAR_POSITIONAL:
+                return await self._transform_greedy_var_pos(ctx, compiled)
+            return await self._transform_greedy_pos(ctx, compiled)
 
         if view.eof:
-            if param.kind == param.VAR_POSITIONAL:
+            if compiled.kind == param.VAR_POSITIONAL:
                 raise RuntimeError()  # break the loop
-            if required:
-                if self._is_typing_optional(param.annotation):
+            if compiled.required:
+                if compiled.optional:
                     return None
-                if hasattr(converter, "__commands_is_flag__") and converter._can_be_constructible():
-                    return await converter._construct_default(ctx)
+                if compiled.flag:
+                    return await compiled.converter._construct_default(ctx)
                 raise MissingRequiredArgument(param)
             return param.default
 
         previous = view.index
-        if consume_rest_is_special:
+        if compiled.kind == param.KEYWORD_ONLY and not self.rest_is_raw:
             argument = view.read_rest().strip()
         else:
             try:
                 argument = view.get_quoted_word()
             except ArgumentParsingError as exc:
-                if self._is_typing_optional(param.annotation):
+                if compiled.optional:
                     view.index = previous
                     return None
                 else:
@@ -596,11 +639,10 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         view.previous = previous
 
         # type-checker fails to narrow argument
-        return await run_converters(ctx, converter, argument, param)  # type: ignore
+        return await compiled.convert(ctx, argument, param)  # type: ignore
 
-    async def _transform_greedy_pos(
-        self, ctx: Context, param: inspect.Parameter, required: bool, converter: Any
-    ) -> Any:
+    async def _transform_greedy_pos(self, ctx: Context, compiled: _CompiledParameter) -> Any:
+        param = compiled.param
         view = ctx.view
         result = []
         while not view.eof:
@@ -610,31 +652,64 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
             view.skip_ws()
             try:
                 argument = view.get_quoted_word()
-                value = await run_converters(ctx, converter, argument, param)  # type: ignore
+                value = await compiled.convert(ctx, argument, param)  # type: ignore
             except (CommandError, ArgumentParsingError):
                 view.index = previous
                 break
             else:
                 result.append(value)
 
-        if not result and not required:
+        if not result and not compiled.required:
             return param.default
         return result
 
-    async def _transform_greedy_var_pos(
-        self, ctx: Context, param: inspect.Parameter, converter: Any
-    ) -> Any:
+    async def _transform_greedy_var_pos(self, ctx: Context, compiled: _CompiledParameter) -> Any:
         view = ctx.view
         previous = view.index
         try:
             argument = view.get_quoted_word()
-            value = await run_converters(ctx, converter, argument, param)  # type: ignore
+            value = await compiled.convert(ctx, argument, compiled.param)  # type: ignore
         except (CommandError, ArgumentParsingError):
             view.index = previous
             raise RuntimeError() from None  # break loop
         else:
             return value
 
+    def _compile_parameter(self, param: inspect.Parameter) -> _CompiledParameter:
+        return _CompiledParameter(param, optional=self._is_typing_optional(param.annotation))
+
+    def _get_compiled_params(self) -> List[_CompiledParameter]:
+        # the parameters are compiled once and cached until the callback changes,
+        # copies of the command (e.g. for cogs) compile their own parameters
+        params = self.params
+        has_cog = self.cog is not None
+        cached = self._compiled_params
+        if cached is not None and cached[0] is params and cached[1] is has_cog:
+            return cached[2]
+
+        iterator = iter(params.values())
+        if has_cog:
+            # we have 'self' as the first parameter so just advance
+            # the iterator and resume parsing
+            try:
+                next(iterator)
+            except StopIteration:
+                raise disnake.ClientException(
+                    f'Callback for {self.name} command is missing "self" parameter.'
+                )
+
+        # next we have the 'ctx' as the next parameter
+        try:
+            next(iterator)
+        except StopIteration:
+            raise disnake.ClientException(
+                f'Callback for {self.name} command is missing "ctx" parameter.'
+            )
+
+        compiled = [self._compile_parameter(param) for param in iterator]
+        self._compiled_params = (params, has_cog, compiled)
+        return compiled
+
     @property
     def clean_params(self) -> Dict[str, inspect.Parameter]:
         """Dict[:class:`str`, :class:`inspect.Parameter`]:
@@ -729,46 +804,36 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         kwargs = ctx.kwargs
 
         view = ctx.view
-        iterator = iter(self.params.items())
-
-        if self.cog is not None:
-            # we have 'self' as the first parameter so just advance
-            # the iterator and resume parsing
-            try:
-                next(iterator)
-            except StopIteration:
-                raise disnake.ClientException(
-                    f'Callback for {self.name} command is missing "self" parameter.'
-                )
+        compiled_params = self._get_compiled_params()
 
-        # next we have the 'ctx' as the next parameter
-        try:
-            next(iterator)
-        except StopIteration:
-            raise disnake.ClientException(
-                f'Callback for {self.name} command is missing "ctx" parameter.'
-            )
+        if type(self).transform is Command.transform:
+            transform = self._transform
+        else:
+            # subclasses may override `transform`, which takes the parameter itself
+            async def transform(ctx: Context, compiled: _CompiledParameter) -> Any:
+                return await self.transform(ctx, compiled.param)
 
-        for name, param in iterator:
+        for compiled in compiled_params:
+            param = compiled.param
             ctx.current_parameter = param
-            if param.kind in (param.POSITIONAL_OR_KEYWORD, param.POSITIONAL_ONLY):
-                transformed = await self.transform(ctx, param)
+            kind = compiled.kind
+            if kind == param.POSITIONAL_OR_KEYWORD or kind == param.POSITIONAL_ONLY:
+                transformed = await transform(ctx, compiled)
                 args.append(transformed)
-            elif param.kind == param.KEYWORD_ONLY:
+            elif kind == param.KEYWORD_ONLY:
                 # kwarg only param denotes "consume rest" semantics
                 if self.rest_is_raw:
-                    converter = get_converter(param)
                     argument = view.read_rest()
-                    kwargs[name] = await run_converters(ctx, converter, argument, param)
+                    kwargs[param.name] = await compiled.convert(ctx, argument, param)
                 else:
-                    kwargs[name] = await self.transform(ctx, param)
+                    kwargs[param.name] = await transform(ctx, compiled)
                 break
-            elif param.kind == param.VAR_POSITIONAL:
+            elif kind == param.VAR_POSITIONAL:
                 if view.eof and self.require_var_positional:
                     raise MissingRequiredArgument(param)
                 while not view.eof:
                     try:
-                        transformed = await self.transform(ctx, param)
+                        transformed = await transform(ctx, compiled)
                         args.append(transformed)
                     except RuntimeError:
                         break
@@ -830,6 +895,20 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
                 if retry_after:
                     raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
 
+    async def _prepare_cooldowns_async(self, ctx: Context) -> None:
+        backend = _resolve_backend(self._buckets.backend, ctx) if self._buckets.valid else None
+        if backend is None:
+            self._prepare_cooldowns(ctx)
+            return
+
+        dt = ctx.message.edited_at or ctx.message.created_at
+        current = dt.replace(tzinfo=datetime.timezone.utc).timestamp()
+        bucket, retry_after = await self._buckets._backend_update_rate_limit(
+            backend, ctx.message, current
+        )
+        if retry_after:
+            raise CommandOnCooldown(bucket, retry_after, self._buckets.type)  # type: ignore
+
     async def prepare(self, ctx: Context) -> None:
         ctx.command = self
 
@@ -843,9 +922,9 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
         try:
             if self.cooldown_after_parsing:
                 await self._parse_arguments(ctx)
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns_async(ctx)
             else:
-                self._prepare_cooldowns(ctx)
+                await self._prepare_cooldowns_async(ctx)
                 await self._parse_arguments(ctx)
 
             await self.call_before_hooks(ctx)
@@ -878,12 +957,20 @@ class Command(_BaseCommand, Generic[CogT, P, T]):
     def reset_cooldown(self, ctx: Context) -> None:
         """Resets the cooldown on this command.
 
+        If the cooldown is kept in a :class:`.CooldownBackend`, it's reset in the background
+        and failures are logged.
+
         Parameters
         -----------
         ctx: :class:`.Context`
             The invocation context to reset the cooldown under.
         """
         if self._buckets.valid:
+            backend = _resolve_backend(self._buckets.backend, ctx)
+            if backend is not None:
+                self._buckets._backend_reset(backend, ctx.message)
+                return
+
             bucket = self._buckets.get_bucket(ctx.message)
             bucket.reset()
 
@@ -2221,7 +2308,12 @@ def is_nsfw() -> Callable[[T], T]:
 
 
 def cooldown(
-    rate: int, per: float, type: Union[BucketType, Callable[[Message], Any]] = BucketType.default
+    rate: int,
+    per: float,
+    type: Union[BucketType, Callable[[Message], Any]] = BucketType.default,
+    *,
+    max_buckets: Optional[int] = None,
+    backend: Optional[CooldownBackend] = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a cooldown to a :class:`.Command`
 
@@ -2247,20 +2339,44 @@ def cooldown(
 
         .. versionchanged:: 1.7
             Callables are now supported for custom bucket types.
+
+        .. versionchanged:: 2.4
+            Application commands can use an :class:`.InteractionBucket`.
+    max_buckets: Optional[:class:`int`]
+        The maximum number of cooldowns to keep track of, e.g. the number of users with
+        :attr:`.BucketType.user`. If this is exceeded, the cooldowns that expire the soonest
+        are discarded. Defaults to ``None`` (unlimited). See :class:`.CooldownStore`.
+
+        .. versionadded:: 2.4
+    backend: Optional[:class:`.CooldownBackend`]
+        The backend to keep the state of the cooldown in, e.g. to share it between multiple
+        processes. Defaults to the bot's ``cooldown_backend``. If neither is set, the state
+        is kept in the command itself.
+
+        .. versionadded:: 2.4
     """
 
     def decorator(func: Union[Command, CoroFunc]) -> Union[Command, CoroFunc]:
+        mapping = CooldownMapping(
+            Cooldown(rate, per), type, store=CooldownStore(max_buckets), backend=backend
+        )
         if hasattr(func, "__command_flag__"):
-            func._buckets = CooldownMapping(Cooldown(rate, per), type)
+            # the command already set the namespace of the mapping this replaces
+            mapping.namespace = _get_namespace(func.callback)
+            func._buckets = mapping
         else:
-            func.__commands_cooldown__ = CooldownMapping(Cooldown(rate, per), type)  # type: ignore
+            func.__commands_cooldown__ = mapping  # type: ignore
         return func
 
     return decorator  # type: ignore
 
 
 def dynamic_cooldown(
-    cooldown: Union[BucketType, Callable[[Message], Any]], type: BucketType = BucketType.default
+    cooldown: Union[BucketType, Callable[[Message], Any]],
+    type: BucketType = BucketType.default,
+    *,
+    max_buckets: Optional[int] = None,
+    backend: Optional[CooldownBackend] = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a dynamic cooldown to a :class:`.Command`
 
@@ -2289,22 +2405,41 @@ def dynamic_cooldown(
         apply to this invocation or ``None`` if the cooldown should be bypassed.
     type: :class:`.BucketType`
         The type of cooldown to have.
+    max_buckets: Optional[:class:`int`]
+        The maximum number of cooldowns to keep track of. If this is exceeded, the cooldowns
+        that expire the soonest are discarded. Defaults to ``None`` (unlimited).
+        See :class:`.CooldownStore`.
+
+        .. versionadded:: 2.4
+    backend: Optional[:class:`.CooldownBackend`]
+        The backend to keep the state of the cooldown in, see :func:`.cooldown`.
+
+        .. versionadded:: 2.4
     """
     if not callable(cooldown):
         raise TypeError("A callable must be provided")
 
     def decorator(func: Union[Command, CoroFunc]) -> Union[Command, CoroFunc]:
+        mapping = DynamicCooldownMapping(
+            cooldown, type, store=CooldownStore(max_buckets), backend=backend
+        )
         if hasattr(func, "__command_flag__"):
-            func._buckets = DynamicCooldownMapping(cooldown, type)
+            # the command already set the namespace of the mapping this replaces
+            mapping.namespace = _get_namespace(func.callback)
+            func._buckets = mapping
         else:
-            func.__commands_cooldown__ = DynamicCooldownMapping(cooldown, type)  # type: ignore
+            func.__commands_cooldown__ = mapping  # type: ignore
         return func
 
     return decorator  # type: ignore
 
 
 def max_concurrency(
-    number: int, per: BucketType = BucketType.default, *, wait: bool = False
+    number: int,
+    per: Union[BucketType, InteractionBucket] = BucketType.default,
+    *,
+    wait: bool = False,
+    backend: Optional[CooldownBackend] = None,
 ) -> Callable[[T], T]:
     """A decorator that adds a maximum concurrency to a :class:`.Command` or its subclasses.
 
@@ -2319,19 +2454,29 @@ def max_concurrency(
     -------------
     number: :class:`int`
         The maximum number of invocations of this command that can be running at the same time.
-    per: :class:`.BucketType`
+    per: Union[:class:`.BucketType`, :class:`.InteractionBucket`]
         The bucket that this concurrency is based on, e.g. ``BucketType.guild`` would allow
         it to be used up to ``number`` times per guild.
+
+        .. versionchanged:: 2.4
+            Application commands can use an :class:`.InteractionBucket`.
     wait: :class:`bool`
         Whether the command should wait for the queue to be over. If this is set to ``False``
         then instead of waiting until the command can run again, the command raises
         :exc:`.MaxConcurrencyReached` to its error handler. If this is set to ``True``
         then the command waits until it can be executed.
+    backend: Optional[:class:`.CooldownBackend`]
+        The backend to keep track of the running invocations in, e.g. to share the limit
+        between multiple processes. Defaults to the bot's ``cooldown_backend``. If neither
+        is set, the invocations are tracked by the command itself.
+
+        .. versionadded:: 2.4
     """
 
     def decorator(func: Union[Command, CoroFunc]) -> Union[Command, CoroFunc]:
-        value = MaxConcurrency(number, per=per, wait=wait)
+        value = MaxConcurrency(number, per=per, wait=wait, backend=backend)
         if hasattr(func, "__command_flag__"):
+            value.namespace = _get_namespace(func.callback)
             func._max_concurrency = value
         else:
             func.__commands_max_concurrency__ = value  # type: ignore
@@ -38,7 +38,7 @@ if TYPE_CHECKING:
 
     from .context import Context
     from .converter import Converter
-    from .cooldowns import BucketType, Cooldown
+    from .cooldowns import BucketType, Cooldown, InteractionBucket
     from .flags import Flag
 
 
@@ -593,13 +593,16 @@ class MaxConcurrencyReached(CommandError):
     ------------
     number: :class:`int`
         The maximum number of concurrent invokers allowed.
-    per: :class:`.BucketType`
+    per: Union[:class:`.BucketType`, :class:`.InteractionBucket`]
         The bucket type passed to the :func:`.max_concurrency` decorator.
+
+        .. versionchanged:: 2.4
+            This can also be an :class:`.InteractionBucket`.
     """
 
-    def __init__(self, number: int, per: BucketType) -> None:
+    def __init__(self, number: int, per: Union[BucketType, InteractionBucket]) -> None:
         self.number: int = number
-        self.per: BucketType = per
+        self.per: Union[BucketType, InteractionBucket] = per
         name = per.name
         suffix = "per %s" % name if per.name != "default" else "globally"
         plural = "%s times %s" if number > 1 else "%s time %s"
@@ -31,6 +31,7 @@ from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Coroutine,
     Dict,
@@ -50,8 +51,11 @@ from disnake.app_commands import (
     Option,
     PartialGuildApplicationCommandPermissions,
 )
+from disnake.backoff import ExponentialBackoff
 from disnake.custom_warnings import ConfigWarning, SyncWarning
 from disnake.enums import ApplicationCommandType
+from disnake.errors import DiscordServerError
+from disnake.interactions.auto_defer import _AckTracker
 
 from . import errors
 from .base_core import InvokableApplicationCommand
@@ -66,11 +70,13 @@ from .ctx_menus_core import (
 )
 from .errors import CommandRegistrationError
 from .slash_core import InvokableSlashCommand, SubCommand, SubCommandGroup, slash_command
+from .sync_state import CommandSyncState, hash_commands
 
 if TYPE_CHECKING:
 
     from typing_extensions import Concatenate, ParamSpec
 
+    from disnake.app_commands import APIApplicationCommand, GuildApplicationCommandPermissions
     from disnake.interactions import ApplicationCommandInteraction
 
     from ._types import Check, CoroFunc
@@ -94,6 +100,49 @@ CXT = TypeVar("CXT", bound="Context")
 
 _log = logging.getLogger(__name__)
 
+# the maximum number of concurrent requests while syncing commands,
+# rate limits are still handled by the HTTP client
+_MAX_CONCURRENT_SYNC_REQUESTS = 10
+
+
+# the number of attempts for a single sync request that fails due to server or connection errors
+_MAX_SYNC_ATTEMPTS = 3
+
+
+async def _gather_limited(
+    coros: Iterable[Awaitable[Any]],
+    limit: int,
+    *,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> None:
+    coros = list(coros)
+    semaphore = asyncio.Semaphore(limit)
+    done = 0
+
+    async def run(coro: Awaitable[Any]) -> None:
+        nonlocal done
+        async with semaphore:
+            await coro
+        done += 1
+        if progress is not None:
+            progress(done, len(coros))
+
+    await asyncio.gather(*(run(coro) for coro in coros))
+
+
+async def _retry_sync_request(request: Callable[[], Awaitable[T]]) -> T:
+    # the HTTP client already handles rate limits and retries briefly by itself,
+    # this backs off further if Discord keeps failing for a while
+    backoff = ExponentialBackoff()
+    for attempt in range(1, _MAX_SYNC_ATTEMPTS + 1):
+        try:
+            return await request()
+        except (DiscordServerError, OSError, asyncio.TimeoutError):
+            if attempt == _MAX_SYNC_ATTEMPTS:
+                raise
+            await asyncio.sleep(backoff.delay())
+    raise RuntimeError("Unreachable code in sync request handling")
+
 
 def _app_commands_diff(
     new_commands: Iterable[ApplicationCommand],
@@ -148,6 +197,43 @@ def _format_diff(diff: Dict[str, List[ApplicationCommand]]) -> str:
     return "\n".join(f"| {line}" for line in lines)
 
 
+def _app_command_permissions_diff(
+    new_perms: Iterable[PartialGuildApplicationCommandPermissions],
+    old_perms: Dict[int, GuildApplicationCommandPermissions],
+) -> Dict[str, List[int]]:
+    # the order of the overwrites doesn't matter to the API
+    old = {
+        cmd_id: {(p.id, p.type, p.permission) for p in perms.permissions}
+        for cmd_id, perms in old_perms.items()
+    }
+    diff: Dict[str, List[int]] = {"no_changes": [], "upsert": [], "edit": [], "delete": []}
+    for perms in new_perms:
+        old_set = old.pop(perms.id, None)
+        new_set = {(p.id, p.type, p.permission) for p in perms.permissions}
+        if old_set is None:
+            # commands without overwrites aren't returned by the API
+            diff["upsert" if new_set else "no_changes"].append(perms.id)
+        elif old_set != new_set:
+            diff["edit"].append(perms.id)
+        else:
+            diff["no_changes"].append(perms.id)
+
+    diff["delete"].extend(cmd_id for cmd_id, perms in old.items() if perms)
+    return diff
+
+
+def _format_permissions_diff(diff: Dict[str, List[int]]) -> str:
+    lines: List[str] = []
+    for key, label in _diff_map.items():
+        lines.append(label)
+        if changes := diff[key]:
+            lines.extend(f"    <command id={cmd_id}>" for cmd_id in changes)
+        else:
+            lines.append("    -")
+
+    return "\n".join(f"| {line}" for line in lines)
+
+
 class InteractionBotBase(CommonBotBase):
     def __init__(
         self,
@@ -156,6 +242,7 @@ class InteractionBotBase(CommonBotBase):
         sync_commands_debug: bool = False,
         sync_commands_on_cog_unload: bool = True,
         sync_permissions: bool = False,
+        sync_commands_cache: Optional[str] = None,
         test_guilds: Sequence[int] = None,
         **options: Any,
     ):
@@ -169,7 +256,11 @@ class InteractionBotBase(CommonBotBase):
         self._sync_commands_debug: bool = sync_commands_debug
         self._sync_commands_on_cog_unload = sync_commands_on_cog_unload
         self._sync_permissions: bool = sync_permissions
+        self._sync_commands_cache: Optional[str] = sync_commands_cache
+        self._sync_state: Optional[CommandSyncState] = None
         self._sync_queued: bool = False
+        # {command ID: (command, event name)}, see `_get_command_routes`
+        self._command_routes: Optional[Dict[int, Tuple[InvokableApplicationCommand, str]]] = None
 
         self._slash_command_checks = []
         self._slash_command_check_once = []
@@ -240,6 +331,7 @@ class InteractionBotBase(CommonBotBase):
             raise CommandRegistrationError(slash_command.name)
 
         self.all_slash_commands[slash_command.name] = slash_command
+        self._command_routes = None
 
     def add_user_command(self, user_command: InvokableUserCommand) -> None:
         """Adds an :class:`.InvokableUserCommand` into the internal list of user commands.
@@ -267,6 +359,7 @@ class InteractionBotBase(CommonBotBase):
             raise CommandRegistrationError(user_command.name)
 
         self.all_user_commands[user_command.name] = user_command
+        self._command_routes = None
 
     def add_message_command(self, message_command: InvokableMessageCommand) -> None:
         """Adds an :class:`.InvokableMessageCommand` into the internal list of message commands.
@@ -296,6 +389,7 @@ class InteractionBotBase(CommonBotBase):
             raise CommandRegistrationError(message_command.name)
 
         self.all_message_commands[message_command.name] = message_command
+        self._command_routes = None
 
     def remove_slash_command(self, name: str) -> Optional[InvokableSlashCommand]:
         """Remove a :class:`.InvokableSlashCommand` from the internal list
@@ -315,6 +409,7 @@ class InteractionBotBase(CommonBotBase):
         command = self.all_slash_commands.pop(name, None)
         if command is None:
             return None
+        self._command_routes = None
         return command
 
     def remove_user_command(self, name: str) -> Optional[InvokableUserCommand]:
@@ -335,6 +430,7 @@ class InteractionBotBase(CommonBotBase):
         command = self.all_user_commands.pop(name, None)
         if command is None:
             return None
+        self._command_routes = None
         return command
 
     def remove_message_command(self, name: str) -> Optional[InvokableMessageCommand]:
@@ -355,6 +451,7 @@ class InteractionBotBase(CommonBotBase):
         command = self.all_message_commands.pop(name, None)
         if command is None:
             return None
+        self._command_routes = None
         return command
 
     def get_slash_command(
@@ -641,11 +738,32 @@ class InteractionBotBase(CommonBotBase):
 
         return global_cmds, guilds
 
+    def _get_sync_state(self) -> Optional[CommandSyncState]:
+        if self._sync_commands_cache is None:
+            return None
+        if self._sync_state is None:
+            # the application ID is always set after the first connection
+            self._sync_state = CommandSyncState.load(
+                self._sync_commands_cache, self.application_id  # type: ignore
+            )
+        return self._sync_state
+
+    def _save_sync_state(self) -> None:
+        if self._sync_state is None:
+            return
+        try:
+            self._sync_state.save()
+        except OSError as e:
+            warnings.warn(
+                f"Failed to save the application command sync state due to {e}", SyncWarning
+            )
+
     async def _cache_application_commands(self) -> None:
         if not isinstance(self, disnake.Client):
             raise NotImplementedError(f"This method is only usable in disnake.Client subclasses")
 
-        _, guilds = self._ordered_unsynced_commands(self._test_guilds)
+        global_cmds, guilds = self._ordered_unsynced_commands(self._test_guilds)
+        state = self._get_sync_state()
 
         # Here we only cache global commands and commands from guilds that are spcified in the code.
         # They're collected from the "test_guilds" kwarg of commands.InteractionBotBase
@@ -655,22 +773,43 @@ class InteractionBotBase(CommonBotBase):
         # catch a lot of "Forbidden" errors, exceeding the limit of 10k invalid requests in 10 minutes (for large bots).
         # However, our approach has blind spots. We deal with them in :meth:`process_application_commands`.
 
-        try:
-            commands = await self.fetch_global_commands()
+        # If the commands of a scope haven't changed since they were last synced,
+        # they're loaded from the sync state instead of being fetched.
+        def get_stored(
+            scope: Optional[int], cmds: List[ApplicationCommand]
+        ) -> Optional[List[APIApplicationCommand]]:
+            if state is None or state.get_hash(scope) != hash_commands(cmds):
+                return None
+            return state.get_commands(scope)
+
+        async def cache_global() -> None:
+            commands = get_stored(None, global_cmds)
+            if commands is None:
+                try:
+                    commands = await self.fetch_global_commands()
+                except Exception:
+                    return
             self._connection._global_application_commands = {
                 command.id: command for command in commands
             }
-        except Exception:
-            pass
-        for guild_id in guilds:
-            try:
-                commands = await self.fetch_guild_commands(guild_id)
-                if commands:
-                    self._connection._guild_application_commands[guild_id] = {
-                        command.id: command for command in commands
-                    }
-            except Exception:
-                pass
+
+        async def cache_guild(guild_id: int, cmds: List[ApplicationCommand]) -> None:
+            commands = get_stored(guild_id, cmds)
+            if commands is None:
+                try:
+                    commands = await self.fetch_guild_commands(guild_id)
+                except Exception:
+                    return
+            if commands:
+                self._connection._guild_application_commands[guild_id] = {
+                    command.id: command for command in commands
+                }
+
+        await _gather_limited(
+            [cache_global(), *(cache_guild(guild_id, cmds) for guild_id, cmds in guilds.items())],
+            _MAX_CONCURRENT_SYNC_REQUESTS,
+        )
+        self._command_routes = None
 
     async def _sync_application_commands(self) -> None:
         if not isinstance(self, disnake.Client):
@@ -685,33 +824,64 @@ class InteractionBotBase(CommonBotBase):
         if global_cmds is None:
             return
 
+        state = self._get_sync_state()
+
         # Update global commands first
-        diff = _app_commands_diff(
-            global_cmds, self._connection._global_application_commands.values()
-        )
-        update_required = bool(diff["upsert"]) or bool(diff["edit"]) or bool(diff["delete"])
-
-        # Show the difference
-        self._log_sync_debug(
-            "Application command synchronization:\n"
-            "GLOBAL COMMANDS\n"
-            "===============\n"
-            "| NOTE: global commands can take up to 1 hour to show up after registration.\n"
-            "|\n"
-            f"| Update is required: {update_required}\n{_format_diff(diff)}"
-        )
+        global_hash = hash_commands(global_cmds)
+        if state is not None and state.get_hash(None) == global_hash:
+            self._log_sync_debug(
+                "Application command synchronization:\n"
+                "GLOBAL COMMANDS\n"
+                "===============\n"
+                "| No changes since the last synchronization"
+            )
+        else:
+            diff = _app_commands_diff(
+                global_cmds, self._connection._global_application_commands.values()
+            )
+            update_required = bool(diff["upsert"]) or bool(diff["edit"]) or bool(diff["delete"])
+
+            # Show the difference
+            self._log_sync_debug(
+                "Application command synchronization:\n"
+                "GLOBAL COMMANDS\n"
+                "===============\n"
+                "| NOTE: global commands can take up to 1 hour to show up after registration.\n"
+                "|\n"
+                f"| Update is required: {update_required}\n{_format_diff(diff)}"
+            )
+
+            synced = True
+            if update_required:
+                # Notice that we don't do any API requests if there're no changes.
+                try:
+                    to_send = diff["no_changes"] + diff["edit"] + diff["upsert"]
+                    await self.bulk_overwrite_global_commands(to_send)
+                except Exception as e:
+                    warnings.warn(f"Failed to overwrite global commands due to {e}", SyncWarning)
+                    synced = False
+
+            if state is not None:
+                if synced:
+                    commands = self._connection._global_application_commands.values()
+                    state.set(None, global_hash, commands)
+                else:
+                    state.discard(None)
 
-        if update_required:
-            # Notice that we don't do any API requests if there're no changes.
-            try:
-                to_send = diff["no_changes"] + diff["edit"] + diff["upsert"]
-                await self.bulk_overwrite_global_commands(to_send)
-            except Exception as e:
-                warnings.warn(f"Failed to overwrite global commands due to {e}", SyncWarning)
         # Same process but for each specified guild individually.
         # Notice that we're not doing this for every single guild for optimisation purposes.
         # See the note in :meth:`_cache_application_commands` about guild app commands.
-        for guild_id, cmds in guild_cmds.items():
+        async def sync_guild(guild_id: int, cmds: List[ApplicationCommand]) -> None:
+            guild_hash = hash_commands(cmds)
+            if state is not None and state.get_hash(guild_id) == guild_hash:
+                self._log_sync_debug(
+                    "Application command synchronization:\n"
+                    f"COMMANDS IN {guild_id}\n"
+                    "===============================\n"
+                    "| No changes since the last synchronization"
+                )
+                return
+
             current_guild_cmds = self._connection._guild_application_commands.get(guild_id, {})
             diff = _app_commands_diff(cmds, current_guild_cmds.values())
             update_required = bool(diff["upsert"]) or bool(diff["edit"]) or bool(diff["delete"])
@@ -723,6 +893,7 @@ class InteractionBotBase(CommonBotBase):
                 f"| Update is required: {update_required}\n{_format_diff(diff)}"
             )
             # Do API requests and cache
+            synced = True
             if update_required:
                 try:
                     to_send = diff["no_changes"] + diff["edit"] + diff["upsert"]
@@ -732,6 +903,24 @@ class InteractionBotBase(CommonBotBase):
                         f"Failed to overwrite commands in <Guild id={guild_id}> due to {e}",
                         SyncWarning,
                     )
+                    synced = False
+
+            if state is not None:
+                if synced:
+                    commands = self._connection._guild_application_commands.get(guild_id, {})
+                    state.set(guild_id, guild_hash, commands.values())
+                else:
+                    state.discard(guild_id)
+
+        # Guilds are synced concurrently, but the number of requests in flight is limited
+        await _gather_limited(
+            [sync_guild(guild_id, cmds) for guild_id, cmds in guild_cmds.items()],
+            _MAX_CONCURRENT_SYNC_REQUESTS,
+        )
+        self._save_sync_state()
+        # The IDs of the commands may have changed, rebuild the routes right away
+        self._command_routes = None
+        self._get_command_routes()
         # Last debug message
         self._log_sync_debug("Command synchronization task has finished")
 
@@ -756,14 +945,22 @@ class InteractionBotBase(CommonBotBase):
                 )
             return
 
-        for guild_id in guilds_to_cache:
+        async def cache_guild(guild_id: int) -> None:
             try:
-                perms = await self.bulk_fetch_command_permissions(guild_id)
-                self._connection._application_command_permissions[guild_id] = {
-                    perm.id: perm for perm in perms
-                }
+                perms = await _retry_sync_request(
+                    lambda: self.bulk_fetch_command_permissions(guild_id)
+                )
             except Exception:
-                pass
+                return
+            self._connection._application_command_permissions[guild_id] = {
+                perm.id: perm for perm in perms
+            }
+
+        await _gather_limited(
+            [cache_guild(guild_id) for guild_id in guilds_to_cache],
+            _MAX_CONCURRENT_SYNC_REQUESTS,
+            progress=self._sync_progress_logger("Command permission caching"),
+        )
 
     async def _sync_application_command_permissions(self) -> None:
         # Assuming that permissions and commands are cached
@@ -808,26 +1005,83 @@ class InteractionBotBase(CommonBotBase):
 
         # Once per-guild permissions are collected from the code,
         # we can compare them to the cached permissions
-        for guild_id, new_array in guilds_to_compare.items():
+        async def sync_guild(
+            guild_id: int, new_array: List[PartialGuildApplicationCommandPermissions]
+        ) -> None:
             old_perms = self._connection._application_command_permissions.get(guild_id, {})
-            if len(new_array) == len(old_perms) and all(
-                new_cmd_perms.id in old_perms
-                and old_perms[new_cmd_perms.id].permissions == new_cmd_perms.permissions
-                for new_cmd_perms in new_array
-            ):
+            diff = _app_command_permissions_diff(new_array, old_perms)
+            if not (diff["upsert"] or diff["edit"] or diff["delete"]):
                 self._log_sync_debug(f"Command permissions in <Guild id={guild_id}>: no changes")
-                continue
+                return
+
+            self._log_sync_debug(
+                f"Command permissions in <Guild id={guild_id}>:\n{_format_permissions_diff(diff)}"
+            )
             # If we got here, the permissions require an update
             try:
-                await self.bulk_edit_command_permissions(guild_id, new_array)
+                await _retry_sync_request(
+                    lambda: self.bulk_edit_command_permissions(guild_id, new_array)
+                )
             except Exception as err:
                 warnings.warn(
                     f"Failed to overwrite permissions in <Guild id={guild_id}> due to {err}",
                     SyncWarning,
                 )
-            finally:
+            else:
                 self._log_sync_debug(f"Command permissions in <Guild id={guild_id}>: edited")
 
+        await _gather_limited(
+            [sync_guild(guild_id, new_array) for guild_id, new_array in guilds_to_compare.items()],
+            _MAX_CONCURRENT_SYNC_REQUESTS,
+            progress=self._sync_progress_logger("Command permission synchronization"),
+        )
+
+    def _sync_progress_logger(self, task: str) -> Callable[[int, int], None]:
+        # logs roughly every 10%, so that large syncs don't flood the output
+        def log_progress(done: int, total: int) -> None:
+            step = max(total // 10, 1)
+            if done % step == 0 or done == total:
+                self._log_sync_debug(f"{task}: {done}/{total} guilds processed")
+
+        return log_progress
+
+    def _get_command_route_named(
+        self, type: ApplicationCommandType, name: str
+    ) -> Optional[Tuple[InvokableApplicationCommand, str]]:
+        app_command: Optional[InvokableApplicationCommand]
+        if type is ApplicationCommandType.chat_input:
+            app_command = self.all_slash_commands.get(name)
+            event_name = "slash_command"
+        elif type is ApplicationCommandType.user:
+            app_command = self.all_user_commands.get(name)
+            event_name = "user_command"
+        elif type is ApplicationCommandType.message:
+            app_command = self.all_message_commands.get(name)
+            event_name = "message_command"
+        else:
+            return None
+
+        return None if app_command is None else (app_command, event_name)
+
+    def _get_command_routes(self) -> Dict[int, Tuple[InvokableApplicationCommand, str]]:
+        # Maps the IDs of the cached API commands to the commands in the code, so that
+        # interactions are routed with a single lookup. The routes are reset whenever
+        # commands are added, removed or synced, and rebuilt on the next interaction.
+        routes = self._command_routes
+        if routes is None:
+            routes = {}
+            state = self._connection
+            api_commands = chain(
+                state._global_application_commands.values(),
+                *(cmds.values() for cmds in state._guild_application_commands.values()),
+            )
+            for api_command in api_commands:
+                route = self._get_command_route_named(api_command.type, api_command.name)
+                if route is not None:
+                    routes[api_command.id] = route
+            self._command_routes = routes
+        return routes
+
     def _log_sync_debug(self, text: str) -> None:
         if self._sync_commands_debug:
             # if sync debugging is enabled, *always* output logs
@@ -1258,11 +1512,13 @@ class InteractionBotBase(CommonBotBase):
         inter: :class:`disnake.ApplicationCommandInteraction`
             The interaction to process.
         """
-        slash_command = self.all_slash_commands.get(inter.data.name)
-
-        if slash_command is None:
+        route = self._get_command_routes().get(inter.data.id) or self._get_command_route_named(
+            ApplicationCommandType.chat_input, inter.data.name
+        )
+        if route is None or not isinstance(route[0], InvokableSlashCommand):
             return
 
+        slash_command = route[0]
         inter.application_command = slash_command
         if slash_command.guild_ids is None or inter.guild_id in slash_command.guild_ids:
             await slash_command._call_relevant_autocompleter(inter)
@@ -1285,54 +1541,46 @@ class InteractionBotBase(CommonBotBase):
         interaction: :class:`disnake.ApplicationCommandInteraction`
             The interaction to process commands for.
         """
-        if self._sync_commands and not self._sync_queued:
-            known_command = self.get_global_command(interaction.data.id)  # type: ignore
-
-            if known_command is None:
-                known_command = self.get_guild_command(interaction.guild_id, interaction.data.id)  # type: ignore
-
-            if known_command is None:
-                # This usually comes from the blind spots of the sync algorithm.
-                # Since not all guild commands are cached, it is possible to experience such issues.
-                # In this case, the blind spot is the interaction guild, let's fix it:
-                try:
-                    await self.bulk_overwrite_guild_commands(interaction.guild_id, [])  # type: ignore
-                except disnake.HTTPException:
-                    pass
-                try:
-                    # This part is in a separate try-except because we still should respond to the interaction
-                    await interaction.response.send_message(
-                        "This command has just been synced. More information about this: "
-                        "https://docs.disnake.dev/en/latest/ext/commands/additional_info.html"
-                        "#app-command-sync.",
-                        ephemeral=True,
-                    )
-                except disnake.HTTPException:
-                    pass
-                return
-
-        command_type = interaction.data.type
-        command_name = interaction.data.name
-        app_command = None
-        event_name = None
-
-        if command_type is ApplicationCommandType.chat_input:
-            app_command = self.all_slash_commands.get(command_name)
-            event_name = "slash_command"
-
-        elif command_type is ApplicationCommandType.user:
-            app_command = self.all_user_commands.get(command_name)
-            event_name = "user_command"
-
-        elif command_type is ApplicationCommandType.message:
-            app_command = self.all_message_commands.get(command_name)
-            event_name = "message_command"
-
-        if event_name is None or app_command is None:
+        route = self._get_command_routes().get(interaction.data.id)
+        if route is None:
+            if self._sync_commands and not self._sync_queued:
+                known_command = self.get_global_command(interaction.data.id)  # type: ignore
+
+                if known_command is None:
+                    known_command = self.get_guild_command(interaction.guild_id, interaction.data.id)  # type: ignore
+
+                if known_command is None:
+                    # This usually comes from the blind spots of the sync algorithm.
+                    # Since not all guild commands are cached, it is possible to experience such issues.
+                    # In this case, the blind spot is the interaction guild, let's fix it:
+                    try:
+                        await self.bulk_overwrite_guild_commands(interaction.guild_id, [])  # type: ignore
+                    except disnake.HTTPException:
+                        pass
+                    try:
+                        # This part is in a separate try-except because we still should respond to the interaction
+                        await interaction.response.send_message(
+                            "This command has just been synced. More information about this: "
+                            "https://docs.disnake.dev/en/latest/ext/commands/additional_info.html"
+                            "#app-command-sync.",
+                            ephemeral=True,
+                        )
+                    except disnake.HTTPException:
+                        pass
+                    return
+
+            # The command isn't synced by this bot, e.g. if the auto sync is disabled
+            route = self._get_command_route_named(interaction.data.type, interaction.data.name)
+
+        if route is None:
             # If we are here, the command being invoked is either unknown or has an unknonw type.
             # This usually happens if the auto sync is disabled, so let's just ignore this.
             return
 
+        app_command, event_name = route
+        # defers the interaction if the command's auto defer policy requires it,
+        # and records the acknowledgement latency
+        tracker = _AckTracker(interaction, app_command._get_auto_defer(interaction))
         self.dispatch(event_name, interaction)
         try:
             if await self.application_command_can_run(interaction, call_once=True):
@@ -1342,6 +1590,8 @@ class InteractionBotBase(CommonBotBase):
                 raise errors.CheckFailure("The global check_once functions failed.")
         except errors.CommandError as exc:
             await app_command.dispatch_error(interaction, exc)
+        finally:
+            tracker.finish()
 
     async def on_application_command(self, interaction: ApplicationCommandInteraction):
         await self.process_application_commands(interaction)
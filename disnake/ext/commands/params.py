@@ -33,6 +33,7 @@ from enum import Enum, EnumMeta
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     ClassVar,
     Dict,
@@ -264,6 +265,92 @@ class LargeInt(int):
     """Type for large integers in slash commands."""
 
 
+_CacheSearchable = Union[disnake.Member, disnake.Role, disnake.abc.GuildChannel, disnake.Emoji]
+
+
+def _search_cache(
+    guild: disnake.Guild,
+    search_type: type,
+    query: str,
+    channel_types: Optional[List[ChannelType]],
+) -> List[Any]:
+    if issubclass(search_type, (disnake.Member, disnake.User)):
+        return guild.match_members(query)
+    if issubclass(search_type, disnake.Role):
+        return guild.match_roles(query)
+    if issubclass(search_type, disnake.Emoji):
+        return guild.match_emojis(query)
+    return guild.match_channels(query, channel_types=channel_types)
+
+
+def _cache_choice_name(obj: _CacheSearchable) -> str:
+    if isinstance(obj, disnake.Member) and obj.nick:
+        name = f"{obj.nick} ({obj})"
+    else:
+        name = obj.name
+    # choice names are limited to 100 characters
+    return name[:100]
+
+
+def _cache_autocompleter(
+    search_type: type, channel_types: Optional[List[ChannelType]]
+) -> Callable[..., List[OptionChoice]]:
+    def autocomplete(
+        inter: disnake.ApplicationCommandInteraction, user_input: str, **kwargs: Any
+    ) -> List[OptionChoice]:
+        guild = inter.guild
+        if guild is None:
+            return []
+
+        return [
+            OptionChoice(_cache_choice_name(obj), str(obj.id))
+            for obj in _search_cache(guild, search_type, user_input, channel_types)
+        ]
+
+    return autocomplete
+
+
+def _cache_converter(
+    search_type: type, channel_types: Optional[List[ChannelType]]
+) -> Callable[[CommandInteraction, str], Any]:
+    if issubclass(search_type, (disnake.Member, disnake.User)):
+        error: Type[errors.BadArgument] = errors.MemberNotFound
+    elif issubclass(search_type, disnake.Role):
+        error = errors.RoleNotFound
+    else:
+        error = errors.ChannelNotFound
+
+    def convert(inter: CommandInteraction, argument: str) -> Any:
+        guild = inter.guild
+        if guild is None:
+            raise errors.NoPrivateMessage()
+
+        # the value is an ID if an autocomplete choice was picked, but users can type anything
+        result = None
+        if argument.isdigit():
+            object_id = int(argument)
+            if error is errors.MemberNotFound:
+                result = guild.get_member(object_id)
+            elif error is errors.RoleNotFound:
+                result = guild.get_role(object_id)
+            else:
+                result = guild.get_channel_or_thread(object_id)
+
+        if result is None:
+            if error is errors.MemberNotFound:
+                result = guild.get_member_named(argument)
+            elif error is errors.RoleNotFound:
+                result = disnake.utils.get(guild.roles, name=argument)
+            else:
+                result = disnake.utils.get(guild.channels, name=argument)
+
+        if result is None or (channel_types is not None and result.type not in channel_types):
+            raise error(argument)
+        return result
+
+    return convert
+
+
 class ParamInfo:
     """
     A class that basically connects function params with slash command options.
@@ -385,6 +472,7 @@ class ParamInfo:
         if doc:
             self.parse_doc(doc["type"], doc["description"])
         self.parse_annotation(type_hints.get(param.name, param.annotation))
+        self.parse_cache_autocomplete()
 
         return self
 
@@ -443,6 +531,19 @@ class ParamInfo:
         except Exception as e:
             raise errors.ConversionError(self.converter, e) from e
 
+    def _get_converter(self) -> Optional[Callable[[CommandInteraction, Any], Awaitable[Any]]]:
+        """Returns the function used to convert arguments, or ``None`` if they're used as-is"""
+        cls = type(self)
+        if (
+            cls.convert_argument is ParamInfo.convert_argument
+            and cls.verify_type is ParamInfo.verify_type
+            and not self.large
+            and self.converter is None
+            and not issubclass_(self.type, disnake.Member)
+        ):
+            return None
+        return self.convert_argument
+
     def _parse_enum(self, annotation: Any) -> None:
         if isinstance(annotation, (EnumMeta, disnake.enums.EnumMeta)):
             self.choices = [OptionChoice(name, value.value) for name, value in annotation.__members__.items()]  # type: ignore
@@ -532,6 +633,44 @@ class ParamInfo:
 
         return True
 
+    def parse_cache_autocomplete(self) -> None:
+        """Replaces a type passed as ``autocomplete`` with a function that autocompletes
+        from the guild's cache"""
+        search_type = self.autocomplete
+        if not isinstance(search_type, type):
+            return
+
+        if not issubclass(
+            search_type,
+            (
+                disnake.Member,
+                disnake.User,
+                disnake.Role,
+                disnake.abc.GuildChannel,
+                disnake.Thread,
+                disnake.Emoji,
+            ),
+        ):
+            raise TypeError(f"{search_type!r} cannot be autocompleted from the cache")
+
+        channel_types = None
+        if issubclass(search_type, (disnake.abc.GuildChannel, disnake.Thread)):
+            channel_types = self.channel_types or _channel_type_factory(search_type) or None
+
+        self.autocomplete = _cache_autocompleter(search_type, channel_types)
+
+        # user, role and channel options don't support autocompletion,
+        # so the option becomes a string option with the ID as the value
+        if self.converter is None and self.discord_type in (
+            OptionType.user,
+            OptionType.role,
+            OptionType.channel,
+            OptionType.mentionable,
+        ):
+            self.type = str
+            self.channel_types = []
+            self.converter = _cache_converter(search_type, channel_types)
+
     def parse_converter_annotation(self, converter: Callable, fallback_annotation: Any) -> None:
         _, parameters = isolate_self(converter)
 
@@ -760,24 +899,85 @@ async def run_injections(
     return dict(resolved)
 
 
+class ParamFunction:
+    """A function utilizing ParamInfo with its parameters collected once, see `call_param_func`"""
+
+    __slots__ = (
+        "function",
+        "cog_param",
+        "inter_param",
+        "paraminfos",
+        "injections",
+        "_converters",
+        "_accepted",
+    )
+
+    def __init__(self, function: Callable) -> None:
+        self.function = function
+        self.cog_param, self.inter_param, self.paraminfos, injections = collect_params(function)
+        self.injections: Dict[str, ParamFunction] = {
+            name: ParamFunction(injection.function) for name, injection in injections.items()
+        }
+        self._converters = [(param, param._get_converter()) for param in self.paraminfos]
+
+        # which keyword arguments `safe_call` would pass on, `None` means all of them
+        sig = signature(function)
+        kinds = {p.kind for p in sig.parameters.values()}
+        if {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}.issubset(kinds):
+            raise TypeError(
+                "Cannot safely call a function with both *args and **kwargs. "
+                "If this is a wrapper please use functools.wraps to keep the signature correct"
+            )
+
+        accepted: List[str] = []
+        accepts_all = False
+        for parameter in sig.parameters.values():
+            if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                accepts_all = True
+                break
+            if parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
+                break
+            if parameter.kind is not inspect.Parameter.VAR_POSITIONAL:
+                accepted.append(parameter.name)
+        self._accepted: Optional[Tuple[str, ...]] = None if accepts_all else tuple(accepted)
+
+    async def __call__(self, interaction: CommandInteraction, *args: Any, **kwargs: Any) -> Any:
+        formatted_kwargs = format_kwargs(
+            interaction, self.cog_param, self.inter_param, *args, **kwargs
+        )
+        if self.injections:
+            formatted_kwargs.update(await self._run_injections(interaction, *args, **kwargs))
+        kwargs = formatted_kwargs
+
+        for param, converter in self._converters:
+            name = param.param_name
+            if name in kwargs:
+                if converter is not None:
+                    kwargs[name] = await converter(interaction, kwargs[name])
+            elif param.default is not ...:
+                kwargs[name] = await param.get_default(interaction)
+
+        accepted = self._accepted
+        if accepted is not None:
+            kwargs = {name: kwargs[name] for name in accepted if name in kwargs}
+
+        return await maybe_coroutine(self.function, **kwargs)
+
+    async def _run_injections(
+        self, interaction: CommandInteraction, *args: Any, **kwargs: Any
+    ) -> Dict[str, Any]:
+        async def _helper(name: str, injection: ParamFunction) -> Tuple[str, Any]:
+            return name, await injection(interaction, *args, **kwargs)
+
+        resolved = await asyncio.gather(*(_helper(n, i) for n, i in self.injections.items()))
+        return dict(resolved)
+
+
 async def call_param_func(
     function: Callable, interaction: CommandInteraction, *args: Any, **kwargs: Any
 ) -> Any:
     """Call a function utilizing ParamInfo"""
-    cog_param, inter_param, paraminfos, injections = collect_params(function)
-    formatted_kwargs = format_kwargs(interaction, cog_param, inter_param, *args, **kwargs)
-    formatted_kwargs.update(await run_injections(injections, interaction, *args, **kwargs))
-    kwargs = formatted_kwargs
-
-    for param in paraminfos:
-        if param.param_name in kwargs:
-            kwargs[param.param_name] = await param.convert_argument(
-                interaction, kwargs[param.param_name]
-            )
-        elif param.default is not ...:
-            kwargs[param.param_name] = await param.get_default(interaction)
-
-    return await maybe_coroutine(safe_call, function, **kwargs)
+    return await ParamFunction(function)(interaction, *args, **kwargs)
 
 
 def expand_params(command: AnySlashCommand) -> List[Option]:
@@ -854,6 +1054,16 @@ def Param(
     autocomplete: Callable[[:class:`ApplicationCommandInteraction`, :class:`str`], Any]
         A function that will suggest possible autocomplete options while typing.
         See :ref:`param_syntax`. Kwarg aliases: ``autocomp``.
+
+        This can also be :class:`~disnake.Member`, :class:`~disnake.Role`, a guild channel type
+        or :class:`~disnake.Emoji`, to suggest matching objects from the guild's cache
+        (see :meth:`Guild.match_members <disnake.Guild.match_members>` and similar).
+        Since member, role and channel options can't be autocompleted, options annotated
+        with these types are sent as string options and converted back from the chosen ID
+        or the typed name.
+
+        .. versionchanged:: 2.4
+            Types can be passed to autocomplete from the cache.
     channel_types: Iterable[:class:`ChannelType`]
         A list of channel types that should be allowed.
         By default these are discerned from the annotation.
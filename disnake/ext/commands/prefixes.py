@@ -0,0 +1,369 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from disnake.message import Message
+
+    from .bot_base import BotBase
+
+__all__ = ("GuildPrefixManager",)
+
+
+class PrefixTrie:
+    """A set of prefixes that can be matched against a string in a single pass.
+
+    If multiple prefixes match, the one that occurs first in the sequence wins,
+    the same as when checking each prefix in order.
+    """
+
+    __slots__ = ("prefixes", "_root")
+
+    def __init__(self, prefixes: Iterable[str]) -> None:
+        self.prefixes: Tuple[str, ...] = tuple(dict.fromkeys(prefixes))
+        # nested dicts keyed by character, the key `None` marks the end of a prefix
+        # and maps to the index of that prefix
+        root: Dict[Any, Any] = {}
+        for index, prefix in enumerate(self.prefixes):
+            if not isinstance(prefix, str):
+                raise TypeError(
+                    "Iterable command_prefix or list returned from get_prefix must "
+                    f"contain only strings, not {prefix.__class__.__name__}"
+                )
+            node = root
+            for char in prefix:
+                node = node.setdefault(char, {})
+            node[None] = index
+        self._root = root
+
+    def __len__(self) -> int:
+        return len(self.prefixes)
+
+    def may_match(self, content: str) -> bool:
+        # only checks the first character
+        root = self._root
+        return None in root or content[:1] in root
+
+    def match(self, content: str) -> Optional[str]:
+        node = self._root
+        best = node.get(None)
+        if best == 0:
+            return self.prefixes[0]
+
+        for char in content:
+            node = node.get(char)
+            if node is None:
+                break
+            index = node.get(None)
+            if index is not None and (best is None or index < best):
+                best = index
+                if index == 0:
+                    break
+
+        return None if best is None else self.prefixes[best]
+
+
+PrefixLoader = Callable[[int], Awaitable[Optional[Iterable[str]]]]
+
+
+class GuildPrefixManager:
+    """Manages per-guild command prefixes, loading them on demand and caching them in memory.
+
+    An instance of this can be passed as the ``command_prefix`` of a :class:`.Bot`.
+    In that case, messages are matched against the prefixes of their guild in a single
+    pass regardless of the number of prefixes, and messages that don't start with any
+    of them are ignored by :meth:`.Bot.process_commands` before a :class:`.Context` is created.
+
+    If multiple prefixes match a message, the one that occurs first wins,
+    just like with an iterable ``command_prefix``.
+
+    .. versionadded:: 2.4
+
+    Parameters
+    ----------
+    default: Union[:class:`str`, Iterable[:class:`str`]]
+        The prefixes used in direct messages and in guilds that don't have custom prefixes.
+    loader: Optional[Callable[[:class:`int`], Awaitable[Optional[Iterable[:class:`str`]]]]]
+        A coroutine function that takes a guild ID and loads the custom prefixes of that guild,
+        e.g. from a database. If this returns ``None``, the default prefixes are used.
+
+        The loader is called at most once per guild, concurrent messages wait for the same call.
+        Its result is cached until :meth:`invalidate` is called for the guild. If the loader
+        raises an exception, nothing is cached and the exception propagates to the caller.
+    mention: :class:`bool`
+        Whether mentioning the bot can be used as a prefix as well, in addition to the
+        guild's prefixes. Mention prefixes are checked first. Defaults to ``False``.
+    max_size: Optional[:class:`int`]
+        The maximum number of guilds to cache the prefixes of. If this is exceeded, the guilds
+        that were used least recently are removed from the cache. Defaults to ``None`` (unlimited).
+
+    Attributes
+    ----------
+    loader: Optional[Callable[[:class:`int`], Awaitable[Optional[Iterable[:class:`str`]]]]]
+        The function used to load the prefixes of a guild.
+    mention: :class:`bool`
+        Whether mentioning the bot can be used as a prefix.
+    max_size: Optional[:class:`int`]
+        The maximum number of guilds to cache the prefixes of.
+    """
+
+    def __init__(
+        self,
+        default: Union[str, Iterable[str]],
+        *,
+        loader: Optional[PrefixLoader] = None,
+        mention: bool = False,
+        max_size: Optional[int] = None,
+    ) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+
+        self._default: PrefixTrie = self._make_trie(default)
+        self.loader: Optional[PrefixLoader] = loader
+        self.mention: bool = mention
+        self.max_size: Optional[int] = max_size
+        self._cache: OrderedDict[int, PrefixTrie] = OrderedDict()
+        self._pending: Dict[int, asyncio.Task[PrefixTrie]] = {}
+        self._mention_prefixes: Optional[Tuple[str, ...]] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<GuildPrefixManager default={list(self._default.prefixes)!r} "
+            f"mention={self.mention} cached={len(self._cache)}>"
+        )
+
+    async def __call__(self, bot: BotBase, message: Message) -> List[str]:
+        # allows using the manager wherever a `command_prefix` callable is expected
+        trie = await self._get_trie(message.guild.id if message.guild else None)
+        return [*self._get_mention_prefixes(bot), *trie.prefixes]
+
+    @property
+    def default(self) -> List[str]:
+        """List[:class:`str`]: The default prefixes."""
+        return list(self._default.prefixes)
+
+    @default.setter
+    def default(self, value: Union[str, Iterable[str]]) -> None:
+        old, self._default = self._default, self._make_trie(value)
+        for guild_id, trie in self._cache.items():
+            if trie is old:
+                self._cache[guild_id] = self._default
+
+    async def match(self, bot: BotBase, message: Message) -> Optional[str]:
+        """|coro|
+
+        Returns the prefix the given message starts with, loading the prefixes
+        of the message's guild if necessary.
+
+        Parameters
+        ----------
+        bot: :class:`.Bot`
+            The bot the message was received by, used for mention prefixes.
+        message: :class:`disnake.Message`
+            The message to match.
+
+        Returns
+        -------
+        Optional[:class:`str`]
+            The matching prefix, or ``None`` if the message doesn't start with any prefix.
+        """
+        content = message.content
+        if self.mention and content.startswith("<@"):
+            for prefix in self._get_mention_prefixes(bot):
+                if content.startswith(prefix):
+                    return prefix
+
+        guild = message.guild
+        if guild is None:
+            return self._default.match(content)
+
+        trie = self._cache.get(guild.id)
+        if trie is None:
+            trie = await self._get_trie(guild.id)
+        elif self.max_size is not None:
+            self._cache.move_to_end(guild.id)
+        return trie.match(content)
+
+    async def fetch_prefixes(self, guild_id: int) -> List[str]:
+        """|coro|
+
+        Returns the prefixes of the given guild, excluding mention prefixes.
+        If they aren't cached, they're loaded using the :attr:`loader`.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+
+        Returns
+        -------
+        List[:class:`str`]
+            The prefixes of the guild.
+        """
+        trie = await self._get_trie(guild_id)
+        return list(trie.prefixes)
+
+    def get_cached_prefixes(self, guild_id: int) -> Optional[List[str]]:
+        """Returns the cached prefixes of the given guild, excluding mention prefixes.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+
+        Returns
+        -------
+        Optional[List[:class:`str`]]
+            The prefixes of the guild, or ``None`` if they aren't cached.
+        """
+        trie = self._cache.get(guild_id)
+        return None if trie is None else list(trie.prefixes)
+
+    def set_prefixes(self, guild_id: int, prefixes: Optional[Union[str, Iterable[str]]]) -> None:
+        """Sets the cached prefixes of the given guild.
+
+        This only updates the cache, persisting the prefixes is up to the caller.
+        Prefixes that are currently being loaded for the guild are discarded.
+
+        Parameters
+        ----------
+        guild_id: :class:`int`
+            The ID of the guild.
+        prefixes: Optional[Union[:class:`str`, Iterable[:class:`str`]]]
+            The new prefixes of the guild. ``None`` resets them to the default prefixes.
+
+        Raises
+        ------
+        ValueError
+            An empty iterable was passed.
+        """
+        trie = self._default if prefixes is None else self._make_trie(prefixes)
+        self._pending.pop(guild_id, None)
+        self._store(guild_id, trie)
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """Removes the prefixes of the given guild from the cache, which causes them
+        to be loaded again the next time they're needed.
+
+        Parameters
+        ----------
+        guild_id: Optional[:class:`int`]
+            The ID of the guild. If this is ``None``, the whole cache is cleared.
+        """
+        if guild_id is None:
+            self._cache.clear()
+            self._pending.clear()
+        else:
+            self._cache.pop(guild_id, None)
+            self._pending.pop(guild_id, None)
+
+    def _may_match(self, message: Message) -> bool:
+        # a synchronous check used by the message pre-filter, which only rejects
+        # messages that can't start with any of the cached prefixes of their guild
+        content = message.content
+        if self.mention and content.startswith("<@"):
+            return True
+
+        guild = message.guild
+        if guild is None:
+            trie = self._default
+        else:
+            trie = self._cache.get(guild.id)
+            if trie is None:
+                return True
+        return trie.may_match(content)
+
+    def _make_trie(self, prefixes: Union[str, Iterable[str]]) -> PrefixTrie:
+        if isinstance(prefixes, str):
+            prefixes = (prefixes,)
+        trie = PrefixTrie(prefixes)
+        if not trie:
+            raise ValueError("Iterable command_prefix must contain at least one prefix")
+        return trie
+
+    def _get_mention_prefixes(self, bot: BotBase) -> Tuple[str, ...]:
+        if not self.mention:
+            return ()
+        if self._mention_prefixes is None:
+            # bot.user will never be None when this is called
+            user_id = bot.user.id  # type: ignore
+            self._mention_prefixes = (f"<@{user_id}> ", f"<@!{user_id}> ")
+        return self._mention_prefixes
+
+    def _store(self, guild_id: int, trie: PrefixTrie) -> None:
+        cache = self._cache
+        cache[guild_id] = trie
+        if self.max_size is not None:
+            cache.move_to_end(guild_id)
+            while len(cache) > self.max_size:
+                cache.popitem(last=False)
+
+    async def _get_trie(self, guild_id: Optional[int]) -> PrefixTrie:
+        if guild_id is None:
+            return self._default
+
+        trie = self._cache.get(guild_id)
+        if trie is not None:
+            if self.max_size is not None:
+                self._cache.move_to_end(guild_id)
+            return trie
+
+        if self.loader is None:
+            return self._default
+
+        task = self._pending.get(guild_id)
+        if task is None:
+            task = asyncio.create_task(self._load(guild_id))
+            self._pending[guild_id] = task
+        # don't cancel the load for other waiters if this one is cancelled
+        return await asyncio.shield(task)
+
+    async def _load(self, guild_id: int) -> PrefixTrie:
+        task = asyncio.current_task()
+        try:
+            prefixes = await self.loader(guild_id)  # type: ignore
+            trie = self._default if prefixes is None else self._make_trie(prefixes)
+            # the prefixes may have been set or invalidated in the meantime
+            if self._pending.get(guild_id) is task:
+                self._store(guild_id, trie)
+            return trie
+        finally:
+            if self._pending.get(guild_id) is task:
+                del self._pending[guild_id]
@@ -33,6 +33,7 @@ from typing import (
     List,
     Optional,
     Sequence,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -44,12 +45,13 @@ from disnake.interactions import ApplicationCommandInteraction
 
 from .base_core import InvokableApplicationCommand, _get_overridden_method
 from .errors import *
-from .params import call_param_func, expand_params
+from .params import ParamFunction, expand_params
 
 if TYPE_CHECKING:
     from typing_extensions import Concatenate, ParamSpec
 
     from disnake.app_commands import Choices
+    from disnake.interactions.auto_defer import AutoDefer
 
     from .cog import CogT
 
@@ -150,6 +152,7 @@ class SubCommandGroup(InvokableApplicationCommand):
             name=self.name, description="-", type=OptionType.sub_command_group, options=[]
         )
         self.qualified_name: str = ""
+        self._parent: Optional[InvokableSlashCommand] = None
 
     def sub_command(
         self,
@@ -196,6 +199,8 @@ class SubCommandGroup(InvokableApplicationCommand):
             new_func.qualified_name = f"{qualified_name} {new_func.name}"
             self.children[new_func.name] = new_func
             self.option.options.append(new_func.option)
+            if self._parent is not None:
+                self._parent._dispatch_table = None
             return new_func
 
         return decorator
@@ -255,6 +260,8 @@ class SubCommand(InvokableApplicationCommand):
             options=options,
         )
         self.qualified_name = ""
+        # the parameters of the callback are collected once, when the command is created
+        self._param_func: ParamFunction = ParamFunction(func)
 
     @property
     def body(self) -> Option:
@@ -277,7 +284,7 @@ class SubCommand(InvokableApplicationCommand):
         await self.prepare(inter)
 
         try:
-            await call_param_func(self.callback, inter, self.cog, **kwargs)
+            await self._param_func(inter, self.cog, **kwargs)
         except CommandError:
             inter.command_failed = True
             raise
@@ -368,6 +375,13 @@ class InvokableSlashCommand(InvokableApplicationCommand):
             options=options or [],
             default_permission=default_permission,
         )
+        # the parameters of the callback are collected once, when the command is created
+        self._param_func: ParamFunction = ParamFunction(func)
+        # maps chains of subcommand (group) names to the group and subcommand to invoke,
+        # built on first use and reset whenever a child is added
+        self._dispatch_table: Optional[
+            Dict[Tuple[str, ...], Tuple[Optional[SubCommandGroup], Optional[SubCommand]]]
+        ] = None
 
     @property
     def description(self) -> str:
@@ -439,6 +453,7 @@ class InvokableSlashCommand(InvokableApplicationCommand):
             new_func.qualified_name = f"{self.qualified_name} {new_func.name}"
             self.children[new_func.name] = new_func
             self.body.options.append(new_func.option)
+            self._dispatch_table = None
             return new_func
 
         return decorator
@@ -478,8 +493,10 @@ class InvokableSlashCommand(InvokableApplicationCommand):
                 self.body.options = []
             new_func = SubCommandGroup(func, name=name, **kwargs)
             new_func.qualified_name = f"{self.qualified_name} {new_func.name}"
+            new_func._parent = self
             self.children[new_func.name] = new_func
             self.body.options.append(new_func.option)
+            self._dispatch_table = None
             return new_func
 
         return decorator
@@ -518,17 +535,7 @@ class InvokableSlashCommand(InvokableApplicationCommand):
 
     async def _call_relevant_autocompleter(self, inter: ApplicationCommandInteraction) -> None:
         chain, _ = inter.data._get_chain_and_kwargs()
-
-        if len(chain) == 0:
-            subcmd = None
-        elif len(chain) == 1:
-            subcmd = self.children.get(chain[0])
-        elif len(chain) == 2:
-            group = self.children.get(chain[0])
-            assert isinstance(group, SubCommandGroup)
-            subcmd = group.children.get(chain[1]) if group is not None else None
-        else:
-            raise ValueError("Command chain is too long")
+        _, subcmd = self._resolve_chain(chain)
 
         focused_option = inter.data.focused_option
 
@@ -542,21 +549,46 @@ class InvokableSlashCommand(InvokableApplicationCommand):
         if choices is not None:
             await inter.response.autocomplete(choices=choices)
 
+    def _resolve_chain(
+        self, chain: Tuple[str, ...]
+    ) -> Tuple[Optional[SubCommandGroup], Optional[Union[SubCommand, SubCommandGroup]]]:
+        if len(chain) > 2:
+            raise ValueError("Command chain is too long")
+
+        table = self._dispatch_table
+        if table is None:
+            table = self._dispatch_table = {}
+            for name, child in self.children.items():
+                table[(name,)] = (None, child)  # type: ignore
+                if isinstance(child, SubCommandGroup):
+                    for sub_name, subcmd in child.children.items():
+                        table[(name, sub_name)] = (child, subcmd)
+
+        try:
+            return table[chain]
+        except KeyError:
+            pass
+
+        # the group is still invoked if the subcommand doesn't exist
+        if len(chain) == 2:
+            _, group = table.get(chain[:1], (None, None))
+            if isinstance(group, SubCommandGroup):
+                return group, None
+        return None, None
+
+    def _get_auto_defer(self, inter: ApplicationCommandInteraction) -> Optional[AutoDefer]:
+        if self.children:
+            chain, _ = inter.data._get_chain_and_kwargs()
+            group, subcmd = self._resolve_chain(chain)
+            # the most specific policy applies
+            for cmd in (subcmd, group):
+                if cmd is not None and cmd.auto_defer is not None:
+                    return cmd.auto_defer
+        return self.auto_defer
+
     async def invoke_children(self, inter: ApplicationCommandInteraction):
         chain, kwargs = inter.data._get_chain_and_kwargs()
-
-        if len(chain) == 0:
-            group = None
-            subcmd = None
-        elif len(chain) == 1:
-            group = None
-            subcmd = self.children.get(chain[0])
-        elif len(chain) == 2:
-            group = self.children.get(chain[0])
-            assert isinstance(group, SubCommandGroup)
-            subcmd = group.children.get(chain[1]) if group is not None else None
-        else:
-            raise ValueError("Command chain is too long")
+        group, subcmd = self._resolve_chain(chain)
 
         if group is not None:
             try:
@@ -588,7 +620,7 @@ class InvokableSlashCommand(InvokableApplicationCommand):
                 for k, v in self.connectors.items():
                     if k in kwargs:
                         kwargs[v] = kwargs.pop(k)
-                await call_param_func(self.callback, inter, self.cog, **kwargs)
+                await self._param_func(inter, self.cog, **kwargs)
         except CommandError:
             inter.command_failed = True
             raise
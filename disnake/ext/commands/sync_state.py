@@ -0,0 +1,169 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+import disnake
+from disnake.app_commands import application_command_factory
+
+if TYPE_CHECKING:
+    from disnake.app_commands import APIApplicationCommand, ApplicationCommand
+
+__all__ = ()
+
+_log = logging.getLogger(__name__)
+
+# bump this whenever the format of the file changes
+_STATE_VERSION = 1
+
+
+def hash_commands(commands: Iterable[ApplicationCommand]) -> str:
+    """Returns a stable hash of the API representation of the given commands,
+    which doesn't depend on their order.
+    """
+    entries = sorted(
+        json.dumps([cmd._always_synced, cmd.to_dict()], sort_keys=True, separators=(",", ":"))
+        for cmd in commands
+    )
+    return hashlib.sha256("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def _command_to_dict(command: APIApplicationCommand) -> Dict[str, Any]:
+    # the inverse of `application_command_factory`
+    data: Dict[str, Any] = dict(command.to_dict())
+    data["id"] = str(command.id)
+    data["application_id"] = str(command.application_id)
+    data["version"] = str(command.version)
+    if command.guild_id is not None:
+        data["guild_id"] = str(command.guild_id)
+    return data
+
+
+class CommandSyncState:
+    """The synced application commands of an application, which are stored in a file between runs.
+
+    For each scope (``None`` for global commands, or a guild ID), this holds the hash of the
+    commands in the code when they were last synced and the commands that were returned by the API.
+    If the hash of a scope matches the commands in the code, it doesn't need to be synced again.
+    """
+
+    def __init__(self, path: str, application_id: int) -> None:
+        self.path: str = path
+        self.application_id: int = application_id
+        self._scopes: Dict[str, Dict[str, Any]] = {}
+        self._dirty: bool = False
+
+    @classmethod
+    def load(cls, path: str, application_id: Optional[int]) -> CommandSyncState:
+        """Loads the state from the given file. If the file doesn't exist or belongs to
+        another application or library version, the state is empty.
+
+        If ``application_id`` is ``None``, the state is loaded regardless of the application
+        it belongs to, and :attr:`application_id` is set to that application.
+        """
+        self = cls(path, application_id)  # type: ignore
+        try:
+            with open(path, "r", encoding="utf-8") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return self
+        except (OSError, ValueError) as e:
+            _log.warning("Ignoring invalid application command sync state in %r: %s", path, e)
+            return self
+
+        if (
+            isinstance(data, dict)
+            and data.get("version") == _STATE_VERSION
+            and data.get("library_version") == disnake.__version__
+            and (application_id is None or data.get("application_id") == str(application_id))
+            and isinstance(data.get("scopes"), dict)
+        ):
+            self._scopes = data["scopes"]
+            if application_id is None:
+                self.application_id = int(data["application_id"])
+        return self
+
+    @staticmethod
+    def _key(scope: Optional[int]) -> str:
+        return "global" if scope is None else str(scope)
+
+    def get_hash(self, scope: Optional[int]) -> Optional[str]:
+        entry = self._scopes.get(self._key(scope))
+        return None if entry is None else entry.get("hash")
+
+    def get_commands(self, scope: Optional[int]) -> Optional[List[APIApplicationCommand]]:
+        entry = self._scopes.get(self._key(scope))
+        if entry is None:
+            return None
+        try:
+            return [application_command_factory(data) for data in entry["commands"]]
+        except Exception as e:
+            _log.warning("Ignoring invalid application command sync state for %r: %s", scope, e)
+            self.discard(scope)
+            return None
+
+    def set(
+        self, scope: Optional[int], hash: str, commands: Iterable[APIApplicationCommand]
+    ) -> None:
+        self._scopes[self._key(scope)] = {
+            "hash": hash,
+            "commands": [_command_to_dict(cmd) for cmd in commands],
+        }
+        self._dirty = True
+
+    def discard(self, scope: Optional[int]) -> None:
+        if self._scopes.pop(self._key(scope), None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Writes the state to its file if it was changed. The file is replaced atomically."""
+        if not self._dirty:
+            return
+
+        data = {
+            "version": _STATE_VERSION,
+            "library_version": disnake.__version__,
+            "application_id": str(self.application_id),
+            "scopes": self._scopes,
+        }
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".disnake-sync-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(data, fp, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self._dirty = False
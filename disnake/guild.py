@@ -27,12 +27,14 @@ from __future__ import annotations
 
 import copy
 import datetime
+import itertools
 import unicodedata
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
     Dict,
+    Iterable,
     List,
     Literal,
     Mapping,
@@ -76,10 +78,11 @@ from .flags import SystemChannelFlags
 from .guild_scheduled_event import GuildScheduledEvent, GuildScheduledEventMetadata
 from .integrations import Integration, _integration_factory
 from .invite import Invite
-from .iterators import AuditLogIterator, MemberIterator
+from .iterators import AuditLogIterator, GatewayMemberIterator, MemberIterator
 from .member import Member, VoiceState
 from .mixins import Hashable
-from .permissions import PermissionOverwrite
+from .name_index import NameIndex, top_matches
+from .permissions import PermissionOverwrite, Permissions
 from .role import Role
 from .stage_instance import StageInstance
 from .sticker import GuildSticker
@@ -92,11 +95,34 @@ __all__ = ("Guild",)
 VocalGuildChannel = Union[VoiceChannel, StageChannel]
 MISSING = utils.MISSING
 
+# attributes that aren't set until a lazily created guild is materialized
+_LAZY_GUILD_ATTRIBUTES = frozenset(
+    (
+        "afk_channel",
+        "_channels",
+        "_threads",
+        "_voice_states",
+        "_stage_instances",
+        "_scheduled_events",
+    )
+)
+# the parts of the payload that are needed to materialize a lazily created guild
+_LAZY_GUILD_PAYLOAD_KEYS = (
+    "channels",
+    "threads",
+    "voice_states",
+    "stage_instances",
+    "guild_scheduled_events",
+    "afk_channel_id",
+)
+# the maximum number of members `Guild.match_members` checks one by one
+# if the member name index can't be used
+_MAX_SCANNED_MEMBERS = 2000
+
 if TYPE_CHECKING:
     from .abc import Snowflake, SnowflakeTime, User as ABCUser
     from .app_commands import APIApplicationCommand
     from .channel import CategoryChannel, StageChannel, StoreChannel, TextChannel, VoiceChannel
-    from .permissions import Permissions
     from .state import ConnectionState
     from .template import Template
     from .types.guild import Ban as BanPayload, Guild as GuildPayload, GuildFeature, MFALevel
@@ -305,8 +331,14 @@ class Guild(Hashable):
         "_stage_instances",
         "_scheduled_events",
         "_threads",
+        "_lazy_data",
+        "_permission_cache",
+        "_member_name_index",
     )
 
+    # the maximum number of cached permission values per guild
+    _PERMISSION_CACHE_SIZE: ClassVar[int] = 8192
+
     _PREMIUM_GUILD_LIMITS: ClassVar[Dict[Optional[int], _GuildLimit]] = {
         None: _GuildLimit(emoji=50, stickers=0, bitrate=96e3, filesize=8388608),
         0: _GuildLimit(emoji=50, stickers=0, bitrate=96e3, filesize=8388608),
@@ -316,13 +348,59 @@ class Guild(Hashable):
     }
 
     def __init__(self, *, data: GuildPayload, state: ConnectionState):
-        self._channels: Dict[int, GuildChannel] = {}
         self._members: Dict[int, Member] = {}
-        self._voice_states: Dict[int, VoiceState] = {}
-        self._threads: Dict[int, Thread] = {}
+        self._member_name_index: Optional[NameIndex] = (
+            NameIndex(substrings=True) if state._index_member_names else None
+        )
         self._state: ConnectionState = state
+
+        # the JSON-encoded payload of a guild whose channels, threads, voice states etc.
+        # are only materialized once they're first accessed, see `__getattr__`
+        self._lazy_data: Optional[str] = None
+        if state._lazy_guilds and "channels" in data:
+            self._lazy_data = ""
+        else:
+            self._channels: Dict[int, GuildChannel] = {}
+            self._voice_states: Dict[int, VoiceState] = {}
+            self._threads: Dict[int, Thread] = {}
+
         self._from_data(data)
 
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # this is only called if an attribute isn't set, which is the case for the
+            # collections of a lazily created guild that hasn't been materialized yet
+            if name in _LAZY_GUILD_ATTRIBUTES and self._lazy_data is not None:
+                self._materialize()
+                return getattr(self, name)
+            raise AttributeError(f"{self.__class__.__name__!r} object has no attribute {name!r}")
+
+    def _materialize(self) -> None:
+        data = self._lazy_data
+        if data is None:
+            return
+
+        self._lazy_data = None
+        self._channels = {}
+        self._voice_states = {}
+        self._threads = {}
+        payload = utils._from_json(data)
+        self._map_lazy_channels(payload, remove=True)
+        self._from_collections_data(payload)
+
+    def _map_lazy_channels(self, data: Dict[str, Any], /, *, remove: bool = False) -> None:
+        # maps the IDs of the channels and threads in the payload of a lazily created guild
+        # to the guild, so that they can be looked up without materializing any guild
+        lazy_channels = self._state._lazy_guild_channels
+        for key in ("channels", "threads"):
+            for c in data.get(key, ()):
+                channel_id = int(c["id"])
+                if not remove:
+                    lazy_channels[channel_id] = self.id
+                elif lazy_channels.get(channel_id) == self.id:
+                    del lazy_channels[channel_id]
+
     def _add_channel(self, channel: GuildChannel, /) -> None:
         self._channels[channel.id] = channel
 
@@ -334,6 +412,13 @@ class Guild(Hashable):
 
     def _add_member(self, member: Member, /) -> None:
         self._members[member.id] = member
+        if self._member_name_index is not None:
+            self._member_name_index.set(member.id, (member.name, member.nick))
+
+    def _reindex_member(self, member: Member, /) -> None:
+        # called after the name or nickname of a cached member may have changed
+        if self._member_name_index is not None and self._members.get(member.id) is member:
+            self._member_name_index.set(member.id, (member.name, member.nick))
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
         thread = Thread(guild=self, state=self._state, data=payload)
@@ -342,6 +427,8 @@ class Guild(Hashable):
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        if self._member_name_index is not None:
+            self._member_name_index.discard(member.id)
 
     def _add_thread(self, thread: Thread, /) -> None:
         self._threads[thread.id] = thread
@@ -419,10 +506,12 @@ class Guild(Hashable):
             r.position += not r.is_default()
 
         self._roles[role.id] = role
+        self._permission_cache.clear()
 
     def _remove_role(self, role_id: int, /) -> Role:
         # this raises KeyError if it fails..
         role = self._roles.pop(role_id)
+        self._permission_cache.clear()
 
         # since it didn't, we can change the positions now
         # basically the same as above except we only decrement
@@ -486,6 +575,11 @@ class Guild(Hashable):
         self._banner: Optional[str] = guild.get("banner")
         self.unavailable: bool = guild.get("unavailable", False)
         self.id: int = int(guild["id"])
+        # (channel ID, member ID) -> (member roles, channel overwrites, permissions value),
+        # this is reset here since roles and the owner may have changed
+        self._permission_cache: Dict[
+            Tuple[int, int], Tuple[utils.SnowflakeList, Optional[List[Any]], int]
+        ] = {}
         self._roles: Dict[int, Role] = {}
         state = self._state  # speed up attribute access
         for r in guild.get("roles", []):
@@ -520,16 +614,6 @@ class Guild(Hashable):
         self.approximate_presence_count: Optional[int] = guild.get("approximate_presence_count")
         self.approximate_member_count: Optional[int] = guild.get("approximate_member_count")
 
-        self._stage_instances: Dict[int, StageInstance] = {}
-        for s in guild.get("stage_instances", []):
-            stage_instance = StageInstance(guild=self, data=s, state=state)
-            self._stage_instances[stage_instance.id] = stage_instance
-
-        self._scheduled_events: Dict[int, GuildScheduledEvent] = {}
-        for e in guild.get("guild_scheduled_events", []):
-            scheduled_event = GuildScheduledEvent(state=state, data=e)
-            self._scheduled_events[scheduled_event.id] = scheduled_event
-
         cache_joined = self._state.member_cache_flags.joined
         self_id = self._state.self_id
         for mdata in guild.get("members", []):
@@ -542,6 +626,45 @@ class Guild(Hashable):
         self._large: Optional[bool] = None if member_count is None else self._member_count >= 250
 
         self.owner_id: Optional[int] = utils._get_as_snowflake(guild, "owner_id")
+
+        if self._lazy_data is None:
+            self._from_collections_data(guild)
+        elif "channels" in guild:
+            if self._lazy_data:
+                self._map_lazy_channels(utils._from_json(self._lazy_data), remove=True)
+            data = {k: guild[k] for k in _LAZY_GUILD_PAYLOAD_KEYS if k in guild}
+            self._map_lazy_channels(data)
+            self._lazy_data = utils._to_json(data)
+        else:
+            # keep the pending payload up to date with partial updates
+            data = utils._from_json(self._lazy_data)
+            data["afk_channel_id"] = guild.get("afk_channel_id")
+            self._lazy_data = utils._to_json(data)
+
+    def _from_collections_data(self, guild: GuildPayload) -> None:
+        state = self._state
+        self._stage_instances: Dict[int, StageInstance] = {}
+        for s in guild.get("stage_instances", []):
+            stage_instance = StageInstance(guild=self, data=s, state=state)
+            self._stage_instances[stage_instance.id] = stage_instance
+
+        self._scheduled_events: Dict[int, GuildScheduledEvent] = {}
+        for e in guild.get("guild_scheduled_events", []):
+            scheduled_event = GuildScheduledEvent(state=state, data=e)
+            self._scheduled_events[scheduled_event.id] = scheduled_event
+
+        if "channels" in guild:
+            channels = guild["channels"]
+            for c in channels:
+                factory, ch_type = _guild_channel_factory(c["type"])
+                if factory:
+                    self._add_channel(factory(guild=self, data=c, state=state))  # type: ignore
+
+        if "threads" in guild:
+            threads = guild["threads"]
+            for thread in threads:
+                self._add_thread(Thread(guild=self, state=state, data=thread))
+
         self.afk_channel: Optional[VocalGuildChannel] = self.get_channel(utils._get_as_snowflake(guild, "afk_channel_id"))  # type: ignore
 
         for obj in guild.get("voice_states", []):
@@ -561,18 +684,6 @@ class Guild(Hashable):
             if member is not None:
                 member._presence_update(presence, empty_tuple)  # type: ignore
 
-        if "channels" in data:
-            channels = data["channels"]
-            for c in channels:
-                factory, ch_type = _guild_channel_factory(c["type"])
-                if factory:
-                    self._add_channel(factory(guild=self, data=c, state=self._state))  # type: ignore
-
-        if "threads" in data:
-            threads = data["threads"]
-            for thread in threads:
-                self._add_thread(Thread(guild=self, state=self._state, data=thread))
-
     @property
     def channels(self) -> List[GuildChannel]:
         """List[:class:`abc.GuildChannel`]: A list of channels that belongs to this guild."""
@@ -866,6 +977,86 @@ class Guild(Hashable):
         """
         return self._roles.get(role_id)
 
+    def _cache_permissions_value(
+        self,
+        key: Tuple[int, int],
+        roles: utils.SnowflakeList,
+        overwrites: Optional[List[Any]],
+        value: int,
+    ) -> None:
+        cache = self._permission_cache
+        if len(cache) >= self._PERMISSION_CACHE_SIZE:
+            cache.clear()
+        cache[key] = (roles, overwrites, value)
+
+    def _get_base_permissions_value(self, member: Member, /) -> int:
+        # guild-wide permissions of the member, these are cached with a channel ID of 0
+        key = (0, member.id)
+        roles = member._roles
+        entry = self._permission_cache.get(key)
+        if entry is not None and entry[0] is roles:
+            return entry[2]
+
+        if self.owner_id == member.id:
+            value = Permissions.all().value
+        else:
+            get_role = self._roles.get
+            default = get_role(self.id)
+            value = default._permissions if default is not None else 0
+            for role_id in roles:
+                role = get_role(role_id)
+                if role is not None:
+                    value |= role._permissions
+
+            if value & Permissions.administrator.flag:
+                value = Permissions.all().value
+
+        self._cache_permissions_value(key, roles, None, value)
+        return value
+
+    def bulk_permissions_for(
+        self,
+        members: Iterable[Member],
+        channels: Iterable[abc.GuildChannel],
+        *,
+        ignore_timeout: bool = True,
+    ) -> Dict[Tuple[int, int], Permissions]:
+        """Resolves the permissions of multiple members in multiple channels of this guild.
+
+        This is equivalent to calling :meth:`abc.GuildChannel.permissions_for` for each
+        combination of member and channel, but only computes the guild-wide permissions
+        of each member once. Resolved permissions are cached until the relevant roles,
+        permission overwrites or the member's roles change.
+
+        .. versionadded:: 2.4
+
+        Parameters
+        ----------
+        members: Iterable[:class:`Member`]
+            The members to resolve the permissions for.
+        channels: Iterable[:class:`abc.GuildChannel`]
+            The channels to resolve the permissions in.
+        ignore_timeout: :class:`bool`
+            Whether or not to ignore the members' timeouts. Defaults to ``True``.
+
+        Returns
+        -------
+        Dict[Tuple[:class:`int`, :class:`int`], :class:`Permissions`]
+            The resolved permissions, keyed by ``(member_id, channel_id)``.
+        """
+        channels = list(channels)
+        result: Dict[Tuple[int, int], Permissions] = {}
+        for member in members:
+            # this primes the cached guild-wide permissions of the member,
+            # which are then reused for each channel
+            self._get_base_permissions_value(member)
+            for channel in channels:
+                result[member.id, channel.id] = channel.permissions_for(
+                    member, ignore_timeout=ignore_timeout
+                )
+
+        return result
+
     @property
     def default_role(self) -> Role:
         """:class:`Role`: Gets the @everyone role that all members have by default."""
@@ -1052,6 +1243,10 @@ class Guild(Hashable):
             then ``None`` is returned.
         """
 
+        index = self._member_name_index
+        if index is not None:
+            return self._get_member_named_indexed(index, name)
+
         result = None
         members = self.members
         if len(name) > 5 and name[-5] == "#":
@@ -1071,6 +1266,234 @@ class Guild(Hashable):
 
         return utils.find(pred, members)
 
+    def _get_member_named_indexed(self, index: NameIndex, name: str, /) -> Optional[Member]:
+        get_member = self._members.get
+        if len(name) > 5 and name[-5] == "#":
+            username = name[:-5]
+            discriminator = name[-4:]
+            for member_id in index.get(username):
+                member = get_member(member_id)
+                if (
+                    member is not None
+                    and member.name == username
+                    and member.discriminator == discriminator
+                ):
+                    return member
+
+        for member_id in index.get(name):
+            member = get_member(member_id)
+            if member is not None and (member.nick == name or member.name == name):
+                return member
+        return None
+
+    def get_members_by_prefix(self, prefix: str, /, *, limit: Optional[int] = 25) -> List[Member]:
+        """Returns the cached members whose username or nickname starts with the given prefix.
+
+        The search is case-insensitive and the results are sorted alphabetically by the matching
+        name. If the client was created with ``member_name_index=True``, this uses an index
+        of member names instead of scanning all members.
+
+        .. versionadded:: 2.4
+
+        Parameters
+        ----------
+        prefix: :class:`str`
+            The prefix to search for.
+        limit: Optional[:class:`int`]
+            The maximum number of members to return. Pass ``None`` to return all matching members.
+            Defaults to ``25``.
+
+        Returns
+        -------
+        List[:class:`Member`]
+            The members whose username or nickname starts with the prefix.
+        """
+        index = self._member_name_index
+        if index is None:
+            index = NameIndex()
+            for member in self._members.values():
+                index.set(member.id, (member.name, member.nick))
+
+        result: List[Member] = []
+        if limit is not None and limit <= 0:
+            return result
+
+        get_member = self._members.get
+        for member_id in index.search(prefix):
+            member = get_member(member_id)
+            if member is None:
+                continue
+            result.append(member)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def match_members(self, query: str, /, *, limit: int = 25, fuzzy: bool = True) -> List[Member]:
+        """Searches the cached members by username and nickname.
+
+        The search is case-insensitive. Exact matches are returned first, followed by
+        prefix matches, substring matches and, if ``fuzzy`` is ``True``, members whose
+        names contain the characters of the query in order.
+
+        This is intended for local autocompletion, see :func:`~ext.commands.Param`.
+        Without the member name index, every cached member is checked, so the cost grows
+        linearly with the number of members.
+
+        If the client was created with ``member_name_index=True``, prefix matches and
+        substring matches of queries with at least 3 characters are found using the index,
+        which only costs time proportional to the number of matches. Substring matches
+        of shorter queries and fuzzy matches can't be found using the index, so only the
+        first 2000 cached members are checked for them, and only if there are less than
+        ``limit`` matches otherwise.
+
+        .. versionadded:: 2.4
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The text to search for.
+        limit: :class:`int`
+            The maximum number of members to return. Defaults to ``25``.
+        fuzzy: :class:`bool`
+            Whether to also return fuzzy matches. Defaults to ``True``.
+
+        Returns
+        -------
+        List[:class:`Member`]
+            The matching members, best matches first.
+        """
+        if limit <= 0:
+            return []
+
+        def get_names(member: Member) -> Tuple[str, Optional[str]]:
+            return (member.name, member.nick)
+
+        if self._member_name_index is None:
+            return top_matches(query, self._members.values(), get_names, limit, fuzzy=fuzzy)
+
+        result = self.get_members_by_prefix(query, limit=limit)
+        if len(result) >= limit:
+            return result
+
+        found = {member.id for member in result}
+        candidates = self._member_name_index.search_substring(query)
+        if candidates is not None:
+            members = self._members
+            rest = (members[id] for id in candidates if id not in found)
+            matches = top_matches(
+                query,
+                itertools.islice(rest, _MAX_SCANNED_MEMBERS),
+                get_names,
+                limit - len(result),
+                fuzzy=False,
+            )
+            result.extend(matches)
+            if not fuzzy or len(result) >= limit:
+                return result
+            found.update(member.id for member in matches)
+
+        # the remaining matches can't be found using the index, so the scan is bounded
+        rest = (m for m in self._members.values() if m.id not in found)
+        result.extend(
+            top_matches(
+                query,
+                itertools.islice(rest, _MAX_SCANNED_MEMBERS),
+                get_names,
+                limit - len(result),
+                fuzzy=fuzzy,
+            )
+        )
+        return result
+
+    def match_roles(self, query: str, /, *, limit: int = 25, fuzzy: bool = True) -> List[Role]:
+        """Searches the guild's roles by name.
+
+        This works the same way as :meth:`match_members`.
+
+        .. versionadded:: 2.4
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The text to search for.
+        limit: :class:`int`
+            The maximum number of roles to return. Defaults to ``25``.
+        fuzzy: :class:`bool`
+            Whether to also return fuzzy matches. Defaults to ``True``.
+
+        Returns
+        -------
+        List[:class:`Role`]
+            The matching roles, best matches first.
+        """
+        return top_matches(query, self._roles.values(), lambda r: (r.name,), limit, fuzzy=fuzzy)
+
+    def match_channels(
+        self,
+        query: str,
+        /,
+        *,
+        limit: int = 25,
+        fuzzy: bool = True,
+        channel_types: Optional[Iterable[ChannelType]] = None,
+    ) -> List[Union[GuildChannel, Thread]]:
+        """Searches the guild's channels by name.
+
+        This works the same way as :meth:`match_members`.
+
+        .. versionadded:: 2.4
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The text to search for.
+        limit: :class:`int`
+            The maximum number of channels to return. Defaults to ``25``.
+        fuzzy: :class:`bool`
+            Whether to also return fuzzy matches. Defaults to ``True``.
+        channel_types: Optional[Iterable[:class:`ChannelType`]]
+            The channel types to search for. If this is given, threads are searched as well.
+
+        Returns
+        -------
+        List[Union[:class:`abc.GuildChannel`, :class:`Thread`]]
+            The matching channels, best matches first.
+        """
+        channels: Iterable[Union[GuildChannel, Thread]]
+        if channel_types is None:
+            channels = self._channels.values()
+        else:
+            types = set(channel_types)
+            channels = (
+                c
+                for c in itertools.chain(self._channels.values(), self._threads.values())
+                if c.type in types
+            )
+        return top_matches(query, channels, lambda c: (c.name,), limit, fuzzy=fuzzy)
+
+    def match_emojis(self, query: str, /, *, limit: int = 25, fuzzy: bool = True) -> List[Emoji]:
+        """Searches the guild's custom emojis by name.
+
+        This works the same way as :meth:`match_members`.
+
+        .. versionadded:: 2.4
+
+        Parameters
+        ----------
+        query: :class:`str`
+            The text to search for.
+        limit: :class:`int`
+            The maximum number of emojis to return. Defaults to ``25``.
+        fuzzy: :class:`bool`
+            Whether to also return fuzzy matches. Defaults to ``True``.
+
+        Returns
+        -------
+        List[:class:`Emoji`]
+            The matching emojis, best matches first.
+        """
+        return top_matches(query, self.emojis, lambda e: (e.name,), limit, fuzzy=fuzzy)
+
     def _create_channel(
         self,
         name: str,
@@ -3236,6 +3659,75 @@ class Guild(Hashable):
         if not self._state.is_guild_evicted(self):
             await self._state.chunk_guild(self, cache=cache)
 
+    def stream_members(
+        self, *, presences: bool = False, cache: bool = True, timeout: float = 30.0
+    ) -> GatewayMemberIterator:
+        """Retrieves an :class:`.AsyncIterator` that receives all members that belong to this guild
+        through the gateway. In order to use this, :meth:`Intents.members` must be enabled.
+
+        Unlike :meth:`chunk`, members are yielded as soon as each chunk of members arrives,
+        instead of being collected until the whole guild has been received.
+        Combined with ``cache=False``, this allows processing the members of large guilds
+        without keeping all of them in memory.
+
+        The number of guilds that are streamed at the same time is limited by the
+        ``max_concurrent_member_streams`` parameter of the :class:`Client`, additional
+        streams wait until a slot becomes available. A slot is released once all members were
+        received, waiting for a chunk times out, or the iterator is discarded.
+
+        This is a websocket operation and can be slow.
+
+        .. versionadded:: 2.4
+
+        .. note::
+
+            Discord sends the chunks at its own pace, chunks that have been received but not
+            consumed yet are queued until the iterator gets to them.
+
+        Parameters
+        -----------
+        presences: :class:`bool`
+            Whether to request for presences to be provided. This defaults
+            to ``False``.
+        cache: :class:`bool`
+            Whether to cache the members internally. Defaults to ``True``.
+        timeout: :class:`float`
+            The maximum number of seconds to wait for each chunk. Defaults to ``30``.
+
+        Raises
+        -------
+        asyncio.TimeoutError
+            Timed out waiting for a chunk of members.
+        ClientException
+            The members or presences intent is not enabled.
+
+        Yields
+        -------
+        :class:`.Member`
+            The member with the member data parsed.
+
+        Examples
+        ---------
+
+        Usage ::
+
+            async for member in guild.stream_members(cache=False):
+                print(member.name)
+
+        Processing members in batches ::
+
+            async for members in guild.stream_members(cache=False).chunk(1000):
+                await export(members)
+        """
+
+        if not self._state._intents.members:
+            raise ClientException("Intents.members must be enabled to use this.")
+
+        if presences and not self._state._intents.presences:
+            raise ClientException("Intents.presences must be enabled to use this.")
+
+        return GatewayMemberIterator(self, presences=presences, cache=cache, timeout=timeout)
+
     async def query_members(
         self,
         query: Optional[str] = None,
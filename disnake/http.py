@@ -26,9 +26,11 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import re
 import sys
+import time
 import weakref
 from typing import (
     TYPE_CHECKING,
@@ -41,7 +43,6 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
-    Type,
     TypeVar,
     Union,
 )
@@ -65,8 +66,6 @@ from .utils import MISSING
 _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from types import TracebackType
-
     from .enums import AuditLogAction, InteractionResponseType
     from .file import File
     from .message import Attachment
@@ -95,8 +94,6 @@ if TYPE_CHECKING:
     from .types.snowflake import Snowflake, SnowflakeList
 
     T = TypeVar("T")
-    BE = TypeVar("BE", bound=BaseException)
-    MU = TypeVar("MU", bound="MaybeUnlock")
     Response = Coroutine[Any, Any, T]
 
 
@@ -193,25 +190,95 @@ class Route:
         return f"{self.channel_id}:{self.guild_id}:{self.path}"
 
 
-class MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock: asyncio.Lock = lock
-        self._unlock: bool = True
+class RateLimiter:
+    """Keeps track of the rate limits of the API. It is shared between :class:`HTTPClient`
+    and the webhook adapters, so that requests made through either of them wait for
+    the same buckets and global rate limit.
 
-    def __enter__(self: MU) -> MU:
-        return self
+    Bucket keys consist of the bucket hash returned by the API (or the route, if it
+    isn't known yet) and the major parameters of the route. Since the global rate limit
+    and most buckets apply per bot, they are tracked per token.
+    Webhook buckets are independent of the authorization.
 
-    def defer(self) -> None:
-        self._unlock = False
+    The state only consists of timestamps, it can be used from multiple threads and event loops.
+    """
 
-    def __exit__(
-        self,
-        exc_type: Optional[Type[BE]],
-        exc: Optional[BE],
-        traceback: Optional[TracebackType],
-    ) -> None:
-        if self._unlock:
-            self.lock.release()
+    # the minimum number of buckets after which expired ones are removed
+    _PRUNE_THRESHOLD: ClassVar[int] = 256
+
+    def __init__(self) -> None:
+        # (method, path) -> bucket hash from the `X-Ratelimit-Bucket` header
+        self._hashes: Dict[Tuple[str, str], str] = {}
+        # bucket key -> monotonic time at which the bucket can be used again
+        self._resets: Dict[str, float] = {}
+        # token scope -> monotonic time at which the global rate limit is over
+        self._global_resets: Dict[int, float] = {}
+        # tokens are mapped to small IDs, so they don't end up in bucket keys and logs
+        self._scopes: Dict[Optional[str], int] = {}
+        self._scope_ids = itertools.count()
+        self._prune_at: int = self._PRUNE_THRESHOLD
+
+    def _scope(self, token: Optional[str]) -> int:
+        scope = self._scopes.get(token)
+        if scope is None:
+            scope = self._scopes.setdefault(token, next(self._scope_ids))
+        return scope
+
+    def get_key(self, route: Route, token: Optional[str]) -> str:
+        bucket = self._hashes.get((route.method, route.path)) or f"{route.method} {route.path}"
+        if route.webhook_token is not None:
+            return f"{bucket}:{route.webhook_id}"
+        return (
+            f"{self._scope(token)}:{bucket}:{route.channel_id}:{route.guild_id}:{route.webhook_id}"
+        )
+
+    def get_delay(self, route: Route, key: str, token: Optional[str]) -> float:
+        """Returns the number of seconds to wait before making a request to the given bucket."""
+        reset = self._resets.get(key, 0.0)
+        # interaction responses aren't bound to the global rate limit
+        if not route.path.startswith("/interactions/"):
+            reset = max(reset, self._global_resets.get(self._scope(token), 0.0))
+        return max(reset - time.monotonic(), 0.0)
+
+    def update(
+        self, route: Route, token: Optional[str], response: Any, *, use_clock: bool = False
+    ) -> Optional[float]:
+        """Updates the state from the headers of a response. If the bucket
+        has been exhausted, returns the number of seconds until it resets.
+        """
+        headers = response.headers
+        bucket_hash = headers.get("X-Ratelimit-Bucket")
+        if bucket_hash is not None:
+            self._hashes[(route.method, route.path)] = bucket_hash
+
+        if headers.get("X-Ratelimit-Remaining") != "0":
+            return None
+        delta = utils._parse_ratelimit_header(response, use_clock=use_clock)
+        self.limit_bucket(self.get_key(route, token), delta)
+        return delta
+
+    def limit_bucket(self, key: str, delay: float) -> None:
+        now = time.monotonic()
+        resets = self._resets
+        resets[key] = max(resets.get(key, 0.0), now + delay)
+
+        if len(resets) > self._prune_at:
+            for k, reset in list(resets.items()):
+                if reset <= now:
+                    resets.pop(k, None)
+            # don't scan again on every call if most buckets are still limited
+            self._prune_at = max(self._PRUNE_THRESHOLD, len(resets) * 2)
+
+    def limit_global(self, token: Optional[str], delay: float) -> None:
+        scope = self._scope(token)
+        self._global_resets[scope] = max(
+            self._global_resets.get(scope, 0.0), time.monotonic() + delay
+        )
+
+
+# all HTTP clients and webhook adapters share the same state,
+# since rate limits apply to the bot and not the session
+_rate_limiter = RateLimiter()
 
 
 # For some reason, the Discord voice websocket expects this header to be
@@ -235,8 +302,7 @@ class HTTPClient:
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
         self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
-        self._global_over: asyncio.Event = asyncio.Event()
-        self._global_over.set()
+        self._rate_limiter: RateLimiter = _rate_limiter
         self.token: Optional[str] = None
         self.bot_token: bool = False
         self.proxy: Optional[str] = proxy
@@ -275,7 +341,8 @@ class HTTPClient:
         form: Optional[Iterable[Dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> Any:
-        bucket = route.bucket
+        rate_limiter = self._rate_limiter
+        bucket = rate_limiter.get_key(route, self.token)
         method = route.method
         url = route.url
 
@@ -313,15 +380,18 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs["proxy_auth"] = self.proxy_auth
 
-        if not self._global_over.is_set():
-            # wait until the global lock is complete
-            await self._global_over.wait()
-
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
-        await lock.acquire()
-        with MaybeUnlock(lock) as maybe_lock:
+        async with lock:
             for tries in range(5):
+                # wait until the bucket and the global rate limit are available
+                delay = rate_limiter.get_delay(route, bucket, self.token)
+                if delay > 0:
+                    _log.debug(
+                        "Waiting %.2f seconds for the rate limit (bucket: %s).", delay, bucket
+                    )
+                    await asyncio.sleep(delay)
+
                 if files:
                     for f in files:
                         f.reset(seek=tries)
@@ -353,19 +423,16 @@ class HTTPClient:
                         data = await json_or_text(response)
 
                         # check if we have rate limit header information
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status != 429:
+                        delta = rate_limiter.update(
+                            route, self.token, response, use_clock=self.use_clock
+                        )
+                        if delta is not None and response.status != 429:
                             # we've depleted our current bucket
-                            delta = utils._parse_ratelimit_header(
-                                response, use_clock=self.use_clock
-                            )
                             _log.debug(
                                 "A rate limit bucket has been exhausted (bucket: %s, retry: %s).",
                                 bucket,
                                 delta,
                             )
-                            maybe_lock.defer()
-                            self.loop.call_later(delta, lock.release)
 
                         # the request was successful so just return the text/json
                         if 300 > response.status >= 200:
@@ -380,27 +447,19 @@ class HTTPClient:
 
                             fmt = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
 
-                            # sleep a bit
                             retry_after: float = data["retry_after"]
                             _log.warning(fmt, retry_after, bucket)
 
-                            # check if it's a global rate limit
-                            is_global = data.get("global", False)
-                            if is_global:
+                            # check if it's a global rate limit, the next attempt
+                            # (and all other requests) wait until it is over
+                            if data.get("global", False):
                                 _log.warning(
                                     "Global rate limit has been hit. Retrying in %.2f seconds.",
                                     retry_after,
                                 )
-                                self._global_over.clear()
-
-                            await asyncio.sleep(retry_after)
-                            _log.debug("Done sleeping for the rate limit. Retrying...")
-
-                            # release the global lock now that the
-                            # global rate limit has passed
-                            if is_global:
-                                self._global_over.set()
-                                _log.debug("Global rate limit is now over.")
+                                rate_limiter.limit_global(self.token, retry_after)
+                            else:
+                                rate_limiter.limit_bucket(bucket, retry_after)
 
                             continue
 
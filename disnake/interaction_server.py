@@ -0,0 +1,364 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import aiohttp
+from aiohttp import web
+
+from . import utils
+from .enums import InteractionResponseType, InteractionType
+from .errors import InteractionTimedOut
+from .http import set_attachments, to_multipart
+
+if TYPE_CHECKING:
+    from ssl import SSLContext
+
+    from .client import Client
+    from .file import File
+    from .interactions import Interaction
+
+has_nacl: bool
+
+try:
+    from nacl.exceptions import BadSignatureError  # type: ignore
+    from nacl.signing import VerifyKey  # type: ignore
+
+    has_nacl = True
+except ImportError:
+    has_nacl = False
+
+__all__ = ("InteractionServer",)
+
+_log = logging.getLogger(__name__)
+
+
+class _InteractionReply:
+    # the pending HTTP response to an interaction that was received by an InteractionServer,
+    # the initial interaction response is sent through this instead of a separate request
+
+    __slots__ = ("_response", "_sent", "_awaited")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._response: asyncio.Future[Tuple[Dict[str, Any], Optional[List[File]]]]
+        self._response = loop.create_future()
+        self._sent: asyncio.Future[None] = loop.create_future()
+        self._awaited: bool = False
+
+    async def send(
+        self,
+        interaction: Interaction,
+        *,
+        type: int,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[List[File]] = None,
+    ) -> None:
+        if self._response.done():
+            # the server already answered the request since this took too long
+            raise InteractionTimedOut(interaction)
+
+        payload: Dict[str, Any] = {"type": type}
+        if data is not None:
+            if files:
+                set_attachments(data, files)
+            payload["data"] = data
+
+        self._awaited = True
+        self._response.set_result((payload, files))
+        try:
+            await asyncio.shield(self._sent)
+        except (aiohttp.ClientError, ConnectionError) as e:
+            raise InteractionTimedOut(interaction) from e
+
+    def expire(self, interaction: Interaction) -> Tuple[Dict[str, Any], Optional[List[File]]]:
+        if self._response.done():
+            # the response was sent while the server stopped waiting for it
+            return self._response.result()
+
+        # acknowledge the interaction without a message, like InteractionResponse.defer does
+        if interaction.type is InteractionType.application_command_autocomplete:
+            payload: Dict[str, Any] = {
+                "type": InteractionResponseType.application_command_autocomplete_result.value,
+                "data": {"choices": []},
+            }
+        elif interaction.type is InteractionType.component:
+            payload = {"type": InteractionResponseType.deferred_message_update.value}
+        else:
+            payload = {"type": InteractionResponseType.deferred_channel_message.value}
+
+        self._response.set_result((payload, None))
+        response = interaction.response
+        response._responded = True
+        response._responded_at = time.time()
+        return payload, None
+
+    def set_sent(self, exc: Optional[BaseException] = None) -> None:
+        if self._sent.done():
+            return
+        if exc is None:
+            self._sent.set_result(None)
+        elif self._awaited:
+            if not isinstance(exc, Exception):
+                # the request handler was cancelled, e.g. because the connection was closed
+                exc = ConnectionResetError("The request was cancelled")
+            self._sent.set_exception(exc)
+        else:
+            # nobody is waiting for the deferral sent by the server
+            self._sent.cancel()
+
+
+class InteractionServer:
+    """An HTTP server that receives interactions through an outgoing webhook,
+    as an alternative to receiving them through the gateway.
+
+    Set the URL of the server (including :attr:`path`) as the *Interactions Endpoint URL*
+    of the application in the developer portal. The incoming interactions are dispatched
+    to the client the same way as interactions received through the gateway, i.e.
+    :func:`on_interaction` and the other interaction events are called,
+    and application commands of bots are invoked.
+
+    The initial response to an interaction, e.g. :meth:`InteractionResponse.send_message`
+    or :meth:`InteractionResponse.defer`, is sent as the body of the HTTP response instead of
+    making a separate request to the API. If the interaction isn't responded to within
+    :attr:`response_timeout` seconds, it is deferred automatically, and
+    :meth:`Interaction.send` or :meth:`Interaction.edit_original_message` have to be used
+    to respond to it. Followup messages and edits are always sent through the API.
+
+    The client has to be logged in using :meth:`Client.login` before the server is started,
+    connecting to the gateway isn't required. Note that the gateway doesn't send
+    interactions to the client anymore once the endpoint URL is set, and that the cache
+    is empty unless the client is also connected to the gateway.
+
+    This requires the ``PyNaCl`` library to verify the signatures of the requests.
+
+    .. versionadded:: 2.4
+
+    Example
+    -------
+
+    .. code-block:: python3
+
+        server = disnake.InteractionServer(bot, public_key="...")
+
+        async def main():
+            await bot.login(token)
+            await server.start(port=8080)
+            ...
+
+    Parameters
+    ----------
+    client: :class:`Client`
+        The client to dispatch the interactions to.
+    public_key: :class:`str`
+        The public key of the application, as shown in the developer portal.
+    path: :class:`str`
+        The path of the endpoint. Defaults to ``/interactions``.
+    response_timeout: :class:`float`
+        The number of seconds to wait for the initial response to an interaction before
+        deferring it. Interactions have to be responded to within 3 seconds.
+        Defaults to ``2.5``.
+
+    Attributes
+    ----------
+    client: :class:`Client`
+        The client the interactions are dispatched to.
+    path: :class:`str`
+        The path of the endpoint.
+    response_timeout: :class:`float`
+        The number of seconds to wait for the initial response to an interaction.
+
+    Raises
+    ------
+    RuntimeError
+        The ``PyNaCl`` library isn't installed.
+    ValueError
+        The public key is invalid.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        public_key: str,
+        *,
+        path: str = "/interactions",
+        response_timeout: float = 2.5,
+    ) -> None:
+        if not has_nacl:
+            raise RuntimeError("PyNaCl library needed in order to verify interactions")
+
+        try:
+            self._verify_key = VerifyKey(bytes.fromhex(public_key))
+        except Exception as e:
+            raise ValueError(
+                "public_key must be the hex encoded public key of the application"
+            ) from e
+
+        self.client: Client = client
+        self.path: str = path
+        self.response_timeout: float = response_timeout
+        self._app: Optional[web.Application] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    def __repr__(self) -> str:
+        return f"<InteractionServer path={self.path!r} running={self._runner is not None}>"
+
+    @property
+    def app(self) -> web.Application:
+        """:class:`aiohttp.web.Application`: The application that handles the requests.
+        This can be used to run the endpoint as part of an existing ``aiohttp`` server,
+        e.g. by adding it as a subapp, instead of using :meth:`start`.
+        """
+        if self._app is None:
+            self._app = web.Application()
+            self._app.router.add_post(self.path, self.handle_request)
+        return self._app
+
+    async def start(
+        self,
+        host: Optional[str] = None,
+        port: int = 8080,
+        *,
+        ssl_context: Optional[SSLContext] = None,
+    ) -> None:
+        """|coro|
+
+        Starts listening for interactions. This returns once the server is ready.
+
+        Parameters
+        ----------
+        host: Optional[:class:`str`]
+            The host to listen on. Defaults to all interfaces.
+        port: :class:`int`
+            The port to listen on. Defaults to ``8080``.
+        ssl_context: Optional[:class:`ssl.SSLContext`]
+            The SSL context to use for HTTPS, if it isn't handled by a reverse proxy.
+
+        Raises
+        ------
+        RuntimeError
+            The server is already running, or the client isn't logged in.
+        """
+        if self._runner is not None:
+            raise RuntimeError("The server is already running")
+        if self.client.http.token is None:
+            raise RuntimeError("The client must be logged in before starting the server")
+
+        runner = web.AppRunner(self.app, access_log=None)
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, host, port, ssl_context=ssl_context)
+            await site.start()
+        except BaseException:
+            await runner.cleanup()
+            raise
+
+        self._runner = runner
+        _log.info("Listening for interactions on port %s at %s", port, self.path)
+
+    async def close(self) -> None:
+        """|coro|
+
+        Stops the server. Does nothing if it isn't running.
+        """
+        if self._runner is not None:
+            runner, self._runner = self._runner, None
+            await runner.cleanup()
+
+    def _verify(self, signature: str, timestamp: str, body: bytes) -> bool:
+        try:
+            self._verify_key.verify(timestamp.encode("utf-8") + body, bytes.fromhex(signature))
+        except (BadSignatureError, ValueError):
+            return False
+        return True
+
+    async def handle_request(self, request: web.Request) -> web.StreamResponse:
+        """|coro|
+
+        Handles a request to the endpoint. This is the request handler of :attr:`app`.
+
+        Parameters
+        ----------
+        request: :class:`aiohttp.web.Request`
+            The request.
+
+        Returns
+        -------
+        :class:`aiohttp.web.StreamResponse`
+            The response to the request, which is already sent
+            if the request contained an interaction.
+        """
+        signature = request.headers.get("X-Signature-Ed25519")
+        timestamp = request.headers.get("X-Signature-Timestamp")
+        body = await request.read()
+        if signature is None or timestamp is None or not self._verify(signature, timestamp, body):
+            return web.Response(status=401, text="invalid request signature")
+
+        try:
+            data = utils._from_json(body)
+        except ValueError:
+            return web.Response(status=400, text="invalid request body")
+
+        if data.get("type") == InteractionType.ping.value:
+            return web.json_response({"type": InteractionResponseType.pong.value})
+
+        reply = _InteractionReply(asyncio.get_running_loop())
+        interaction = self.client._connection._handle_interaction(data, reply)
+        if interaction is None:
+            return web.Response(status=400, text="unknown interaction type")
+
+        try:
+            try:
+                payload, files = await asyncio.wait_for(
+                    asyncio.shield(reply._response), self.response_timeout
+                )
+            except asyncio.TimeoutError:
+                payload, files = reply.expire(interaction)
+                if not reply._awaited:
+                    _log.debug(
+                        "Deferred interaction %s since it wasn't responded to", interaction.id
+                    )
+
+            response: web.Response
+            if files:
+                form = aiohttp.FormData(quote_fields=False)
+                for part in to_multipart(payload, files):
+                    form.add_field(**part)
+                response = web.Response(body=form())
+            else:
+                response = web.Response(
+                    text=utils._to_json(payload), content_type="application/json"
+                )
+
+            await response.prepare(request)
+            await response.write_eof()
+        except BaseException as e:
+            reply.set_sent(e)
+            raise
+        reply.set_sent()
+        return response
@@ -1,4 +1,5 @@
 from .application_command import *
+from .auto_defer import *
 from .base import *
 from .message import *
 from .modal import *
@@ -223,6 +223,7 @@ class ApplicationCommandInteractionData:
         "target",
         "resolved",
         "options",
+        "_chain_and_kwargs",
     )
 
     def __init__(
@@ -244,6 +245,7 @@ class ApplicationCommandInteractionData:
             ApplicationCommandInteractionDataOption(data=d, resolved=self.resolved)
             for d in data.get("options", [])
         ]
+        self._chain_and_kwargs: Optional[Tuple[Tuple[str, ...], Dict[str, Any]]] = None
 
     def _get_chain_and_kwargs(
         self, chain: Tuple[str, ...] = None
@@ -251,8 +253,18 @@ class ApplicationCommandInteractionData:
         """
         Returns a chain of sub-command names and a dict of filled options.
         """
-        if chain is None:
-            chain = ()
+        if chain is not None:
+            return self._walk_chain_and_kwargs(chain)
+
+        # the options are walked once, callers are free to modify the returned dict
+        if self._chain_and_kwargs is None:
+            self._chain_and_kwargs = self._walk_chain_and_kwargs(())
+        chain, kwargs = self._chain_and_kwargs
+        return chain, kwargs.copy()
+
+    def _walk_chain_and_kwargs(
+        self, chain: Tuple[str, ...]
+    ) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
         for option in self.options:
             if option.value is None:
                 # Extend the chain and collect kwargs in the nesting
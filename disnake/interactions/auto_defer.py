@@ -0,0 +1,224 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, NamedTuple, Optional, Set
+
+from .. import utils
+from ..errors import HTTPException, InteractionResponded
+
+if TYPE_CHECKING:
+    from .base import Interaction
+
+__all__ = (
+    "AutoDefer",
+    "InteractionAckStats",
+)
+
+_log = logging.getLogger(__name__)
+
+# strong references to the automatic deferrals that are being sent,
+# since the event loop only keeps weak references to tasks
+_pending_defers: Set[asyncio.Task[None]] = set()
+
+# interactions have to be responded to within this many seconds
+_RESPONSE_TIMEOUT = 3.0
+
+
+class AutoDefer:
+    """A policy that defers interactions automatically if they haven't been
+    responded to shortly before the response deadline.
+
+    This can be used for application commands using :func:`.ext.commands.auto_defer`,
+    and for views by passing it as the ``auto_defer`` of :class:`disnake.ui.View`.
+    This is useful if checks, converters, hooks or the callback itself can be slow,
+    e.g. under load, and would otherwise cause the interaction to fail.
+
+    Once the interaction is being deferred automatically, responding using
+    :attr:`Interaction.response` raises :exc:`InteractionResponded`.
+    Use :meth:`Interaction.send` or :meth:`Interaction.edit_original_message` instead,
+    which wait for the deferral and work in both cases.
+
+    .. versionadded:: 2.4
+
+    Parameters
+    ----------
+    deadline: :class:`float`
+        The number of seconds after the creation of the interaction, i.e. when the user used
+        the command or component, to defer at. Interactions have to be responded to within
+        3 seconds, this leaves time for the request to reach Discord. Defaults to ``2``.
+    ephemeral: :class:`bool`
+        Whether the deferred message will eventually be ephemeral.
+        See :meth:`InteractionResponse.defer` for more information.
+    with_message: :class:`bool`
+        Whether the response will be a message with thinking state (bot is thinking...).
+        See :meth:`InteractionResponse.defer` for more information.
+
+    Attributes
+    ----------
+    deadline: :class:`float`
+        The number of seconds after the creation of the interaction to defer at.
+    ephemeral: :class:`bool`
+        Whether the deferred message will eventually be ephemeral.
+    with_message: :class:`bool`
+        Whether the response will be a message with thinking state.
+    """
+
+    __slots__ = ("deadline", "ephemeral", "with_message")
+
+    def __init__(
+        self, deadline: float = 2.0, *, ephemeral: bool = False, with_message: bool = False
+    ) -> None:
+        if not 0 <= deadline < _RESPONSE_TIMEOUT:
+            raise ValueError(f"deadline must be between 0 and {_RESPONSE_TIMEOUT} seconds")
+
+        self.deadline: float = deadline
+        self.ephemeral: bool = ephemeral
+        self.with_message: bool = with_message
+
+    def __repr__(self) -> str:
+        return (
+            f"<AutoDefer deadline={self.deadline} ephemeral={self.ephemeral} "
+            f"with_message={self.with_message}>"
+        )
+
+
+class InteractionAckStats(NamedTuple):
+    """Represents the acknowledgement latency of interactions handled by commands and views,
+    as returned by :attr:`Client.interaction_ack_stats`.
+
+    The latency of an interaction is the time between its creation and its initial response.
+    Interactions are counted once the command or view callback that handled them has finished.
+
+    .. versionadded:: 2.4
+
+    Attributes
+    ----------
+    acknowledged: :class:`int`
+        The number of interactions that were responded to, including deferrals.
+    auto_deferred: :class:`int`
+        The number of interactions that were deferred by an :class:`AutoDefer` policy.
+    unacknowledged: :class:`int`
+        The number of interactions that weren't responded to when their callback finished.
+    average_latency: :class:`float`
+        The average latency of the acknowledged interactions in seconds.
+    max_latency: :class:`float`
+        The highest latency of the acknowledged interactions in seconds.
+    """
+
+    acknowledged: int
+    auto_deferred: int
+    unacknowledged: int
+    average_latency: float
+    max_latency: float
+
+
+class _AckStatsCollector:
+    __slots__ = ("acknowledged", "auto_deferred", "unacknowledged", "total_latency", "max_latency")
+
+    def __init__(self) -> None:
+        self.acknowledged: int = 0
+        self.auto_deferred: int = 0
+        self.unacknowledged: int = 0
+        self.total_latency: float = 0.0
+        self.max_latency: float = 0.0
+
+    def snapshot(self) -> InteractionAckStats:
+        average = self.total_latency / self.acknowledged if self.acknowledged else 0.0
+        return InteractionAckStats(
+            self.acknowledged, self.auto_deferred, self.unacknowledged, average, self.max_latency
+        )
+
+
+class _AckTracker:
+    # tracks the initial response of a single interaction while its callback runs,
+    # and defers it when the deadline of the policy is reached
+
+    __slots__ = ("interaction", "policy", "auto_deferred", "_handle", "_task")
+
+    def __init__(self, interaction: Interaction, policy: Optional[AutoDefer]) -> None:
+        self.interaction: Interaction = interaction
+        self.policy: Optional[AutoDefer] = policy
+        self.auto_deferred: bool = False
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+        if policy is not None:
+            delay = policy.deadline - (utils.utcnow() - interaction.created_at).total_seconds()
+            # the timer is a cheap entry in the event loop's schedule, no task is
+            # created unless the interaction actually has to be deferred
+            loop = asyncio.get_running_loop()
+            self._handle = loop.call_later(max(delay, 0), self._fire)
+
+    def _fire(self) -> None:
+        self._handle = None
+        response = self.interaction.response
+        # don't defer if the callback is responding right now
+        if not response.is_done() and response._pending is None:
+            self._task = task = asyncio.create_task(
+                self._defer(), name=f"disnake-interaction-auto-defer-{self.interaction.id}"
+            )
+            _pending_defers.add(task)
+            task.add_done_callback(_pending_defers.discard)
+
+    async def _defer(self) -> None:
+        policy: AutoDefer = self.policy  # type: ignore
+        try:
+            await self.interaction.response.defer(
+                ephemeral=policy.ephemeral, with_message=policy.with_message
+            )
+        except (InteractionResponded, HTTPException) as e:
+            # the callback responded at the same time
+            _log.debug("Failed to defer interaction %s automatically: %s", self.interaction.id, e)
+        else:
+            self.auto_deferred = True
+
+    def finish(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if self._task is not None and not self._task.done():
+            # the interaction is counted once the deferral was sent
+            self._task.add_done_callback(lambda _: self._record())
+            return
+        self._record()
+
+    def _record(self) -> None:
+        stats = self.interaction._state._interaction_ack_stats
+        response = self.interaction.response
+        if response._responded_at is None:
+            stats.unacknowledged += 1
+            return
+
+        latency = max(response._responded_at - self.interaction.created_at.timestamp(), 0.0)
+        stats.acknowledged += 1
+        stats.total_latency += latency
+        if latency > stats.max_latency:
+            stats.max_latency = latency
+        if self.auto_deferred:
+            stats.auto_deferred += 1
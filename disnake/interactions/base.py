@@ -28,6 +28,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import time
 from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Union, overload
 
 from .. import utils
@@ -75,6 +76,7 @@ if TYPE_CHECKING:
     from ..embeds import Embed
     from ..ext.commands import AutoShardedBot, Bot
     from ..file import File
+    from ..interaction_server import _InteractionReply
     from ..mentions import AllowedMentions
     from ..state import ConnectionState
     from ..threads import Thread
@@ -83,6 +85,7 @@ if TYPE_CHECKING:
         ApplicationCommandOptionChoice as ApplicationCommandOptionChoicePayload,
         Interaction as InteractionPayload,
     )
+    from ..types.message import Message as MessagePayload
     from ..ui.action_row import Components
     from ..ui.modal import Modal
     from ..ui.view import View
@@ -156,6 +159,8 @@ class Interaction:
         "_state",
         "_session",
         "_original_message",
+        "_http_reply",
+        "_received_at",
         "_cs_response",
         "_cs_followup",
         "_cs_channel",
@@ -168,6 +173,12 @@ class Interaction:
         self._session: ClientSession = state.http._HTTPClient__session  # type: ignore
         self.client: Client = state._get_client()
         self._original_message: Optional[InteractionMessage] = None
+        # set if the interaction was received through an `InteractionServer`,
+        # in which case the initial response is sent as the reply to its request
+        self._http_reply: Optional[_InteractionReply] = None
+        # the monotonic time the interaction was received at, which unlike `created_at`
+        # doesn't depend on the local clock being in sync with Discord's
+        self._received_at: float = time.monotonic()
 
         self.id: int = int(data["id"])
         self.type: InteractionType = try_enum(InteractionType, data["type"])
@@ -286,6 +297,11 @@ class Interaction:
 
         Repeated calls to this will return a cached value.
 
+        .. versionchanged:: 2.4
+            The message is cached without fetching it when it is returned in the response to
+            :meth:`InteractionResponse.send_message` or :meth:`InteractionResponse.edit_message`,
+            and it is updated by :meth:`edit_original_message`.
+
         Raises
         -------
         HTTPException
@@ -306,6 +322,10 @@ class Interaction:
             token=self.token,
             session=self._session,
         )
+        return self._update_original_message(data)
+
+    def _update_original_message(self, data: MessagePayload) -> InteractionMessage:
+        # The message channel types should always match
         state = _InteractionMessageState(self, self._state)
         message = InteractionMessage(state=state, channel=self.channel, data=data)  # type: ignore
         self._original_message = message
@@ -395,6 +415,9 @@ class Interaction:
             The newly edited message.
         """
 
+        # the original message doesn't exist until the initial response was sent
+        await self.response._wait_pending()
+
         # if no attachment list was provided but we're uploading new files,
         # use current attachments as the base
         if attachments is MISSING and (file or files):
@@ -432,9 +455,7 @@ class Interaction:
                 for f in params.files:
                     f.close()
 
-        # The message channel types should always match
-        state = _InteractionMessageState(self, self._state)
-        message = InteractionMessage(state=state, channel=self.channel, data=data)  # type: ignore
+        message = self._update_original_message(data)
         if view and not view.is_finished():
             self._state.store_view(view, message.id)
         return message
@@ -461,6 +482,7 @@ class Interaction:
         Forbidden
             Deleted a message that is not yours.
         """
+        self._original_message = None
         adapter = async_context.get()
         deleter = adapter.delete_original_interaction_response(
             self.application_id,
@@ -563,6 +585,7 @@ class Interaction:
         ValueError
             The length of ``embeds`` was invalid.
         """
+        await self.response._wait_pending()
         if self.response._responded:
             sender = self.followup.send
         else:
@@ -592,12 +615,24 @@ class InteractionResponse:
 
     __slots__: Tuple[str, ...] = (
         "_responded",
+        "_responded_at",
+        "_pending",
         "_parent",
     )
 
     def __init__(self, parent: Interaction):
         self._parent: Interaction = parent
         self._responded: bool = False
+        # set while the initial response is being sent, so that a concurrent response,
+        # e.g. by an AutoDefer policy, raises InteractionResponded instead of failing
+        self._pending: Optional[asyncio.Event] = None
+        # the UNIX timestamp of the initial response, used for the acknowledgement stats
+        self._responded_at: Optional[float] = None
+
+    async def _wait_pending(self) -> None:
+        # waits for an initial response that is currently being sent, if any
+        if self._pending is not None:
+            await self._pending.wait()
 
     def is_done(self) -> bool:
         """Indicates whether an interaction response has been done before.
@@ -608,6 +643,46 @@ class InteractionResponse:
         """
         return self._responded
 
+    async def _create_response(
+        self,
+        *,
+        type: int,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[List[File]] = None,
+        with_message: bool = False,
+    ) -> None:
+        parent = self._parent
+        if self._responded or self._pending is not None:
+            raise InteractionResponded(parent)
+
+        self._pending = pending = asyncio.Event()
+        try:
+            if parent._http_reply is not None:
+                await parent._http_reply.send(parent, type=type, data=data, files=files)
+                return
+
+            adapter = async_context.get()
+            response = await adapter.create_interaction_response(
+                parent.id,
+                parent.token,
+                session=parent._session,
+                type=type,
+                data=data,
+                files=files,
+                with_response=with_message,
+            )
+        finally:
+            # the caller marks the response as done right after this returns
+            self._pending = None
+            pending.set()
+
+        # if the response contains the resulting message, cache it
+        # to avoid fetching it again in `Interaction.original_message`
+        if response:
+            message = (response.get("resource") or {}).get("message")
+            if message is not None:
+                parent._update_original_message(message)
+
     async def defer(self, *, ephemeral: bool = False, with_message: bool = False) -> None:
         """|coro|
 
@@ -652,11 +727,9 @@ class InteractionResponse:
             defer_type = InteractionResponseType.deferred_message_update.value
 
         if defer_type:
-            adapter = async_context.get()
-            await adapter.create_interaction_response(
-                parent.id, parent.token, session=parent._session, type=defer_type, data=data
-            )
+            await self._create_response(type=defer_type, data=data)
             self._responded = True
+            self._responded_at = time.time()
 
     async def pong(self) -> None:
         """|coro|
@@ -677,14 +750,9 @@ class InteractionResponse:
 
         parent = self._parent
         if parent.type is InteractionType.ping:
-            adapter = async_context.get()
-            await adapter.create_interaction_response(
-                parent.id,
-                parent.token,
-                session=parent._session,
-                type=InteractionResponseType.pong.value,
-            )
+            await self._create_response(type=InteractionResponseType.pong.value)
             self._responded = True
+            self._responded_at = time.time()
 
     async def send_message(
         self,
@@ -810,16 +878,12 @@ class InteractionResponse:
         if components is not MISSING:
             payload["components"] = components_to_dict(components)
 
-        parent = self._parent
-        adapter = async_context.get()
         try:
-            await adapter.create_interaction_response(
-                parent.id,
-                parent.token,
-                session=parent._session,
+            await self._create_response(
                 type=InteractionResponseType.channel_message.value,
                 data=payload,
                 files=files or None,
+                with_message=True,
             )
         except NotFound as e:
             if e.code == 10062:
@@ -831,6 +895,7 @@ class InteractionResponse:
                     f.close()
 
         self._responded = True
+        self._responded_at = time.time()
 
         if view is not MISSING:
             if ephemeral and view.timeout is None:
@@ -974,15 +1039,12 @@ class InteractionResponse:
         if components is not MISSING:
             payload["components"] = [] if components is None else components_to_dict(components)
 
-        adapter = async_context.get()
         try:
-            await adapter.create_interaction_response(
-                parent.id,
-                parent.token,
-                session=parent._session,
+            await self._create_response(
                 type=InteractionResponseType.message_update.value,
                 data=payload,
                 files=files,
+                with_message=True,
             )
         finally:
             if files:
@@ -993,6 +1055,7 @@ class InteractionResponse:
             state.store_view(view, message_id)
 
         self._responded = True
+        self._responded_at = time.time()
 
     async def autocomplete(self, *, choices: Choices) -> None:
         """|coro|
@@ -1028,17 +1091,13 @@ class InteractionResponse:
                     value = {"name": str(c), "value": c}
                 choices_data.append(value)
 
-        parent = self._parent
-        adapter = async_context.get()
-        await adapter.create_interaction_response(
-            parent.id,
-            parent.token,
-            session=parent._session,
+        await self._create_response(
             type=InteractionResponseType.application_command_autocomplete_result.value,
             data={"choices": choices_data},
         )
 
         self._responded = True
+        self._responded_at = time.time()
 
     @overload
     async def send_modal(self, modal: Modal) -> None:
@@ -1128,15 +1187,12 @@ class InteractionResponse:
         else:
             raise TypeError("Either modal or title, custom_id, components must be provided")
 
-        adapter = async_context.get()
-        await adapter.create_interaction_response(
-            parent.id,
-            parent.token,
-            session=parent._session,
+        await self._create_response(
             type=InteractionResponseType.modal.value,
             data=modal_data,  # type: ignore
         )
         self._responded = True
+        self._responded_at = time.time()
 
         if modal is not None:
             parent._state.store_modal(parent.author.id, modal)
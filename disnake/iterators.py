@@ -27,12 +27,14 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+from collections import deque
 from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
     List,
     Optional,
     TypeVar,
@@ -50,6 +52,7 @@ __all__ = (
     "AuditLogIterator",
     "GuildIterator",
     "MemberIterator",
+    "GatewayMemberIterator",
 )
 
 if TYPE_CHECKING:
@@ -58,6 +61,7 @@ if TYPE_CHECKING:
     from .guild import Guild
     from .member import Member
     from .message import Message
+    from .state import ChunkRequest
     from .threads import Thread
     from .types.audit_log import AuditLog as AuditLogPayload
     from .types.guild import Guild as GuildPayload
@@ -690,6 +694,81 @@ class MemberIterator(_AsyncIterator["Member"]):
         return Member(data=data, guild=self.guild, state=self.state)
 
 
+class GatewayMemberIterator(_AsyncIterator["Member"]):
+    def __init__(
+        self,
+        guild: Guild,
+        *,
+        query: str = "",
+        limit: int = 0,
+        user_ids: Optional[List[int]] = None,
+        presences: bool = False,
+        cache: bool = True,
+        timeout: float = 30.0,
+    ):
+        self.guild = guild
+        self.query = query
+        self.limit = limit
+        self.user_ids = user_ids
+        self.presences = presences
+        self.cache = cache
+        self.timeout = timeout
+
+        self.state = self.guild._state
+        self.request: Optional[ChunkRequest] = None
+        self.finished = False
+        self.members: Deque[Member] = deque()
+
+    def __del__(self) -> None:
+        # the consumer stopped iterating early, e.g. using `break`
+        self.close()
+
+    def close(self) -> None:
+        # stops the stream and releases its `max_concurrent_member_streams` slot
+        if self.request is not None and not self.finished:
+            self.finished = True
+            self.state.cancel_member_stream(self.request)
+
+    async def next(self) -> Member:
+        if not self.members:
+            await self.fill_members()
+
+        try:
+            return self.members.popleft()
+        except IndexError:
+            raise NoMoreItems()
+
+    async def fill_members(self):
+        # only one chunk is held at a time, the next one is waited for
+        # once all members of the current chunk have been consumed
+        if self.finished:
+            return
+
+        if self.request is None:
+            self.request = await self.state.stream_members(
+                self.guild,
+                query=self.query,
+                limit=self.limit,
+                user_ids=self.user_ids,
+                presences=self.presences,
+                cache=self.cache,
+            )
+
+        stream = self.request.stream
+        assert stream is not None
+        try:
+            chunk = await asyncio.wait_for(stream.get(), timeout=self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self.close()
+            raise
+
+        if chunk is None:
+            self.finished = True
+            return
+
+        self.members.extend(chunk)
+
+
 class ArchivedThreadIterator(_AsyncIterator["Thread"]):
     def __init__(
         self,
@@ -352,7 +352,7 @@ class Member(disnake.abc.Messageable, _UserTag):
         self.premium_since: Optional[datetime.datetime] = utils.parse_time(
             data.get("premium_since")
         )
-        self._roles: utils.SnowflakeList = utils.SnowflakeList(map(int, data["roles"]))
+        self._roles: utils.SnowflakeList = utils._get_shared_snowflake_list(map(int, data["roles"]))
         self._client_status: Dict[Optional[str], str] = {None: "offline"}
         self.activities: Tuple[ActivityTypes, ...] = tuple()
         self.nick: Optional[str] = data.get("nick")
@@ -392,8 +392,11 @@ class Member(disnake.abc.Messageable, _UserTag):
     def _update_from_message(self, data: MemberPayload) -> None:
         self.joined_at = utils.parse_time(data.get("joined_at"))
         self.premium_since = utils.parse_time(data.get("premium_since"))
-        self._roles = utils.SnowflakeList(map(int, data["roles"]))
-        self.nick = data.get("nick", None)
+        self._roles = utils._get_shared_snowflake_list(map(int, data["roles"]))
+        nick = data.get("nick", None)
+        if nick != self.nick:
+            self.nick = nick
+            self.guild._reindex_member(self)
         self.pending = data.get("pending", False)
 
     @classmethod
@@ -412,7 +415,8 @@ class Member(disnake.abc.Messageable, _UserTag):
     def _copy(cls: Type[M], member: M) -> M:
         self: M = cls.__new__(cls)  # to bypass __init__
 
-        self._roles = utils.SnowflakeList(member._roles, is_sorted=True)
+        # role lists are shared and never modified in-place
+        self._roles = member._roles
         self.joined_at = member.joined_at
         self.premium_since = member.premium_since
         self._client_status = member._client_status.copy()
@@ -447,7 +451,7 @@ class Member(disnake.abc.Messageable, _UserTag):
             pass
 
         self.premium_since = utils.parse_time(data.get("premium_since"))
-        self._roles = utils.SnowflakeList(map(int, data["roles"]))
+        self._roles = utils._get_shared_snowflake_list(map(int, data["roles"]))
         self._avatar = data.get("avatar")
         timeout_datetime = utils.parse_time(data.get("communication_disabled_until"))
         self._communication_disabled_until = timeout_datetime
@@ -681,17 +685,7 @@ class Member(disnake.abc.Messageable, _UserTag):
         administrator implication.
         """
 
-        if self.guild.owner_id == self.id:
-            return Permissions.all()
-
-        base = Permissions.none()
-        for r in self.roles:
-            base.value |= r.permissions.value
-
-        if base.administrator:
-            return Permissions.all()
-
-        return base
+        return Permissions(self.guild._get_base_permissions_value(self))
 
     @property
     def voice(self) -> Optional[VoiceState]:
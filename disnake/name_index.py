@@ -0,0 +1,269 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+
+__all__ = ()
+
+T = TypeVar("T")
+
+
+class NameIndex:
+    """Maps names to the IDs of the objects that have them.
+
+    Each ID can be indexed under multiple names (e.g. a username and a nickname),
+    which are replaced as a whole by :meth:`set`. Supports exact and case-insensitive
+    lookups, as well as case-insensitive prefix searches in alphabetical order.
+
+    If ``substrings`` is ``True``, the trigrams of the names are indexed as well, which
+    allows case-insensitive substring searches for queries of at least 3 characters
+    without checking every name, at the cost of roughly one set entry per character.
+    """
+
+    __slots__ = ("_names", "_exact", "_folded", "_sorted", "_unsorted", "_stale", "_trigrams")
+
+    def __init__(self, *, substrings: bool = False) -> None:
+        # ID -> names it is currently indexed under
+        self._names: Dict[int, Tuple[str, ...]] = {}
+        self._exact: Dict[str, List[int]] = {}
+        self._folded: Dict[str, List[int]] = {}
+        # (casefolded name, ID) for prefix searches. This is only sorted when searching, and
+        # removed entries are skipped until they make up half of the list, since keeping it
+        # sorted on every change would make adding many members at once quadratic.
+        self._sorted: List[Tuple[str, int]] = []
+        self._unsorted: bool = False
+        self._stale: int = 0
+        # trigram of a casefolded name -> IDs with a name that contains it
+        self._trigrams: Optional[Dict[str, Set[int]]] = {} if substrings else None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._names
+
+    def set(self, id: int, names: Iterable[Optional[str]]) -> None:
+        new = tuple(dict.fromkeys(filter(None, names)))
+        old = self._names.get(id)
+        if old == new:
+            return
+
+        if old is not None:
+            self._remove(id, old)
+        if new:
+            self._add(id, new)
+
+    def discard(self, id: int) -> None:
+        old = self._names.get(id)
+        if old is not None:
+            self._remove(id, old)
+
+    def clear(self) -> None:
+        self._names.clear()
+        self._exact.clear()
+        self._folded.clear()
+        self._sorted.clear()
+        self._unsorted = False
+        self._stale = 0
+        if self._trigrams is not None:
+            self._trigrams.clear()
+
+    def get(self, name: str) -> List[int]:
+        return self._exact.get(name, [])
+
+    def get_folded(self, name: str) -> List[int]:
+        return self._folded.get(name.casefold(), [])
+
+    def search(self, prefix: str) -> Iterator[int]:
+        # yields each matching ID once, ordered by the first matching name
+        if self._unsorted:
+            self._sorted.sort()
+            self._unsorted = False
+
+        prefix = prefix.casefold()
+        entries = self._sorted
+        names = self._names
+        seen = set()
+        for index in range(bisect_left(entries, (prefix,)), len(entries)):
+            folded, id = entries[index]
+            if not folded.startswith(prefix):
+                break
+            if id in seen:
+                continue
+            # skip entries that were removed in the meantime
+            current = names.get(id)
+            if current is not None and any(name.casefold() == folded for name in current):
+                seen.add(id)
+                yield id
+
+    def search_substring(self, query: str) -> Optional[Iterator[int]]:
+        """Yields the IDs with a name that contains the query, in no particular order.
+
+        Returns ``None`` if substrings aren't indexed or the query is shorter than
+        3 characters, in which case the names have to be checked one by one.
+        """
+        trigrams = self._trigrams
+        query = query.casefold()
+        if trigrams is None or len(query) < 3:
+            return None
+        return self._search_substring(trigrams, query)
+
+    def _search_substring(self, trigrams: Dict[str, Set[int]], query: str) -> Iterator[int]:
+        postings = []
+        for gram in _get_trigrams(query):
+            ids = trigrams.get(gram)
+            if ids is None:
+                return
+            postings.append(ids)
+
+        # names containing all trigrams of the query are only candidates, e.g.
+        # "abcab" contains the trigrams of "abcabc", so they have to be checked
+        postings.sort(key=len)
+        names = self._names
+        for id in postings[0].intersection(*postings[1:]):
+            if any(query in name.casefold() for name in names[id]):
+                yield id
+
+    def _add(self, id: int, names: Tuple[str, ...]) -> None:
+        self._names[id] = names
+        exact = self._exact
+        folded_names = self._folded
+        added = []
+        for name in names:
+            exact.setdefault(name, []).append(id)
+            folded = name.casefold()
+            if folded not in added:
+                added.append(folded)
+                folded_names.setdefault(folded, []).append(id)
+                self._sorted.append((folded, id))
+        self._unsorted = True
+
+        trigrams = self._trigrams
+        if trigrams is not None:
+            for gram in _get_trigrams(*added):
+                trigrams.setdefault(gram, set()).add(id)
+
+    def _remove(self, id: int, names: Tuple[str, ...]) -> None:
+        del self._names[id]
+        folded_names = set()
+        for name in names:
+            _remove_from(self._exact, name, id)
+            folded_names.add(name.casefold())
+
+        for folded in folded_names:
+            _remove_from(self._folded, folded, id)
+
+        trigrams = self._trigrams
+        if trigrams is not None:
+            for gram in _get_trigrams(*folded_names):
+                ids = trigrams.get(gram)
+                if ids is not None:
+                    ids.discard(id)
+                    if not ids:
+                        del trigrams[gram]
+
+        self._stale += len(folded_names)
+        if self._stale > len(self._sorted) // 2:
+            self._sorted = [(folded, id) for folded, ids in self._folded.items() for id in ids]
+            self._unsorted = True
+            self._stale = 0
+
+
+def _get_trigrams(*names: str) -> Set[str]:
+    return {name[i : i + 3] for name in names for i in range(len(name) - 2)}
+
+
+def _remove_from(mapping: Dict[str, List[int]], key: str, id: int) -> None:
+    ids = mapping.get(key)
+    if ids is None:
+        return
+    try:
+        ids.remove(id)
+    except ValueError:
+        return
+    if not ids:
+        del mapping[key]
+
+
+def match_score(query: str, name: str) -> Optional[Tuple[int, int]]:
+    """Scores how well a casefolded name matches a casefolded query, lower is better.
+
+    Exact matches rank first, followed by prefix matches, matches at the start of a word,
+    other substring matches and finally fuzzy matches, where the query's characters
+    appear in order. Returns ``None`` if the name doesn't match at all.
+    """
+    if name == query:
+        return (0, 0)
+    if name.startswith(query):
+        return (1, len(name))
+
+    index = name.find(query)
+    if index != -1:
+        return (2 if not name[index - 1].isalnum() else 3, index)
+
+    start = position = -1
+    for char in query:
+        position = name.find(char, position + 1)
+        if position == -1:
+            return None
+        if start == -1:
+            start = position
+    # matches that are spread out less rank higher
+    return (4, position - start)
+
+
+def top_matches(
+    query: str,
+    objects: Iterable[T],
+    get_names: Callable[[T], Iterable[Optional[str]]],
+    limit: int,
+    *,
+    fuzzy: bool = True,
+) -> List[T]:
+    """Returns the ``limit`` objects whose names match the query best, see :func:`match_score`."""
+    query = query.casefold()
+    counter = itertools.count()
+    ranked = []
+    for obj in objects:
+        best = None
+        for name in get_names(obj):
+            if not name:
+                continue
+            folded = name.casefold()
+            score = match_score(query, folded)
+            if score is None or (not fuzzy and score[0] == 4):
+                continue
+            if best is None or (score, folded) < best:
+                best = (score, folded)
+
+        if best is not None:
+            # the counter keeps the sort stable and avoids comparing the objects
+            ranked.append((best[0], best[1], next(counter), obj))
+
+    return [entry[3] for entry in heapq.nsmallest(limit, ranked)]
@@ -25,6 +25,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypeVar, Union
 
 from .asset import Asset
@@ -33,7 +34,7 @@ from .errors import InvalidArgument
 from .mixins import Hashable
 from .partial_emoji import PartialEmoji
 from .permissions import Permissions
-from .utils import MISSING, _bytes_to_base64_data, _get_as_snowflake, snowflake_time
+from .utils import MISSING, _bytes_to_base64_data, _get_as_snowflake, _intern_int, snowflake_time
 
 __all__ = (
     "RoleTags",
@@ -248,10 +249,10 @@ class Role(Hashable):
         return not r
 
     def _update(self, data: RolePayload):
-        self.name: str = data["name"]
-        self._permissions: int = int(data.get("permissions", 0))
+        self.name: str = sys.intern(data["name"])
+        self._permissions: int = _intern_int(int(data.get("permissions", 0)))
         self.position: int = data.get("position", 0)
-        self._colour: int = data.get("color", 0)
+        self._colour: int = _intern_int(data.get("color", 0))
         self.hoist: bool = data.get("hoist", False)
         self._icon: Optional[str] = data.get("icon")
         self._emoji: Optional[str] = data.get("unicode_emoji")
@@ -32,6 +32,7 @@ import inspect
 import itertools
 import logging
 import os
+import sys
 from collections import OrderedDict, deque
 from typing import (
     TYPE_CHECKING,
@@ -57,6 +58,7 @@ from .app_commands import (
 )
 from .channel import *
 from .channel import _channel_factory
+from .chunking import ChunkScheduler
 from .emoji import Emoji
 from .enums import ApplicationCommandType, ChannelType, ComponentType, Status, try_enum
 from .flags import ApplicationFlags, Intents, MemberCacheFlags
@@ -64,6 +66,7 @@ from .guild import Guild
 from .guild_scheduled_event import GuildScheduledEvent
 from .integrations import _integration_factory
 from .interactions import ApplicationCommandInteraction, MessageInteraction, ModalInteraction
+from .interactions.auto_defer import _AckStatsCollector
 from .invite import Invite
 from .member import Member
 from .mentions import AllowedMentions
@@ -87,6 +90,8 @@ if TYPE_CHECKING:
     from .gateway import DiscordWebSocket
     from .guild import GuildChannel, VocalGuildChannel
     from .http import HTTPClient
+    from .interaction_server import _InteractionReply
+    from .interactions import Interaction
     from .message import MessageableChannel
     from .types.activity import Activity as ActivityPayload
     from .types.channel import DMChannel as DMChannelPayload
@@ -112,6 +117,7 @@ class ChunkRequest:
         resolver: Callable[[int], Any],
         *,
         cache: bool = True,
+        stream: bool = False,
     ) -> None:
         self.guild_id: int = guild_id
         self.resolver: Callable[[int], Any] = resolver
@@ -120,9 +126,19 @@ class ChunkRequest:
         self.nonce: str = os.urandom(16).hex()
         self.buffer: List[Member] = []
         self.waiters: List[asyncio.Future[List[Member]]] = []
+        # streamed requests hand out every chunk as it arrives instead of buffering them,
+        # ``None`` marks the end of the stream
+        self.stream: Optional[asyncio.Queue[Optional[List[Member]]]] = (
+            asyncio.Queue() if stream else None
+        )
+        self.on_done: Optional[Callable[[], Any]] = None
 
     def add_members(self, members: List[Member]) -> None:
-        self.buffer.extend(members)
+        if self.stream is not None:
+            self.stream.put_nowait(members)
+        else:
+            self.buffer.extend(members)
+
         if self.cache:
             guild = self.resolver(self.guild_id)
             if guild is None:
@@ -147,10 +163,17 @@ class ChunkRequest:
         return future
 
     def done(self) -> None:
+        if self.stream is not None:
+            self.stream.put_nowait(None)
+
         for future in self.waiters:
             if not future.done():
                 future.set_result(self.buffer)
 
+        if self.on_done is not None:
+            self.on_done()
+            self.on_done = None
+
 
 _log = logging.getLogger(__name__)
 
@@ -202,6 +225,14 @@ class ConnectionState:
 
         self.allowed_mentions: Optional[AllowedMentions] = allowed_mentions
         self._chunk_requests: Dict[Union[int, str], ChunkRequest] = {}
+        self._partial_emoji_pool: utils._InternPool[PartialEmoji] = utils._InternPool(max_size=4096)
+        self._interaction_ack_stats: _AckStatsCollector = _AckStatsCollector()
+        max_concurrent_member_streams: int = options.get("max_concurrent_member_streams", 2)
+        if max_concurrent_member_streams < 1:
+            raise ValueError("max_concurrent_member_streams must be at least 1")
+        self._member_stream_semaphore: asyncio.Semaphore = asyncio.Semaphore(
+            max_concurrent_member_streams
+        )
 
         activity = options.get("activity", None)
         if activity:
@@ -228,6 +259,12 @@ class ConnectionState:
             _log.warning("Guilds intent seems to be disabled. This may cause state related issues.")
 
         self._chunk_guilds: bool = options.get("chunk_guilds_at_startup", intents.members)
+        self._guild_chunk_priority: Optional[Callable[[Guild], Optional[float]]] = options.get(
+            "guild_chunk_priority"
+        )
+        self._chunk_scheduler: ChunkScheduler = ChunkScheduler(self)
+        self._lazy_guilds: bool = options.get("lazy_guilds", False)
+        self._index_member_names: bool = options.get("member_name_index", False)
 
         # Ensure these two are set properly
         if not intents.members and self._chunk_guilds:
@@ -284,6 +321,15 @@ class ConnectionState:
         self._emojis: Dict[int, Emoji] = {}
         self._stickers: Dict[int, GuildSticker] = {}
         self._guilds: Dict[int, Guild] = {}
+        # the IDs of the channels of lazily created guilds that weren't materialized yet,
+        # mapped to the IDs of their guilds
+        self._lazy_guild_channels: Dict[int, int] = {}
+
+        # the remaining chunks of streamed members won't be sent in a new session,
+        # their consumers time out waiting for them
+        for request in list(self._chunk_requests.values()):
+            if request.stream is not None:
+                self.cancel_member_stream(request)
 
         if application_commands:
             self._global_application_commands: Dict[int, APIApplicationCommand] = {}
@@ -309,19 +355,32 @@ class ConnectionState:
         else:
             self._messages: Optional[Deque[Message]] = None
 
+    def _get_chunk_requests(
+        self, guild_id: int, nonce: Optional[str]
+    ) -> List[Tuple[Union[int, str], ChunkRequest]]:
+        return [
+            (key, request)
+            for key, request in self._chunk_requests.items()
+            if request.guild_id == guild_id and request.nonce == nonce
+        ]
+
     def process_chunk_requests(
-        self, guild_id: int, nonce: Optional[str], members: List[Member], complete: bool
+        self,
+        guild_id: int,
+        nonce: Optional[str],
+        members: List[Member],
+        complete: bool,
+        *,
+        requests: Optional[List[Tuple[Union[int, str], ChunkRequest]]] = None,
     ) -> None:
-        removed = []
-        for key, request in self._chunk_requests.items():
-            if request.guild_id == guild_id and request.nonce == nonce:
-                request.add_members(members)
-                if complete:
-                    request.done()
-                    removed.append(key)
+        if requests is None:
+            requests = self._get_chunk_requests(guild_id, nonce)
 
-        for key in removed:
-            del self._chunk_requests[key]
+        for key, request in requests:
+            request.add_members(members)
+            if complete:
+                request.done()
+                self._chunk_requests.pop(key, None)
 
     def call_handlers(self, key: str, *args: Any, **kwargs: Any) -> None:
         try:
@@ -432,6 +491,9 @@ class ConnectionState:
     def _remove_guild(self, guild: Guild) -> None:
         self._guilds.pop(guild.id, None)
 
+        if guild._lazy_data:
+            guild._map_lazy_channels(utils._from_json(guild._lazy_data), remove=True)
+
         for emoji in guild.emojis:
             self._emojis.pop(emoji.id, None)
 
@@ -602,6 +664,17 @@ class ConnectionState:
         self._add_guild(guild)
         return guild
 
+    def _schedule_startup_chunking(self, guild: Guild) -> Optional[asyncio.Future[None]]:
+        # returns None if chunking the guild was deferred until it's first used
+        priority = 0.0
+        if self._guild_chunk_priority is not None:
+            priority = self._guild_chunk_priority(guild)
+            if priority is None:
+                self._chunk_scheduler.defer(guild)
+                return None
+
+        return self._chunk_scheduler.schedule(guild, priority)
+
     def _guild_needs_chunking(self, guild: Guild) -> bool:
         # If presences are enabled then we get back the old guild.large behaviour
         return (
@@ -610,6 +683,16 @@ class ConnectionState:
             and not (self._intents.presences and not guild.large)
         )
 
+    def _reindex_member_names(self, user_id: int) -> None:
+        # users are shared between guilds, so a changed username affects all of them
+        if not self._index_member_names:
+            return
+
+        for guild in self._guilds.values():
+            member = guild._members.get(user_id)
+            if member is not None:
+                guild._reindex_member(member)
+
     def _get_guild_channel(
         self, data: Union[MessagePayload, TypingEvent]
     ) -> Tuple[Union[PartialChannel, Thread], Optional[Guild]]:
@@ -684,6 +767,50 @@ class ConnectionState:
             )
             raise
 
+    async def stream_members(
+        self,
+        guild: Guild,
+        *,
+        query: str,
+        limit: int,
+        user_ids: Optional[List[int]],
+        presences: bool,
+        cache: bool,
+    ) -> ChunkRequest:
+        ws = self._get_websocket(guild.id)
+        if ws is None:
+            raise RuntimeError("Somehow do not have a websocket for this guild_id")
+
+        # limit the number of guilds that are streamed at once,
+        # the slot is released once the last chunk has been received
+        semaphore = self._member_stream_semaphore
+        await semaphore.acquire()
+
+        request = ChunkRequest(guild.id, self.loop, self._get_guild, cache=cache, stream=True)
+        request.on_done = semaphore.release
+        self._chunk_requests[request.nonce] = request
+
+        try:
+            await ws.request_chunks(
+                guild.id,
+                query=query,
+                limit=limit,
+                user_ids=user_ids,
+                presences=presences,
+                nonce=request.nonce,
+            )
+        except BaseException:
+            self.cancel_member_stream(request)
+            raise
+
+        return request
+
+    def cancel_member_stream(self, request: ChunkRequest) -> None:
+        self._chunk_requests.pop(request.nonce, None)
+        if request.on_done is not None:
+            request.on_done()
+            request.on_done = None
+
     async def _delay_ready(self) -> None:
         try:
             states = []
@@ -697,8 +824,11 @@ class ConnectionState:
                 except asyncio.TimeoutError:
                     break
                 else:
+                    future = None
                     if self._guild_needs_chunking(guild):
-                        future = await self.chunk_guild(guild, wait=False)
+                        future = self._schedule_startup_chunking(guild)
+
+                    if future is not None:
                         states.append((guild, future))
                     else:
                         if guild.unavailable is False:
@@ -708,7 +838,8 @@ class ConnectionState:
 
             for guild, future in states:
                 try:
-                    await asyncio.wait_for(future, timeout=5.0)
+                    # the scheduler keeps chunking the guild after this times out
+                    await asyncio.wait_for(asyncio.shield(future), timeout=5.0)
                 except asyncio.TimeoutError:
                     _log.warning(
                         "Shard ID %s timed out waiting for chunks for guild_id %s.",
@@ -742,6 +873,7 @@ class ConnectionState:
 
         self._ready_state = asyncio.Queue()
         self.clear(views=False, application_commands=False, modals=False)
+        self._chunk_scheduler.clear()
         self.user = ClientUser(state=self, data=data["user"])
         self.store_user(data["user"])
 
@@ -766,9 +898,11 @@ class ConnectionState:
         self.dispatch("resumed")
 
     def parse_message_create(self, data) -> None:
-        channel, _ = self._get_guild_channel(data)
+        channel, guild = self._get_guild_channel(data)
         # channel would be the correct type here
         message = Message(channel=channel, data=data, state=self)  # type: ignore
+        if guild is not None:
+            self._chunk_scheduler.on_guild_activity(guild.id)
         self.dispatch("message", message)
         if self._messages is not None:
             self._messages.append(message)
@@ -822,8 +956,8 @@ class ConnectionState:
     def parse_message_reaction_add(self, data) -> None:
         emoji = data["emoji"]
         emoji_id = utils._get_as_snowflake(emoji, "id")
-        emoji = PartialEmoji.with_state(
-            self, id=emoji_id, animated=emoji.get("animated", False), name=emoji["name"]
+        emoji = self._get_shared_partial_emoji(
+            id=emoji_id, animated=emoji.get("animated", False), name=emoji["name"]
         )
         raw = RawReactionActionEvent(data, emoji, "REACTION_ADD")
 
@@ -861,7 +995,7 @@ class ConnectionState:
     def parse_message_reaction_remove(self, data) -> None:
         emoji = data["emoji"]
         emoji_id = utils._get_as_snowflake(emoji, "id")
-        emoji = PartialEmoji.with_state(self, id=emoji_id, name=emoji["name"])
+        emoji = self._get_shared_partial_emoji(id=emoji_id, name=emoji["name"])
         raw = RawReactionActionEvent(data, emoji, "REACTION_REMOVE")
         self.dispatch("raw_reaction_remove", raw)
 
@@ -880,7 +1014,7 @@ class ConnectionState:
     def parse_message_reaction_remove_emoji(self, data) -> None:
         emoji = data["emoji"]
         emoji_id = utils._get_as_snowflake(emoji, "id")
-        emoji = PartialEmoji.with_state(self, id=emoji_id, name=emoji["name"])
+        emoji = self._get_shared_partial_emoji(id=emoji_id, name=emoji["name"])
         raw = RawReactionClearEmojiEvent(data, emoji)
         self.dispatch("raw_reaction_clear_emoji", raw)
 
@@ -895,38 +1029,51 @@ class ConnectionState:
                     self.dispatch("reaction_clear_emoji", reaction)
 
     def parse_interaction_create(self, data) -> None:
+        self._handle_interaction(data)
+
+    def _handle_interaction(
+        self, data, http_reply: Optional[_InteractionReply] = None
+    ) -> Optional[Interaction]:
         interaction_type = data["type"]
 
-        if interaction_type == 1:
-            # PING interaction should never be received
-            return
+        guild_id = utils._get_as_snowflake(data, "guild_id")
+        if guild_id is not None:
+            self._chunk_scheduler.on_guild_activity(guild_id)
 
-        elif interaction_type == 2:
+        interaction: Interaction
+        if interaction_type == 2 or interaction_type == 4:
             interaction = ApplicationCommandInteraction(data=data, state=self)
+        elif interaction_type == 3:
+            interaction = MessageInteraction(data=data, state=self)
+        elif interaction_type == 5:
+            interaction = ModalInteraction(data=data, state=self)
+        else:
+            # PING interactions are never received through the gateway
+            return None
+
+        # this has to be set before any handlers run
+        interaction._http_reply = http_reply
+
+        if interaction_type == 2:
             self.dispatch("application_command", interaction)
 
         elif interaction_type == 3:
-            interaction = MessageInteraction(data=data, state=self)
-            self._view_store.dispatch(interaction)
+            self._view_store.dispatch(interaction)  # type: ignore
             self.dispatch("message_interaction", interaction)
-            if interaction.data.component_type is ComponentType.button:
+            if interaction.data.component_type is ComponentType.button:  # type: ignore
                 self.dispatch("button_click", interaction)
-            elif interaction.data.component_type is ComponentType.select:
+            elif interaction.data.component_type is ComponentType.select:  # type: ignore
                 self.dispatch("dropdown", interaction)
 
         elif interaction_type == 4:
-            interaction = ApplicationCommandInteraction(data=data, state=self)
             self.dispatch("application_command_autocomplete", interaction)
 
         elif interaction_type == 5:
-            interaction = ModalInteraction(data=data, state=self)
-            self._modal_store.dispatch(interaction)
+            self._modal_store.dispatch(interaction)  # type: ignore
             self.dispatch("modal_submit", interaction)
 
-        else:
-            return
-
         self.dispatch("interaction", interaction)
+        return interaction
 
     def parse_presence_update(self, data) -> None:
         guild_id = utils._get_as_snowflake(data, "guild_id")
@@ -948,6 +1095,7 @@ class ConnectionState:
         old_member = Member._copy(member)
         user_update = member._presence_update(data=data, user=user)
         if user_update:
+            self._reindex_member_names(member.id)
             self.dispatch("user_update", user_update[0], user_update[1])
 
         self.dispatch("presence_update", old_member, member)
@@ -959,6 +1107,7 @@ class ConnectionState:
         ref = self._users.get(user.id)
         if ref:
             ref._update(data)
+        self._reindex_member_names(user.id)
 
     def parse_invite_create(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
@@ -1238,7 +1387,9 @@ class ConnectionState:
             old_member = Member._copy(member)
             member._update(data)
             user_update = member._update_inner_user(user)
+            guild._reindex_member(member)
             if user_update:
+                self._reindex_member_names(user_id)
                 self.dispatch("user_update", user_update[0], user_update[1])
 
             self.dispatch("member_update", old_member, member)
@@ -1249,6 +1400,7 @@ class ConnectionState:
                 # Force an update on the inner user if necessary
                 user_update = member._update_inner_user(user)
                 if user_update:
+                    self._reindex_member_names(user_id)
                     self.dispatch("user_update", user_update[0], user_update[1])
 
                 guild._add_member(member)
@@ -1306,6 +1458,7 @@ class ConnectionState:
 
     async def chunk_guild(self, guild, *, wait=True, cache=None):
         cache = cache or self.member_cache_flags.joined
+        self._chunk_scheduler.discard_deferred(guild.id)
         request = self._chunk_requests.get(guild.id)
         if request is None:
             self._chunk_requests[guild.id] = request = ChunkRequest(
@@ -1448,6 +1601,7 @@ class ConnectionState:
             if role is not None:
                 old_role = copy.copy(role)
                 role._update(role_data)
+                guild._permission_cache.clear()
                 self.dispatch("guild_role_update", old_role, role)
         else:
             _log.debug(
@@ -1530,22 +1684,35 @@ class ConnectionState:
         guild_id = int(data["guild_id"])
         guild = self._get_guild(guild_id)
         presences = data.get("presences", [])
+        nonce = data.get("nonce")
+        requests = self._get_chunk_requests(guild_id, nonce)
 
         # the guild won't be None here
-        members = [Member(guild=guild, data=member, state=self) for member in data.get("members", [])]  # type: ignore
+        if not requests or any(request.cache for _, request in requests):
+            members = [Member(guild=guild, data=member, state=self) for member in data.get("members", [])]  # type: ignore
+        else:
+            # nobody is going to cache these members, so don't keep their users around either
+            members = [self._create_uncached_member(guild, member) for member in data.get("members", [])]  # type: ignore
         _log.debug("Processed a chunk for %s members in guild ID %s.", len(members), guild_id)
 
         if presences:
-            member_dict = {str(member.id): member for member in members}
+            member_dict = {member.id: member for member in members}
             for presence in presences:
                 user = presence["user"]
-                member_id = user["id"]
-                member = member_dict.get(member_id)
+                member = member_dict.get(int(user["id"]))
                 if member is not None:
                     member._presence_update(presence, user)
 
         complete = data.get("chunk_index", 0) + 1 == data.get("chunk_count")
-        self.process_chunk_requests(guild_id, data.get("nonce"), members, complete)
+        self.process_chunk_requests(guild_id, nonce, members, complete, requests=requests)
+
+    def _create_uncached_member(self, guild: Guild, data) -> Member:
+        user_id = int(data["user"]["id"])
+        stored = user_id in self._users
+        member = Member(guild=guild, data=data, state=self)
+        if not stored and self._users.pop(user_id, None) is not None:
+            member._user._stored = False
+        return member
 
     def parse_guild_integrations_update(self, data) -> None:
         guild = self._get_guild(int(data["guild_id"]))
@@ -1738,17 +1905,26 @@ class ConnectionState:
             return channel.guild.get_member(user_id)
         return self.get_user(user_id)
 
+    def _get_shared_partial_emoji(
+        self, *, name: str, animated: bool = False, id: Optional[int] = None
+    ) -> PartialEmoji:
+        # partial emojis are shared between reactions, they must not be modified
+        return self._partial_emoji_pool.get(
+            (id, name, animated),
+            lambda: PartialEmoji.with_state(self, id=id, animated=animated, name=name),
+        )
+
     def get_reaction_emoji(self, data) -> Union[Emoji, PartialEmoji]:
         emoji_id = utils._get_as_snowflake(data, "id")
 
         if not emoji_id:
-            return data["name"]
+            return sys.intern(data["name"])
 
         try:
             return self._emojis[emoji_id]
         except KeyError:
-            return PartialEmoji.with_state(
-                self, animated=data.get("animated", False), id=emoji_id, name=data["name"]
+            return self._get_shared_partial_emoji(
+                animated=data.get("animated", False), id=emoji_id, name=data["name"]
             )
 
     def _upgrade_partial_emoji(self, emoji: PartialEmoji) -> Union[Emoji, PartialEmoji, str]:
@@ -1768,7 +1944,16 @@ class ConnectionState:
         if pm is not None:
             return pm
 
+        guild_id = self._lazy_guild_channels.get(id)
+        if guild_id is not None:
+            guild = self._guilds.get(guild_id)
+            if guild is not None:
+                return guild._resolve_channel(id)
+
         for guild in self.guilds:
+            # avoid materializing guilds, the channel isn't in any of them
+            if guild._lazy_data is not None:
+                continue
             channel = guild._resolve_channel(id)
             if channel is not None:
                 return channel
@@ -1953,8 +2138,6 @@ class AutoShardedConnectionState(ConnectionState):
     async def _delay_ready(self) -> None:
         await self.shards_launched.wait()
         processed = []
-        max_concurrency = len(self.shard_ids) * 2
-        current_bucket = []
         while True:
             # this snippet of code is basically waiting N seconds
             # until the last GUILD_CREATE was sent
@@ -1965,27 +2148,20 @@ class AutoShardedConnectionState(ConnectionState):
             except asyncio.TimeoutError:
                 break
             else:
+                future = None
                 if self._guild_needs_chunking(guild):
-                    _log.debug(
-                        "Guild ID %d requires chunking, will be done in the background.", guild.id
-                    )
-                    if len(current_bucket) >= max_concurrency:
-                        try:
-                            await utils.sane_wait_for(
-                                current_bucket, timeout=max_concurrency * 70.0
-                            )
-                        except asyncio.TimeoutError:
-                            fmt = "Shard ID %s failed to wait for chunks from a sub-bucket with length %d"
-                            _log.warning(fmt, guild.shard_id, len(current_bucket))
-                        finally:
-                            current_bucket = []
-
-                    # Chunk the guild in the background while we wait for GUILD_CREATE streaming
-                    future = asyncio.ensure_future(self.chunk_guild(guild))
-                    current_bucket.append(future)
-                else:
+                    # Chunk the guild in the background while we wait for GUILD_CREATE streaming,
+                    # the requests are pipelined per shard by the chunk scheduler
+                    future = self._schedule_startup_chunking(guild)
+                    if future is not None:
+                        _log.debug(
+                            "Guild ID %d requires chunking, will be done in the background.",
+                            guild.id,
+                        )
+
+                if future is None:
                     future = self.loop.create_future()
-                    future.set_result([])
+                    future.set_result(None)
 
                 processed.append((guild, future))
 
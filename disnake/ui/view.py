@@ -61,7 +61,7 @@ __all__ = ("View",)
 
 
 if TYPE_CHECKING:
-    from ..interactions import MessageInteraction
+    from ..interactions import AutoDefer, MessageInteraction
     from ..message import Message
     from ..state import ConnectionState
     from ..types.components import Component as ComponentPayload
@@ -140,12 +140,22 @@ class View:
     timeout: Optional[:class:`float`]
         Timeout in seconds from last interaction with the UI before no longer accepting input.
         If ``None`` then there is no timeout.
+    auto_defer: Optional[:class:`disnake.AutoDefer`]
+        The policy used to defer interactions with the view automatically if the
+        :meth:`interaction_check` or the callback of an item is too slow to respond in time.
+        If ``None`` then interactions are never deferred automatically.
+
+        .. versionadded:: 2.4
 
     Attributes
     ------------
     timeout: Optional[:class:`float`]
         Timeout from last interaction with the UI before no longer accepting input.
         If ``None`` then there is no timeout.
+    auto_defer: Optional[:class:`disnake.AutoDefer`]
+        The policy used to defer interactions with the view automatically.
+
+        .. versionadded:: 2.4
     children: List[:class:`Item`]
         The list of children attached to this view.
     """
@@ -165,8 +175,9 @@ class View:
 
         cls.__view_children_items__ = children
 
-    def __init__(self, *, timeout: Optional[float] = 180.0):
+    def __init__(self, *, timeout: Optional[float] = 180.0, auto_defer: Optional[AutoDefer] = None):
         self.timeout = timeout
+        self.auto_defer: Optional[AutoDefer] = auto_defer
         self.children: List[Item] = []
         for func in self.__view_children_items__:
             item: Item = func.__discord_ui_model_type__(**func.__discord_ui_model_kwargs__)
@@ -361,6 +372,9 @@ class View:
         traceback.print_exception(error.__class__, error, error.__traceback__, file=sys.stderr)
 
     async def _scheduled_task(self, item: Item, interaction: MessageInteraction):
+        from ..interactions.auto_defer import _AckTracker
+
+        tracker = _AckTracker(interaction, self.auto_defer)
         try:
             if self.timeout:
                 self.__timeout_expiry = time.monotonic() + self.timeout
@@ -372,6 +386,8 @@ class View:
             await item.callback(interaction)
         except Exception as e:
             return await self.on_error(e, item, interaction)
+        finally:
+            tracker.finish()
 
     def _start_listening_from_store(self, store: ViewStore) -> None:
         self.__cancel_callback = partial(store.remove_view)
@@ -25,6 +25,7 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar, Union
 
 import disnake.abc
@@ -112,7 +113,8 @@ class BaseUser(_UserTag):
     def _update(self, data: Union[UserPayload, PartialUserPayload]) -> None:
         self.name = data["username"]
         self.id = int(data["id"])
-        self.discriminator = data["discriminator"]
+        # discriminators are shared by a lot of users
+        self.discriminator = sys.intern(data["discriminator"])
         self._avatar = data["avatar"]
         self._banner = data.get("banner", None)
         self._accent_colour = data.get("accent_color", None)
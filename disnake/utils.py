@@ -672,6 +672,60 @@ class SnowflakeList(array.array):
         return i != len(self) and self[i] == element
 
 
+class _InternPool(Generic[T]):
+    """Internal bounded pool used to share equal immutable values between cached objects.
+
+    Values are looked up by a hashable key and only created once per key.
+    When the pool reaches ``max_size`` entries it is cleared, values that have
+    already been handed out remain valid.
+    """
+
+    __slots__ = ("_values", "max_size")
+
+    def __init__(self, max_size: int) -> None:
+        self._values: Dict[Any, T] = {}
+        self.max_size: int = max_size
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: Any, factory: Callable[[], T]) -> T:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        if len(self._values) >= self.max_size:
+            self._values.clear()
+
+        self._values[key] = value = factory()
+        return value
+
+    def intern(self, value: T) -> T:
+        # the value itself is used as the key, so it must be hashable
+        return self.get(value, lambda: value)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+_snowflake_list_pool: _InternPool[SnowflakeList] = _InternPool(max_size=65536)
+_int_pool: _InternPool[int] = _InternPool(max_size=65536)
+
+
+def _get_shared_snowflake_list(data: Iterable[int]) -> SnowflakeList:
+    # the returned list is shared between several objects and must not be modified
+    key = tuple(sorted(data))
+    return _snowflake_list_pool.get(key, lambda: SnowflakeList(key, is_sorted=True))
+
+
+def _intern_int(value: int) -> int:
+    # small ints are already cached by the interpreter
+    if -5 <= value <= 256:
+        return value
+    return _int_pool.intern(value)
+
+
 _IS_ASCII = re.compile(r"^[\x00-\x7f]+$")
 
 
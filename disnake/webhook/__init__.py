@@ -10,4 +10,5 @@ Webhook support
 """
 
 from .async_ import *
+from .batcher import *
 from .sync import *
@@ -50,7 +50,14 @@ from ..asset import Asset
 from ..channel import PartialMessageable
 from ..enums import WebhookType, try_enum
 from ..errors import DiscordServerError, Forbidden, HTTPException, InvalidArgument, NotFound
-from ..http import Route, set_attachments, to_multipart, to_multipart_with_attachments
+from ..http import (
+    RateLimiter,
+    Route,
+    _rate_limiter,
+    set_attachments,
+    to_multipart,
+    to_multipart_with_attachments,
+)
 from ..message import Message
 from ..mixins import Hashable
 from ..ui.action_row import components_to_dict
@@ -85,27 +92,10 @@ if TYPE_CHECKING:
 MISSING = utils.MISSING
 
 
-class AsyncDeferredLock:
-    def __init__(self, lock: asyncio.Lock):
-        self.lock = lock
-        self.delta: Optional[float] = None
-
-    async def __aenter__(self):
-        await self.lock.acquire()
-        return self
-
-    def delay_by(self, delta: float) -> None:
-        self.delta = delta
-
-    async def __aexit__(self, type, value, traceback):
-        if self.delta:
-            await asyncio.sleep(self.delta)
-        self.lock.release()
-
-
 class AsyncWebhookAdapter:
     def __init__(self):
-        self._locks: Dict[Any, asyncio.Lock] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._rate_limiter: RateLimiter = _rate_limiter
 
     async def request(
         self,
@@ -122,7 +112,8 @@ class AsyncWebhookAdapter:
         headers: Dict[str, str] = {}
         files = files or []
         to_send: Optional[Union[str, aiohttp.FormData]] = None
-        bucket = (route.webhook_id, route.webhook_token)
+        rate_limiter = self._rate_limiter
+        bucket = rate_limiter.get_key(route, auth_token)
 
         try:
             lock = self._locks[bucket]
@@ -145,8 +136,12 @@ class AsyncWebhookAdapter:
         url = route.url
         webhook_id = route.webhook_id
 
-        async with AsyncDeferredLock(lock) as lock:
+        async with lock:
             for attempt in range(5):
+                delay = rate_limiter.get_delay(route, bucket, auth_token)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
                 for file in files:
                     file.reset(seek=attempt)
 
@@ -178,15 +173,13 @@ class AsyncWebhookAdapter:
                         if data and response.headers["Content-Type"] == "application/json":
                             data = utils._from_json(data)
 
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status != 429:
-                            delta = utils._parse_ratelimit_header(response)
+                        delta = rate_limiter.update(route, auth_token, response)
+                        if delta is not None and response.status != 429:
                             _log.debug(
                                 "Webhook ID %s has been pre-emptively rate limited, waiting %.2f seconds",
                                 webhook_id,
                                 delta,
                             )
-                            lock.delay_by(delta)
 
                         if 300 > response.status >= 200:
                             return data
@@ -201,7 +194,10 @@ class AsyncWebhookAdapter:
                                 webhook_id,
                                 retry_after,
                             )
-                            await asyncio.sleep(retry_after)
+                            if data.get("global", False):  # type: ignore
+                                rate_limiter.limit_global(auth_token, retry_after)
+                            else:
+                                rate_limiter.limit_bucket(bucket, retry_after)
                             continue
 
                         if response.status >= 500:
@@ -397,13 +393,16 @@ class AsyncWebhookAdapter:
         type: int,
         data: Optional[Dict[str, Any]] = None,
         files: Optional[List[File]] = None,
-    ) -> Response[None]:
+        with_response: bool = False,
+    ) -> Response[Optional[Dict[str, Any]]]:
         route = Route(
             "POST",
             "/interactions/{webhook_id}/{webhook_token}/callback",
             webhook_id=interaction_id,
             webhook_token=token,
         )
+        # returns the created resource (e.g. the message) instead of an empty response
+        params = {"with_response": "true"} if with_response else None
 
         payload: Dict[str, Any] = {
             "type": type,
@@ -416,8 +415,10 @@ class AsyncWebhookAdapter:
 
         if files:
             multipart = to_multipart(payload, files)
-            return self.request(route, session=session, multipart=multipart, files=files)
-        return self.request(route, session=session, payload=payload)
+            return self.request(
+                route, session=session, multipart=multipart, files=files, params=params
+            )
+        return self.request(route, session=session, payload=payload, params=params)
 
     def get_original_interaction_response(
         self,
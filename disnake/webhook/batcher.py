@@ -0,0 +1,456 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021-present Disnake Development
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, List, Optional, Tuple, TypeVar
+
+from .. import utils
+from ..errors import HTTPException, InvalidArgument
+
+if TYPE_CHECKING:
+    from ..abc import Snowflake
+    from ..embeds import Embed
+    from ..mentions import AllowedMentions
+    from .async_ import Webhook
+
+    WB = TypeVar("WB", bound="WebhookBatcher")
+
+__all__ = ("WebhookBatcher",)
+
+_log = logging.getLogger(__name__)
+
+MISSING = utils.MISSING
+
+# the limits of a single message
+_MAX_CONTENT_LENGTH = 2000
+_MAX_EMBEDS = 10
+_MAX_EMBED_SIZE = 6000
+
+
+class _QueuedMessage:
+    __slots__ = ("content", "embeds", "embed_size", "queued_at")
+
+    def __init__(self, content: Optional[str], embeds: List[Embed], queued_at: float) -> None:
+        self.content: Optional[str] = content
+        self.embeds: List[Embed] = embeds
+        self.embed_size: int = sum(len(embed) for embed in embeds)
+        self.queued_at: float = queued_at
+
+    @property
+    def content_length(self) -> int:
+        # including the newline it is joined with
+        return 0 if self.content is None else len(self.content) + 1
+
+
+class WebhookBatcher:
+    """Sends messages through a :class:`Webhook` in batches, which is useful for
+    high-volume logging where sending every message separately would quickly
+    exhaust the rate limit of the webhook.
+
+    Queued messages are combined into as few requests as possible, with their
+    contents joined by newlines, up to 2000 characters and 10 embeds per request.
+    A batch is sent once it is full or once the oldest message in it has been queued
+    for :attr:`flush_interval` seconds. While the webhook is rate limited, messages
+    accumulate in the queue and are sent in larger batches afterwards, so the
+    throughput is bounded by the rate limit rather than the number of messages.
+
+    The queue is bounded by ``max_queued``. If it is full, :meth:`send` waits until
+    there's space available, while :meth:`send_nowait` drops the message instead.
+
+    This can be used as an asynchronous context manager, which calls :meth:`close` on exit.
+
+    .. versionadded:: 2.4
+
+    Example
+    -------
+
+    .. code-block:: python3
+
+        batcher = disnake.WebhookBatcher(webhook, flush_interval=5)
+
+        @bot.event
+        async def on_member_join(member):
+            batcher.send_nowait(f"{member} joined {member.guild}")
+
+    Parameters
+    ----------
+    webhook: :class:`Webhook`
+        The webhook to send the messages with.
+    flush_interval: :class:`float`
+        The maximum number of seconds a message waits for other messages
+        to be batched with. Defaults to ``2``.
+    max_queued: :class:`int`
+        The maximum number of queued messages. Defaults to ``1000``.
+    username: :class:`str`
+        The username to send the messages with.
+    avatar_url: :class:`str`
+        The avatar URL to send the messages with.
+    allowed_mentions: :class:`AllowedMentions`
+        Controls the mentions being processed in the messages.
+    thread: :class:`~disnake.abc.Snowflake`
+        The thread to send the messages to.
+
+    Attributes
+    ----------
+    webhook: :class:`Webhook`
+        The webhook the messages are sent with.
+    flush_interval: :class:`float`
+        The maximum number of seconds a message waits for other messages.
+    max_queued: :class:`int`
+        The maximum number of queued messages.
+    sent: :class:`int`
+        The number of messages that were sent successfully.
+    requests: :class:`int`
+        The number of requests that were made to send the messages.
+    dropped: :class:`int`
+        The number of messages that were dropped by :meth:`send_nowait`
+        because the queue was full.
+    failed: :class:`int`
+        The number of messages that couldn't be sent because the request failed.
+    """
+
+    def __init__(
+        self,
+        webhook: Webhook,
+        *,
+        flush_interval: float = 2.0,
+        max_queued: int = 1000,
+        username: str = MISSING,
+        avatar_url: Any = MISSING,
+        allowed_mentions: AllowedMentions = MISSING,
+        thread: Snowflake = MISSING,
+    ) -> None:
+        if flush_interval < 0:
+            raise ValueError("flush_interval must not be negative")
+        if max_queued <= 0:
+            raise ValueError("max_queued must be greater than 0")
+
+        self.webhook: Webhook = webhook
+        self.flush_interval: float = flush_interval
+        self.max_queued: int = max_queued
+        self.sent: int = 0
+        self.requests: int = 0
+        self.dropped: int = 0
+        self.failed: int = 0
+
+        self._username: str = username
+        self._avatar_url: Any = avatar_url
+        self._allowed_mentions: AllowedMentions = allowed_mentions
+        self._thread: Snowflake = thread
+
+        self._queue: Deque[_QueuedMessage] = deque()
+        # the totals of the queued messages, to know whether a batch is full
+        self._content_length: int = 0
+        self._embed_count: int = 0
+        self._embed_size: int = 0
+        # the number of callers of `flush` that are waiting
+        self._flushing: int = 0
+        self._closed: bool = False
+
+        self._task: Optional[asyncio.Task[None]] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        # set once all queued messages were sent, i.e. not while a batch is being sent
+        self._drained: Optional[asyncio.Event] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"<WebhookBatcher webhook={self.webhook!r} queued={self.queued} "
+            f"sent={self.sent} dropped={self.dropped}>"
+        )
+
+    async def __aenter__(self: WB) -> WB:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def queued(self) -> int:
+        """:class:`int`: The number of messages that are waiting to be sent."""
+        return len(self._queue)
+
+    def is_closed(self) -> bool:
+        """Whether the batcher is closed.
+
+        :return type: :class:`bool`
+        """
+        return self._closed
+
+    def _start(self) -> None:
+        if self._task is not None:
+            return
+        # created here so the batcher can be constructed outside of the event loop
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._task = asyncio.create_task(self._run(), name="disnake: webhook_batcher")
+
+    def _prepare(self, content: Optional[str], embed: Embed, embeds: List[Embed]) -> _QueuedMessage:
+        if self._closed:
+            raise RuntimeError("The batcher is closed")
+        if embed is not MISSING and embeds is not MISSING:
+            raise TypeError("Cannot mix embed and embeds keyword arguments.")
+
+        if embed is not MISSING:
+            embeds = [embed]
+        elif embeds is MISSING:
+            embeds = []
+        if content is not None:
+            content = str(content)
+
+        if not content and not embeds:
+            raise InvalidArgument("Either content or embeds must be provided.")
+        if content is not None and len(content) > _MAX_CONTENT_LENGTH:
+            raise InvalidArgument(f"content has a maximum of {_MAX_CONTENT_LENGTH} characters.")
+        if len(embeds) > _MAX_EMBEDS:
+            raise InvalidArgument(f"embeds has a maximum of {_MAX_EMBEDS} elements.")
+
+        message = _QueuedMessage(content or None, embeds, asyncio.get_running_loop().time())
+        if message.embed_size > _MAX_EMBED_SIZE:
+            raise InvalidArgument(
+                f"embeds have a maximum of {_MAX_EMBED_SIZE} characters in total."
+            )
+        return message
+
+    def _enqueue(self, message: _QueuedMessage) -> None:
+        self._queue.append(message)
+        self._content_length += message.content_length
+        self._embed_count += len(message.embeds)
+        self._embed_size += message.embed_size
+
+        self._drained.clear()  # type: ignore
+        if len(self._queue) >= self.max_queued:
+            self._space.clear()  # type: ignore
+        self._wakeup.set()  # type: ignore
+
+    def send_nowait(
+        self,
+        content: Optional[str] = None,
+        *,
+        embed: Embed = MISSING,
+        embeds: List[Embed] = MISSING,
+    ) -> bool:
+        """Queues a message without waiting. If the queue is full, the message is dropped.
+
+        Parameters
+        ----------
+        content: Optional[:class:`str`]
+            The content of the message. This is combined with other messages,
+            and must be at most 2000 characters long.
+        embed: :class:`Embed`
+            The embed of the message. This cannot be mixed with the ``embeds`` parameter.
+        embeds: List[:class:`Embed`]
+            The embeds of the message, with a maximum of 10.
+            This cannot be mixed with the ``embed`` parameter.
+
+        Raises
+        ------
+        RuntimeError
+            The batcher is closed.
+        TypeError
+            You specified both ``embed`` and ``embeds``.
+        InvalidArgument
+            The message is empty or exceeds the limits of a single message.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the message was queued.
+        """
+        message = self._prepare(content, embed, embeds)
+        self._start()
+        if len(self._queue) >= self.max_queued:
+            self.dropped += 1
+            return False
+        self._enqueue(message)
+        return True
+
+    async def send(
+        self,
+        content: Optional[str] = None,
+        *,
+        embed: Embed = MISSING,
+        embeds: List[Embed] = MISSING,
+    ) -> None:
+        """|coro|
+
+        Queues a message. If the queue is full, this waits until there's space available.
+
+        This returns once the message is queued, not once it is sent.
+
+        Parameters
+        ----------
+        content: Optional[:class:`str`]
+            The content of the message. This is combined with other messages,
+            and must be at most 2000 characters long.
+        embed: :class:`Embed`
+            The embed of the message. This cannot be mixed with the ``embeds`` parameter.
+        embeds: List[:class:`Embed`]
+            The embeds of the message, with a maximum of 10.
+            This cannot be mixed with the ``embed`` parameter.
+
+        Raises
+        ------
+        RuntimeError
+            The batcher is closed.
+        TypeError
+            You specified both ``embed`` and ``embeds``.
+        InvalidArgument
+            The message is empty or exceeds the limits of a single message.
+        """
+        message = self._prepare(content, embed, embeds)
+        self._start()
+        while len(self._queue) >= self.max_queued:
+            await self._space.wait()  # type: ignore
+            if self._closed:
+                raise RuntimeError("The batcher is closed")
+        self._enqueue(message)
+
+    async def flush(self) -> None:
+        """|coro|
+
+        Sends all queued messages without waiting for the flush interval,
+        and waits until they are sent.
+        """
+        # the queue may be empty while the last batch is still being sent
+        if self._task is None or self._drained.is_set():  # type: ignore
+            return
+        self._flushing += 1
+        try:
+            self._wakeup.set()  # type: ignore
+            await self._drained.wait()  # type: ignore
+        finally:
+            self._flushing -= 1
+
+    async def close(self) -> None:
+        """|coro|
+
+        Sends all queued messages and stops the batcher.
+        Messages can't be queued afterwards.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._task is None:
+            return
+        self._wakeup.set()  # type: ignore
+        await self._task
+        # wake up senders that were waiting for space
+        self._space.set()  # type: ignore
+
+    def _batch_full(self) -> bool:
+        # whether the queued messages exceed the limits of a single request
+        return (
+            self._content_length - 1 >= _MAX_CONTENT_LENGTH
+            or self._embed_count >= _MAX_EMBEDS
+            or self._embed_size >= _MAX_EMBED_SIZE
+        )
+
+    def _take_batch(self) -> Tuple[Optional[str], List[Embed], int]:
+        queue = self._queue
+        contents: List[str] = []
+        embeds: List[Embed] = []
+        content_length = embed_size = count = 0
+        while queue:
+            message = queue[0]
+            if count and (
+                content_length + message.content_length - 1 > _MAX_CONTENT_LENGTH
+                or len(embeds) + len(message.embeds) > _MAX_EMBEDS
+                or embed_size + message.embed_size > _MAX_EMBED_SIZE
+            ):
+                break
+
+            queue.popleft()
+            count += 1
+            if message.content is not None:
+                contents.append(message.content)
+            embeds.extend(message.embeds)
+            content_length += message.content_length
+            embed_size += message.embed_size
+
+        self._content_length -= content_length
+        self._embed_count -= len(embeds)
+        self._embed_size -= embed_size
+        if len(queue) < self.max_queued:
+            self._space.set()  # type: ignore
+        return "\n".join(contents) if contents else None, embeds, count
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        wakeup: asyncio.Event = self._wakeup  # type: ignore
+
+        while True:
+            if not self._queue:
+                self._drained.set()  # type: ignore
+                if self._closed:
+                    return
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+
+            # wait for more messages until the batch is full or the oldest message is due
+            deadline = self._queue[0].queued_at + self.flush_interval
+            while not (self._closed or self._flushing or self._batch_full()):
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                wakeup.clear()
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+            content, embeds, count = self._take_batch()
+            await self._send_batch(content, embeds, count)
+
+    async def _send_batch(self, content: Optional[str], embeds: List[Embed], count: int) -> None:
+        self.requests += 1
+        try:
+            await self.webhook.send(
+                content if content is not None else MISSING,
+                embeds=embeds if embeds else MISSING,
+                username=self._username,
+                avatar_url=self._avatar_url,
+                allowed_mentions=self._allowed_mentions,
+                thread=self._thread,
+            )
+        except HTTPException as e:
+            self.failed += count
+            _log.error(
+                "Failed to send %s batched messages with webhook %s: %s", count, self.webhook.id, e
+            )
+        except Exception:
+            self.failed += count
+            _log.exception(
+                "Failed to send %s batched messages with webhook %s", count, self.webhook.id
+            )
+        else:
+            self.sent += count
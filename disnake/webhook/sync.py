@@ -41,7 +41,7 @@ from urllib.parse import quote as urlquote
 from .. import utils
 from ..channel import PartialMessageable
 from ..errors import DiscordServerError, Forbidden, HTTPException, InvalidArgument, NotFound
-from ..http import Route
+from ..http import RateLimiter, Route, _rate_limiter
 from ..message import Message
 from .async_ import BaseWebhook, _WebhookState, handle_message_parameters
 
@@ -68,27 +68,10 @@ if TYPE_CHECKING:
 MISSING = utils.MISSING
 
 
-class DeferredLock:
-    def __init__(self, lock: threading.Lock):
-        self.lock = lock
-        self.delta: Optional[float] = None
-
-    def __enter__(self):
-        self.lock.acquire()
-        return self
-
-    def delay_by(self, delta: float) -> None:
-        self.delta = delta
-
-    def __exit__(self, type, value, traceback):
-        if self.delta:
-            time.sleep(self.delta)
-        self.lock.release()
-
-
 class WebhookAdapter:
     def __init__(self):
-        self._locks: Dict[Any, threading.Lock] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._rate_limiter: RateLimiter = _rate_limiter
 
     def request(
         self,
@@ -105,7 +88,8 @@ class WebhookAdapter:
         headers: Dict[str, str] = {}
         files = files or []
         to_send: Optional[Union[str, Dict[str, Any]]] = None
-        bucket = (route.webhook_id, route.webhook_token)
+        rate_limiter = self._rate_limiter
+        bucket = rate_limiter.get_key(route, auth_token)
 
         try:
             lock = self._locks[bucket]
@@ -129,8 +113,12 @@ class WebhookAdapter:
         url = route.url
         webhook_id = route.webhook_id
 
-        with DeferredLock(lock) as lock:
+        with lock:
             for attempt in range(5):
+                delay = rate_limiter.get_delay(route, bucket, auth_token)
+                if delay > 0:
+                    time.sleep(delay)
+
                 for file in files:
                     file.reset(seek=attempt)
 
@@ -162,15 +150,13 @@ class WebhookAdapter:
                         if data and response.headers["Content-Type"] == "application/json":
                             data = utils._from_json(data)
 
-                        remaining = response.headers.get("X-Ratelimit-Remaining")
-                        if remaining == "0" and response.status_code != 429:
-                            delta = utils._parse_ratelimit_header(response)
+                        delta = rate_limiter.update(route, auth_token, response)
+                        if delta is not None and response.status_code != 429:
                             _log.debug(
                                 "Webhook ID %s has been pre-emptively rate limited, waiting %.2f seconds",
                                 webhook_id,
                                 delta,
                             )
-                            lock.delay_by(delta)
 
                         if 300 > response.status_code >= 200:
                             return data
@@ -185,7 +171,10 @@ class WebhookAdapter:
                                 webhook_id,
                                 retry_after,
                             )
-                            time.sleep(retry_after)
+                            if data.get("global", False):  # type: ignore
+                                rate_limiter.limit_global(auth_token, retry_after)
+                            else:
+                                rate_limiter.limit_bucket(bucket, retry_after)
                             continue
 
                         if response.status_code >= 500: